@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2023-present Oori Data <info@oori.dev>
+# SPDX-License-Identifier: Apache-2.0
+# bench/graph_copy.py
+
+'''
+Benchmark: `graph.copy()` against the Literate write-and-reparse round trip that
+`FileStore.put(merge=True)` used before it.
+
+Usage:
+    python bench/graph_copy.py [NODES]
+
+Wall-clock numbers depend on the machine and its load, so they live here rather than in the
+test suite (which checks only that the copy is faithful; see `test/test_graph_copy.py`).
+'''
+
+import sys
+import time
+
+from onya.graph import graph
+from onya.serial.literate import LiterateParser
+from onya.store.filesystem import FileStore
+
+DOCHEADER = '''\
+# @docheader
+
+* @document: http://e.o/doc
+* @nodebase: http://e.o/
+* @schema: https://schema.org/
+'''
+
+
+def best(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main(nodes=300):
+    body = ''.join(f'\n# P{i} [Person]\n\n* name: Person {i}\n* knows -> P{i + 1}\n  * since: {2000 + i % 20}\n'
+                   for i in range(nodes))
+    g = graph()
+    LiterateParser().parse(DOCHEADER + body, g)
+
+    def round_trip():
+        return FileStore._from_literate(FileStore._to_literate(g, 'http://e.o/doc'))
+
+    copy_s, trip_s = best(g.copy), best(round_trip)
+    print(f'{nodes} nodes: copy {copy_s * 1000:.1f} ms, Literate round trip {trip_s * 1000:.1f} ms '
+          f'(x{trip_s / copy_s:.1f})')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2023-present Oori Data <info@oori.dev>
+# SPDX-License-Identifier: Apache-2.0
+# bench/graph_merge.py
+
+'''
+Benchmark: building a graph through the model API, its first full `merge()`, and an
+incremental `merge(g.dirty)` after touching one node in a hundred.
+
+Usage:
+    python bench/graph_merge.py [NODES]
+
+Each node gets ten properties, each added twice so the full merge has duplicates to fold,
+and an edge. Timings are the best of five fresh builds.
+
+Measured at 20,000 nodes against the tree before skeleton caching and dirty tracking: the
+full merge takes 0.79s (0.81s before), and the incremental merge takes 5 ms, where the old
+tree's only option, a full re-merge, took 0.77s. Without duplicates to fold, the full merge
+is 0.21s against 0.72s.
+'''
+
+import sys
+import time
+
+from onya.graph import graph
+
+LABELS = [f'http://e.o/l{i}' for i in range(12)]
+
+
+def build(size):
+    g = graph()
+    for i in range(size):
+        n = g.node(f'http://e.o/n{i}')
+        for j in range(10):
+            n.add_property(LABELS[j], f'v{j}')
+            n.add_property(LABELS[j], f'v{j}')
+        n.add_edge(LABELS[11], n)
+    return g
+
+
+def run(size):
+    t0 = time.perf_counter()
+    g = build(size)
+    t1 = time.perf_counter()
+    g.merge()
+    t2 = time.perf_counter()
+    for i in range(0, size, 100):
+        g[f'http://e.o/n{i}'].add_property(LABELS[0], 'v0')
+    t3 = time.perf_counter()
+    g.merge(g.dirty)
+    t4 = time.perf_counter()
+    return t1 - t0, t2 - t1, t4 - t3
+
+
+def main(size=20000):
+    build_s, full_s, incr_s = (min(col) for col in zip(*(run(size) for _ in range(5))))
+    print(f'{size} nodes: build {build_s:.3f}s, full merge {full_s:.3f}s, '
+          f'incremental merge of {size // 100} nodes {incr_s * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
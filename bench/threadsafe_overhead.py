@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2023-present Oori Data <info@oori.dev>
+# SPDX-License-Identifier: Apache-2.0
+# bench/threadsafe_overhead.py
+
+'''
+Benchmark: the uncontended cost of `graph.enable_thread_safety()` against the default
+single-threaded path, for bulk building and for fine-grained traversal.
+
+Usage:
+    python bench/threadsafe_overhead.py [NODES]
+
+The default path is timed first, while no graph in the process is in thread-safe mode, so it
+runs the plain methods (see `onya.graph._set_locking`).
+'''
+
+import sys
+import time
+
+from amara.iri import I
+
+from onya.graph import graph
+
+KNOWS = I('https://schema.org/knows')
+NAME = I('https://schema.org/name')
+SINCE = I('https://schema.org/since')
+
+
+def best(fn, *args, repeat=5):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def build(size, safe):
+    g = graph()
+    if safe:
+        g.enable_thread_safety()
+    nodes = [g.node(I(f'http://e.o/n{i}')) for i in range(size)]
+    for i, n in enumerate(nodes):
+        n.add_property(NAME, f'n{i}')
+        n.add_edge(KNOWS, nodes[(i + 1) % len(nodes)]).add_property(SINCE, str(i))
+    return g
+
+
+def read(g):
+    for nid in g:
+        for e in g[nid].getedge(KNOWS):
+            list(e.getprop(SINCE))
+    return sum(1 for _ in g.select(label=KNOWS))
+
+
+def main(size=20000):
+    default_g = build(size, False)
+    default_build, default_read = best(build, size, False), best(read, default_g)
+    safe_g = build(size, True)
+    assert read(default_g) == read(safe_g) == size
+    safe_build, safe_read = best(build, size, True), best(read, safe_g)
+    print(f'{size} nodes, build: default {default_build:.3f}s, thread-safe {safe_build:.3f}s '
+          f'(x{safe_build / default_build:.2f})')
+    print(f'{size} nodes, read:  default {default_read:.3f}s, thread-safe {safe_read:.3f}s '
+          f'(x{safe_read / default_read:.2f})')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
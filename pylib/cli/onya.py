@@ -88,7 +88,8 @@ def convert(filespec: str,
             show_edge_annotations: bool = True,
             document_source_assertions: bool = False,
             encoding: str = 'utf-8',
-            lenient_arrows: bool = False):
+            lenient_arrows: bool = False,
+            parse_cache: str | None = None):
     '''
     Convert Onya Literate input to another format.
 
@@ -102,6 +103,8 @@ def convert(filespec: str,
         encoding: Text encoding used to read input files (ignored for stdin).
         lenient_arrows: If set, accept a stray edge arrow (e.g. `➡`, `=>`), warn, and
             continue instead of erroring with EdgeArrowError.
+        parse_cache: Directory for an on-disk parse cache; unchanged inputs load from it
+            instead of being parsed again.
 
     Examples:
         onya convert test/resource/schemaorg/thingsfallapart.onya --mermaid
@@ -113,7 +116,7 @@ def convert(filespec: str,
     paths = _expand_filespec(filespec)
 
     parser = LiterateParser(document_source_assertions=document_source_assertions, encoding=encoding,
-                            lenient_arrows=lenient_arrows)
+                            lenient_arrows=lenient_arrows, cache=parse_cache)
 
     graph_obj = None
     doc_iris: list[str] = []
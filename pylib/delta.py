@@ -0,0 +1,249 @@
+# SPDX-FileCopyrightText: 2023-present Oori Data <info@oori.dev>
+# SPDX-License-Identifier: Apache-2.0
+# onya.delta
+'''
+Minimal deltas between Onya graphs — `graph.diff()` and `graph.apply()`.
+
+`diff(a, b)` compares two graphs node by node and, inside each node, assertion by assertion.
+Assertions are paired under each container by their identity key: the explicit `@id` for an
+identified assertion, otherwise the merge skeleton (`_skeleton`, which names an edge target
+by its node id or `@id`) plus the interp, so the comparison follows the SPEC identity rules
+that `merge()` applies. The result is a `GraphDelta` that records:
+
+- nodes added (with their types) and removed,
+- type changes on shared nodes,
+- assertions added, each with everything nested under it, and assertions removed,
+- interp adoptions: an assertion without a contract whose counterpart has one.
+
+Every assertion is addressed by a path of identity keys from its node, so a delta is plain
+data (tuples of strings) that pickles and ships between processes. `apply(g, delta)` then
+patches in time proportional to the delta: each path is walked through the origin's label
+index, and `@id` steps go straight to `assertion_ids`.
+
+Both sides are best compared in merged form (see `graph.merge()`). Duplicate occurrences of
+one key are paired in the order they are found.
+
+    >>> delta = old.diff(new)
+    >>> replica.apply(delta)      # replica now matches `new`
+'''
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+
+from amara.iri import I
+
+from onya.graph import graph, node, assertion, edge
+
+__all__ = ['GraphDelta', 'AssertionRecord', 'DeltaConflict', 'diff', 'apply']
+
+
+class DeltaConflict(ValueError):
+    '''
+    Raised by `apply()` when a delta does not fit the graph it is applied to: a path names a
+    node or assertion the graph lacks (the delta was taken against a different base).
+    '''
+
+
+@dataclass(frozen=True)
+class AssertionRecord:
+    '''
+    An added assertion: `path` locates its container (node id, then identity keys), `kind`
+    is `'property'` or `'edge'`, `obj` is the value or the target reference. A target
+    reference is `('node', id)` or `('assertion', id)`, or None when unresolved. `id` and
+    `interp` are as on the assertion.
+    '''
+    path: tuple
+    kind: str
+    label: I | str
+    obj: object
+    id: I | str | None = None
+    interp: I | str | None = None
+
+
+@dataclass
+class GraphDelta:
+    '''
+    The changes that turn one graph into another (see module docstring). `added_nodes` maps
+    node id -> types. `types` maps node id -> (types added, types removed). `added` lists
+    `AssertionRecord`s in pre-order, so containers come before their contents. `removed`
+    and `interps` address existing assertions by path, the latter paired with the interp
+    to adopt.
+    '''
+    added_nodes: dict = field(default_factory=dict)
+    removed_nodes: list = field(default_factory=list)
+    types: dict = field(default_factory=dict)
+    added: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    interps: list = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return (len(self.added_nodes) + len(self.removed_nodes) + len(self.types)
+                + len(self.added) + len(self.removed) + len(self.interps))
+
+
+def _target_ref(tgt):
+    if tgt is None:
+        return None
+    return ('assertion' if isinstance(tgt, assertion) else 'node', tgt.id)
+
+
+def _key(a: assertion) -> tuple:
+    '''The identity of `a` among its siblings (see module docstring).'''
+    if a.id is not None:
+        return ('id', a.id)
+    return (*a._skeleton, a.interp)
+
+
+def _record(path: tuple, a: assertion) -> AssertionRecord:
+    if isinstance(a, edge):
+        return AssertionRecord(path, 'edge', a.label, _target_ref(a.target), a.id, a.interp)
+    return AssertionRecord(path, 'property', a.label, a.value, a.id, a.interp)
+
+
+def _add_subtree(delta: GraphDelta, path: tuple, a: assertion) -> None:
+    stack = [(path, a)]
+    while stack:
+        path, a = stack.pop()
+        delta.added.append(_record(path, a))
+        inner = path + (_key(a),)
+        stack.extend((inner, child) for child in reversed((*a.properties, *a.edges)))
+
+
+def _group(container) -> dict:
+    groups: dict = {}
+    for a in (*container.properties, *container.edges):
+        groups.setdefault(_key(a), []).append(a)
+    return groups
+
+
+def diff(a: graph, b: graph) -> GraphDelta:
+    '''The delta that turns graph `a` into graph `b` (see `graph.diff`).'''
+    delta = GraphDelta()
+    for nid, na in a.nodes.items():
+        if nid not in b.nodes:
+            delta.removed_nodes.append(nid)
+    stack: list = []
+    for nid, nb in b.nodes.items():
+        na = a.nodes.get(nid)
+        if na is None:
+            delta.added_nodes[nid] = sorted(nb.types)
+            for child in (*nb.properties, *nb.edges):
+                _add_subtree(delta, (nid,), child)
+            continue
+        if na.types != nb.types:
+            delta.types[nid] = (sorted(nb.types - na.types), sorted(na.types - nb.types))
+        stack.append(((nid,), na, nb))
+
+    while stack:  # explicit stack: reification chains may be arbitrarily deep
+        path, ca, cb = stack.pop()
+        mine, theirs = _group(ca), _group(cb)
+        gone: list = []
+        for key, rows in mine.items():
+            others = theirs.pop(key, [])
+            for x, y in zip(rows, others):
+                stack.append((path + (key,), x, y))
+            gone.extend(rows[len(others):])
+            for y in others[len(rows):]:
+                _add_subtree(delta, path, y)
+        new = [y for rows in theirs.values() for y in rows]
+        # Interp adoption: a contract-free assertion whose counterpart gained a contract
+        for x in list(gone):
+            if x.interp is not None or x.id is not None:
+                continue
+            k = _key(x)[:-1]
+            match = next((y for y in new if y.id is None and y.interp is not None and _key(y)[:-1] == k), None)
+            if match is not None:
+                gone.remove(x)
+                new.remove(match)
+                delta.interps.append((path + (_key(x),), match.interp))
+                stack.append((path + (_key(x),), x, match))
+        for x in gone:
+            delta.removed.append(path + (_key(x),))
+        for y in new:
+            _add_subtree(delta, path, y)
+    return delta
+
+
+def _find(g: graph, path: tuple, made: dict):
+    found = made.get(path)
+    if found is not None:
+        return found
+    container = g.nodes.get(path[0])
+    if container is None:
+        raise DeltaConflict(f'Delta addresses node {path[0]!r}, which the graph lacks')
+    for i, key in enumerate(path[1:], 2):
+        found = made.get(path[:i])
+        if found is not None:
+            container = found
+            continue
+        if key[0] == 'id':
+            a = g.assertion_ids.get(key[1])
+            found = a if a is not None and a.origin is container else None
+        else:
+            candidates = container.getprop(key[1]) if key[0] == 'property' else container.getedge(key[1])
+            found = next((a for a in candidates if _key(a) == key), None)
+        if found is None:
+            raise DeltaConflict(f'Delta addresses {key!r} under {path[:i - 1]!r}, which the graph lacks')
+        container = found
+    return container
+
+
+def _resolve(g: graph, ref):
+    if ref is None:
+        return None
+    kind, tid = ref
+    if kind == 'assertion':
+        return g.assertion_ids.get(tid)
+    return g.nodes.get(tid) or node(tid)
+
+
+def apply(g: graph, delta: GraphDelta) -> graph:
+    '''Patch `g` in place with `delta` (see `graph.apply`).'''
+    for nid in delta.removed_nodes:
+        if nid in g.nodes:
+            del g[nid]
+    for nid, types in delta.added_nodes.items():
+        existing = g.nodes.get(nid)
+        if existing is None:
+            g.node(nid, set(types))
+        else:
+            existing.types |= set(types)
+    for nid, (added, removed) in delta.types.items():
+        n = g.nodes.get(nid)
+        if n is None:
+            raise DeltaConflict(f'Delta retypes node {nid!r}, which the graph lacks')
+        n.types |= set(added)
+        n.types -= set(removed)
+
+    for path in delta.removed:
+        a = _find(g, path, {})
+        (a.origin.remove_edge if isinstance(a, edge) else a.origin.remove_property)(a)
+
+    made: dict = {}  # path -> assertion created here, for records nested under it
+    pending: list = []  # edges whose assertion target is created later in the delta
+    for rec in delta.added:
+        container = _find(g, rec.path, made)
+        if rec.kind == 'edge':
+            tgt = _resolve(g, rec.obj)
+            a = container.add_edge(rec.label, tgt)
+            if tgt is None and rec.obj is not None:
+                pending.append((a, rec.obj))
+        else:
+            a = container.add_property(rec.label, rec.obj)
+        if rec.interp is not None:
+            a.interp = rec.interp
+        if rec.id is not None:
+            g.register_assertion_id(rec.id, a)
+        if rec.id is not None:
+            key = ('id', rec.id)
+        elif rec.kind == 'edge':
+            key = ('edge', rec.label, rec.obj or ('node', None), rec.interp)
+        else:
+            key = ('property', rec.label, rec.obj, rec.interp)
+        made[rec.path + (key,)] = a
+    for e, ref in pending:
+        e.target = _resolve(g, ref)
+
+    for path, interp in delta.interps:
+        _find(g, path, made).interp = interp
+    return g
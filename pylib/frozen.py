@@ -0,0 +1,518 @@
+# SPDX-FileCopyrightText: 2023-present Oori Data <info@oori.dev>
+# SPDX-License-Identifier: Apache-2.0
+# onya.frozen
+'''
+Immutable, columnar form of an Onya graph (see `graph.freeze()`).
+
+The mutable model spends an object and two sets per assertion. A `frozen_graph` instead
+integer-codes every IRI/id (one symbol table) and property value (one value table), and
+holds the assertions as parallel `array`s — kind, origin, label, value-or-target, id,
+interp — laid out breadth-first so each container's direct assertions occupy one
+contiguous, label-sorted run of rows (CSR offsets locate it). First-level assertions come
+first, so `deep=False` is a row-range bound. Incoming-edge, label and type indexes are
+CSR/array structures built once at freeze time.
+
+Reads go through small on-demand views (`frozen_node`, `frozen_property`, `frozen_edge`)
+that mirror the read side of the model classes; there is no mutation API. `thaw()` rebuilds
+an ordinary `graph`.
+
+    >>> fg = g.freeze()
+    >>> [e.target.id for e in fg[CHUKS].traverse(KNOWS)]
+    [I('http://e.o/Ify')]
+    >>> g2 = fg.thaw()
+'''
+
+from __future__ import annotations
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator, Mapping
+
+from amara.iri import I
+
+from onya.graph import graph, node, assertion, edge
+from onya.terms import ONYA_ASSERTION
+
+__all__ = ['frozen_graph', 'frozen_node', 'frozen_property', 'frozen_edge']
+
+# Encoding of the value-or-target column for edges: a node row is >= 0, an assertion target
+# row r is stored as -(r + 2), and an unresolved (pending) target as -1.
+_NO_TARGET = -1
+_PROPERTY, _EDGE = 0, 1
+
+
+def _encode_assertion_row(row: int) -> int:
+    return -(row + 2)
+
+
+def _column(values, limit: int) -> array:
+    '''An int array, 4-byte when every entry fits, else 8-byte.'''
+    return array('i' if limit < 2**31 - 2 else 'q', values)
+
+
+class frozen_graph(Mapping):
+    '''
+    A read-only, columnar snapshot of a `graph`, built by `graph.freeze()`. A `Mapping` of
+    node id -> `frozen_node`, with the query surface of `graph`: `select()`, `match()`,
+    `typematch()`, and traversal through the views. `thaw()` rebuilds the mutable model.
+    '''
+    def __init__(self, g: graph):
+        symbols: list = []
+        code: dict = {}
+
+        def sym(v) -> int:
+            c = code.get(v)
+            if c is None:
+                c = code[v] = len(symbols)
+                symbols.append(v)
+            return c
+
+        # Node rows double as the symbol codes of their ids: graph nodes first, then any
+        # node that is an edge target without being in the graph (a dangling target).
+        for nid in g.nodes:
+            sym(nid)
+        n_nodes = len(symbols)
+        dangling: list = []
+        for a in g._iter_assertions(snapshot=False):
+            t = a.target if isinstance(a, edge) else None
+            if isinstance(t, node) and t.id not in code:
+                sym(t.id)
+                dangling.append(t)
+        all_nodes = list(g.nodes.values()) + dangling
+
+        type_offsets, type_codes = [0], []
+        for n in all_nodes:
+            type_codes.extend(sorted(sym(t) for t in n.types))
+            type_offsets.append(len(type_codes))
+
+        # Breadth-first layout: each container's direct assertions are appended as one run,
+        # sorted by (label code, kind), so its children are rows [offsets[i], offsets[i+1]).
+        values: list = []
+        value_code: dict = {}
+        objs: list = []
+
+        def run(container) -> None:
+            kids = [(sym(a.label), False, a) for a in container.properties]
+            kids += [(sym(a.label), True, a) for a in container.edges]
+            kids.sort(key=lambda k: (k[0], k[1]))
+            objs.extend(a for _, _, a in kids)
+
+        node_offsets = [0]
+        for n in g.nodes.values():
+            run(n)
+            node_offsets.append(len(objs))
+        n_top = len(objs)
+        child_offsets = [n_top]
+        r = 0
+        while r < len(objs):
+            run(objs[r])
+            child_offsets.append(len(objs))
+            r += 1
+
+        row_of = {id(a): i for i, a in enumerate(objs)}
+        kind, origin, label, obj, aid, interp = [], [], [], [], [], []
+        for i, a in enumerate(objs):
+            is_edge = isinstance(a, edge)
+            kind.append(_EDGE if is_edge else _PROPERTY)
+            origin.append(row_of[id(a.origin)] if isinstance(a.origin, assertion) else code[a.origin.id])
+            label.append(code[a.label])
+            if is_edge:
+                t = a.target
+                if t is None:
+                    obj.append(_NO_TARGET)
+                elif isinstance(t, node):
+                    obj.append(code[t.id])
+                elif id(t) in row_of:
+                    obj.append(_encode_assertion_row(row_of[id(t)]))
+                else:
+                    raise ValueError(f'Cannot freeze an edge targeting an assertion outside the graph: {a!r}')
+            else:
+                vc = value_code.get(a.value)
+                if vc is None:
+                    vc = value_code[a.value] = len(values)
+                    values.append(a.value)
+                obj.append(vc)
+            aid.append(-1 if a.id is None else sym(a.id))
+            interp.append(-1 if a.interp is None else sym(a.interp))
+
+        n_rows = len(objs)
+        limit = max(n_rows, len(symbols), len(values)) + 2
+        self._symbols = symbols
+        self._code = code
+        self._values = values
+        self._value_code = value_code
+        self._n_nodes = n_nodes
+        self._n_all_nodes = len(all_nodes)
+        self._n_top = n_top
+        self._type_offsets = _column(type_offsets, limit)
+        self._type_codes = _column(type_codes, limit)
+        self._node_offsets = _column(node_offsets, limit)
+        self._child_offsets = _column(child_offsets, limit)
+        self._kind = array('b', kind)
+        self._origin = _column(origin, limit)
+        self._label = _column(label, limit)
+        self._obj = _column(obj, limit)
+        self._aid = _column(aid, limit)
+        self._interp = _column(interp, limit)
+        self._by_aid = {c: row for row, c in enumerate(aid) if c >= 0}
+
+        # Indexes: incoming edges per target node row (CSR), per target assertion row (dict),
+        # rows per label (label code -> row array), node rows per type (type code -> row array).
+        counts = [0] * (self._n_all_nodes + 1)
+        to_assertion: dict = {}
+        by_label: dict = {}
+        for row in range(n_rows):
+            by_label.setdefault(label[row], []).append(row)
+            if kind[row] == _EDGE:
+                t = obj[row]
+                if t >= 0:
+                    counts[t + 1] += 1
+                elif t != _NO_TARGET:
+                    to_assertion.setdefault(-t - 2, []).append(row)
+        for i in range(self._n_all_nodes):
+            counts[i + 1] += counts[i]
+        fill = counts[:-1]
+        in_rows = [0] * counts[-1]
+        for row in range(n_rows):
+            if kind[row] == _EDGE and obj[row] >= 0:
+                t = obj[row]
+                in_rows[fill[t]] = row
+                fill[t] += 1
+        self._in_offsets = _column(counts, limit)
+        self._in_rows = _column(in_rows, limit)
+        self._in_assertion = {row: _column(rows, limit) for row, rows in to_assertion.items()}
+        self._by_label = {c: _column(rows, limit) for c, rows in by_label.items()}
+        by_type: dict = {}
+        for n in range(self._n_nodes):
+            for i in range(type_offsets[n], type_offsets[n + 1]):
+                by_type.setdefault(type_codes[i], []).append(n)
+        self._by_type = {c: _column(rows, limit) for c, rows in by_type.items()}
+
+    # --- Mapping --------------------------------------------------------------------
+
+    def __getitem__(self, nid: I | str) -> 'frozen_node':
+        c = self._code.get(nid)
+        if c is None or c >= self._n_nodes:
+            raise KeyError(nid)
+        return frozen_node(self, c)
+
+    def __iter__(self) -> Iterator[I | str]:
+        return iter(self._symbols[:self._n_nodes])
+
+    def __len__(self) -> int:
+        return self._n_nodes
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__} with {self._n_nodes} nodes, {len(self._kind)} assertions'
+
+    @property
+    def nodes(self) -> dict:
+        '''node id -> `frozen_node`, materialized on access (parity with `graph.nodes`).'''
+        return {self._symbols[n]: frozen_node(self, n) for n in range(self._n_nodes)}
+
+    @property
+    def assertion_ids(self) -> dict:
+        '''assertion @id -> its frozen assertion view, materialized on access.'''
+        return {self._symbols[c]: self._view(row) for c, row in self._by_aid.items()}
+
+    def nbytes(self) -> int:
+        '''Approximate memory held by the frozen form: columns, indexes and the two tables.'''
+        total = sum(col.itemsize * len(col) for col in (
+            self._type_offsets, self._type_codes, self._node_offsets, self._child_offsets, self._kind,
+            self._origin, self._label, self._obj, self._aid, self._interp, self._in_offsets, self._in_rows))
+        total += sum(col.itemsize * len(col) for d in (self._by_label, self._by_type, self._in_assertion)
+                     for col in d.values())
+        for table in (self._symbols, self._values):
+            total += sys.getsizeof(table) + sum(sys.getsizeof(v) for v in table)
+        for d in (self._code, self._value_code, self._by_aid, self._by_label, self._by_type, self._in_assertion):
+            total += sys.getsizeof(d)
+        return total
+
+    # --- row access -----------------------------------------------------------------
+
+    def _view(self, row: int) -> 'frozen_property | frozen_edge':
+        return (frozen_edge if self._kind[row] == _EDGE else frozen_property)(self, row)
+
+    def _children(self, container: 'frozen_node | frozen_assertion') -> range:
+        if isinstance(container, frozen_node):
+            return range(self._node_offsets[container._row], self._node_offsets[container._row + 1])
+        return range(self._child_offsets[container._row], self._child_offsets[container._row + 1])
+
+    def _labelled(self, rows: range, label) -> range:
+        '''The sub-run of a container's (label-sorted) rows carrying `label`.'''
+        c = self._code.get(label)
+        if c is None or not rows:
+            return range(0)
+        lo = bisect_left(self._label, c, rows.start, rows.stop)
+        hi = bisect_right(self._label, c, lo, rows.stop)
+        return range(lo, hi)
+
+    def _incoming(self, nrow: int) -> array:
+        return self._in_rows[self._in_offsets[nrow]:self._in_offsets[nrow + 1]]
+
+    def _target_code(self, target) -> int | None:
+        '''The value-or-target column code `target` (an id or a view) names, else None.'''
+        if isinstance(target, str):
+            c = self._code.get(target)
+            if c is not None and c < self._n_all_nodes:
+                return c
+            row = self._by_aid.get(c)
+            return None if row is None else _encode_assertion_row(row)
+        if isinstance(target, frozen_node) and target._fg is self:
+            return target._row
+        if isinstance(target, frozen_assertion) and target._fg is self:
+            return _encode_assertion_row(target._row)
+        return None
+
+    def _resolve_origin(self, origin) -> 'frozen_node | frozen_assertion | None':
+        if isinstance(origin, str):
+            c = self._code.get(origin)
+            if c is not None and c < self._n_nodes:
+                return frozen_node(self, c)
+            row = self._by_aid.get(c)
+            return None if row is None else self._view(row)
+        if isinstance(origin, (frozen_node, frozen_assertion)) and origin._fg is self:
+            return origin
+        return None
+
+    # --- queries --------------------------------------------------------------------
+
+    def typematch(self, types: I | str | set[I | str]) -> Iterator['frozen_node']:
+        '''Find nodes with matching types (any of `types`), from the frozen type index.'''
+        if isinstance(types, (str, I)):
+            types = {types}
+        codes = [self._code[t] for t in set(types) if t in self._code]
+        rows = [self._by_type[c] for c in codes if c in self._by_type]
+        for n in (rows[0] if len(rows) == 1 else sorted(set().union(*rows))):
+            yield frozen_node(self, n)
+
+    def select(self, origin: I | str | frozen_node | frozen_assertion | None = None,
+               label: I | str | None = None, *,
+               value: str | None = None,
+               target: I | str | frozen_node | frozen_assertion | None = None,
+               id: I | str | None = None,
+               deep: bool = False) -> Iterator['frozen_property | frozen_edge']:
+        '''
+        `graph.select()` over the frozen form, with the same constraints and semantics,
+        yielding views. Candidates come from the narrowest applicable index — the @id map,
+        the incoming-edge CSR, the origin's label-sorted run, or the label index — and the
+        rest of the pattern is checked against the columns before any view is built.
+        '''
+        if value is not None and target is not None:
+            raise ValueError('select() takes at most one of value= (properties) or target= (edges)')
+        paths: list = []
+        if id is not None:  # noqa: A002 - `id` names the @id component
+            row = self._by_aid.get(self._code.get(id))
+            paths.append([] if row is None else [row])
+        want_obj = None
+        if target is not None:
+            want_obj = self._target_code(target)
+            if want_obj is None:
+                return
+            paths.append(self._incoming(want_obj) if want_obj >= 0 else self._in_assertion.get(-want_obj - 2, ()))
+        if value is not None:
+            want_obj = self._value_code.get(value)
+            if want_obj is None:
+                return
+        if origin is not None:
+            container = self._resolve_origin(origin)
+            if container is None or (isinstance(container, frozen_assertion) and not deep):
+                return
+            rows = self._children(container)
+            paths.append(rows if label is None else self._labelled(rows, label))
+        if label is not None:
+            c = self._code.get(label)
+            if c is None:
+                return
+            paths.append(self._by_label.get(c, ()))
+        if not paths:
+            paths.append(range(len(self._kind) if deep else self._n_top))
+
+        want_kind = _EDGE if target is not None else _PROPERTY if value is not None else None
+        want_label = self._code.get(label) if label is not None else None
+        want_aid = self._code.get(id) if id is not None else None
+        for row in min(paths, key=len):
+            if not deep and row >= self._n_top:
+                continue
+            if want_kind is not None and self._kind[row] != want_kind:
+                continue
+            if want_obj is not None and self._obj[row] != want_obj:
+                continue
+            if want_label is not None and self._label[row] != want_label:
+                continue
+            if want_aid is not None and self._aid[row] != want_aid:
+                continue
+            a = self._view(row)
+            if origin is not None and not _origin_ok(a, origin):
+                continue
+            yield a
+
+    def match(self, origin: I | str | None = None,
+              label: I | str | None = None,
+              ) -> Iterator[tuple[I | str, I | str, str | I, dict]]:
+        '''`graph.match()` over the frozen form: `(origin, relation, target, annotations)` tuples.'''
+        for a in self.select(origin=origin, label=label):
+            annotations = {p.label: p.value for p in a.properties}
+            if isinstance(a, frozen_edge):
+                target = a.target.id if a.target is not None else None
+            else:
+                target = a.value
+            yield (a.origin.id, a.label, target, annotations)
+
+    def thaw(self) -> graph:
+        '''Rebuild an ordinary, mutable `graph` equal to the one that was frozen.'''
+        symbols, values = self._symbols, self._values
+        g = graph()
+        nodes = []
+        for n in range(self._n_all_nodes):
+            types = {symbols[self._type_codes[i]] for i in range(self._type_offsets[n], self._type_offsets[n + 1])}
+            nodes.append(node(symbols[n], types))
+        for n in range(self._n_nodes):
+            g[symbols[n]] = nodes[n]
+        objs: list = []
+        for row in range(len(self._kind)):
+            o = self._origin[row]
+            container = nodes[o] if row < self._n_top else objs[o]
+            if self._kind[row] == _EDGE:
+                a = container.add_edge(symbols[self._label[row]], None)
+            else:
+                a = container.add_property(symbols[self._label[row]], values[self._obj[row]])
+            if self._interp[row] >= 0:
+                a.interp = symbols[self._interp[row]]
+            if self._aid[row] >= 0:
+                g.register_assertion_id(symbols[self._aid[row]], a)
+            objs.append(a)
+        for row, a in enumerate(objs):
+            t = self._obj[row]
+            if self._kind[row] == _EDGE and t != _NO_TARGET:
+                a.target = nodes[t] if t >= 0 else objs[-t - 2]
+        return g
+
+
+def _origin_ok(a: 'frozen_assertion', origin) -> bool:
+    if isinstance(origin, str):
+        return a.origin.id == origin
+    return a.origin == origin
+
+
+class _frozen_container:
+    '''Read-side assertion access shared by frozen nodes and assertions.'''
+    __slots__ = ('_fg', '_row')
+
+    def __init__(self, fg: frozen_graph, row: int):
+        self._fg = fg
+        self._row = row
+
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and other._fg is self._fg and other._row == self._row
+
+    def __hash__(self) -> int:
+        return hash((id(self._fg), self._row))
+
+    @property
+    def properties(self) -> tuple:
+        fg = self._fg
+        return tuple(frozen_property(fg, r) for r in fg._children(self) if fg._kind[r] == _PROPERTY)
+
+    @property
+    def edges(self) -> tuple:
+        fg = self._fg
+        return tuple(frozen_edge(fg, r) for r in fg._children(self) if fg._kind[r] == _EDGE)
+
+    def getprop(self, label: I | str) -> Iterator['frozen_property']:
+        '''Get properties with a given label (a bisection over this container's run).'''
+        fg = self._fg
+        for r in fg._labelled(fg._children(self), label):
+            if fg._kind[r] == _PROPERTY:
+                yield frozen_property(fg, r)
+
+    def getedge(self, label: I | str) -> Iterator['frozen_edge']:
+        '''Get edges with a given label (a bisection over this container's run).'''
+        fg = self._fg
+        for r in fg._labelled(fg._children(self), label):
+            if fg._kind[r] == _EDGE:
+                yield frozen_edge(fg, r)
+
+
+class frozen_node(_frozen_container):
+    '''Read-only view of a node in a `frozen_graph`.'''
+    __slots__ = ()
+
+    @property
+    def id(self) -> I | str:
+        return self._fg._symbols[self._row]
+
+    @property
+    def types(self) -> frozenset:
+        fg = self._fg
+        return frozenset(fg._symbols[fg._type_codes[i]]
+                         for i in range(fg._type_offsets[self._row], fg._type_offsets[self._row + 1]))
+
+    def traverse(self, label: I | str) -> Iterator['frozen_edge']:
+        '''Find edges with a given label'''
+        return self.getedge(label)
+
+    def reverse(self, label: I | str, graph: frozen_graph | None = None) -> Iterator['frozen_edge']:
+        '''First-level edges with `label` that target this node, from the incoming-edge CSR.'''
+        fg = self._fg
+        c = fg._code.get(label)
+        for r in fg._incoming(self._row):
+            if r < fg._n_top and fg._label[r] == c:
+                yield frozen_edge(fg, r)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.id!r})'
+
+
+class frozen_assertion(_frozen_container):
+    '''Read-only view of an assertion in a `frozen_graph`.'''
+    __slots__ = ()
+    types = frozenset({ONYA_ASSERTION})
+
+    @property
+    def origin(self) -> 'frozen_node | frozen_assertion':
+        fg = self._fg
+        o = fg._origin[self._row]
+        return frozen_node(fg, o) if self._row < fg._n_top else fg._view(o)
+
+    @property
+    def label(self) -> I | str:
+        return self._fg._symbols[self._fg._label[self._row]]
+
+    @property
+    def id(self) -> I | str | None:
+        c = self._fg._aid[self._row]
+        return None if c < 0 else self._fg._symbols[c]
+
+    @property
+    def interp(self) -> I | str | None:
+        c = self._fg._interp[self._row]
+        return None if c < 0 else self._fg._symbols[c]
+
+
+class frozen_property(frozen_assertion):
+    '''Read-only view of a property in a `frozen_graph`.'''
+    __slots__ = ()
+
+    @property
+    def value(self) -> str:
+        return self._fg._values[self._fg._obj[self._row]]
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.origin.id!r}, {self.label!r}, {self.value!r})'
+
+
+class frozen_edge(frozen_assertion):
+    '''Read-only view of an edge in a `frozen_graph`.'''
+    __slots__ = ()
+
+    @property
+    def target(self) -> 'frozen_node | frozen_assertion | None':
+        fg = self._fg
+        t = fg._obj[self._row]
+        if t == _NO_TARGET:
+            return None
+        return frozen_node(fg, t) if t >= 0 else fg._view(-t - 2)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.origin.id!r}, {self.label!r}, {self.target!r})'
@@ -19,13 +19,28 @@ The Onya graph model:
 '''
 
 from __future__ import annotations
-from collections.abc import MutableMapping, Iterator
+import functools
+import sys
+import threading
+import weakref
+from collections.abc import Callable, Iterable, MutableMapping, Iterator
 from abc import ABC
+from bisect import bisect_left, insort
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 from amara.iri import I
 
+from onya.rwlock import RWLock
 from onya.terms import ONYA_ASSERTION
 
+if TYPE_CHECKING:  # for annotations only; these modules import this one
+    from onya.delta import GraphDelta
+    from onya.frozen import frozen_graph
+    from onya.query import Pattern
+    from onya.snapshot import graph_snapshot
+
 
 class AssertionIdConflict(ValueError):
     '''
@@ -45,41 +60,361 @@ class GraphMergeError(ValueError):
     '''
 
 
+# Containers with fewer direct assertions than this answer label lookups by scanning. At or
+# above it, the first lookup builds a per-container label -> assertions index, which
+# `add_*`/`remove_*` then keep current, so lookups on hub nodes cost O(matches), not O(degree).
+LABEL_INDEX_THRESHOLD = 16
+
+
+def _writes(fn):
+    '''
+    Mark mutator `fn` to run under its graph's write lock when that graph is in thread-safe mode
+    (see `graph.enable_thread_safety`). `fn` itself stays on the class until some graph enables
+    that mode (see `_set_locking`), so the default path pays nothing for the mark.
+    '''
+    @functools.wraps(fn)
+    def locked(self, *args, **kwargs):
+        g = self._graph
+        lock = g._rwlock if g is not None else None
+        if lock is None:
+            return fn(self, *args, **kwargs)
+        lock.acquire_write()
+        try:
+            return fn(self, *args, **kwargs)
+        finally:
+            lock.release_write()
+    fn._locked = locked
+    return fn
+
+
+def _reads(fn):
+    '''
+    Mark reader `fn` to run under its graph's read lock in thread-safe mode (see `_writes`). A
+    result that is an iterator is drained while the lock is held, so the caller iterates over
+    a stable list.
+    '''
+    @functools.wraps(fn)
+    def locked(self, *args, **kwargs):
+        g = self._graph
+        lock = g._rwlock if g is not None else None
+        if lock is None:
+            return fn(self, *args, **kwargs)
+        lock.acquire_read()
+        try:
+            result = fn(self, *args, **kwargs)
+            return iter(list(result)) if isinstance(result, Iterator) else result
+        finally:
+            lock.release_read()
+    fn._locked = locked
+    return fn
+
+
+def _reads_labelled(kind: int):
+    '''
+    `_reads` for `getprop` (`kind` 0) and `getedge` (1): the locked variant collects the matches
+    under the read lock and returns an iterator over them, skipping the generator.
+    '''
+    def mark(fn):
+        @functools.wraps(fn)
+        def locked(self, label):
+            g = self._graph
+            lock = g._rwlock if g is not None else None
+            if lock is None:
+                return iter(self._labelled(kind, label))
+            lock.acquire_read()
+            try:
+                return iter(self._labelled(kind, label))
+            finally:
+                lock.release_read()
+        fn._locked = locked
+        return fn
+    return mark
+
+
+# id() -> graph, for the graphs in thread-safe mode. While it is empty the model classes carry
+# their plain methods (see `_set_locking`).
+_thread_safe: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+_thread_safe_guard = threading.Lock()
+
+
+def _none_thread_safe() -> bool:
+    return next(iter(_thread_safe.values()), None) is None
+
+
+def _release_locking() -> None:
+    '''Finalizer of a graph in thread-safe mode: once no such graph is left, restore the plain methods.'''
+    if _thread_safe_guard.acquire(blocking=False):  # never wait inside garbage collection
+        try:
+            if _none_thread_safe():
+                _set_locking(False)
+        finally:
+            _thread_safe_guard.release()
+
+
+def _set_locking(on: bool) -> None:
+    '''
+    Put the lock-taking wrappers made by `_writes`/`_reads` on the model classes and their
+    subclasses (`on`), or the plain methods back. A wrapper checks its own graph's lock, so
+    graphs outside thread-safe mode stay correct either way; they pay that one attribute
+    check only while some graph in the process is in the mode.
+    '''
+    def variant(fn):
+        plain = getattr(fn, '__wrapped__', fn)
+        locked = getattr(plain, '_locked', None)
+        if locked is None:
+            return fn
+        return locked if on else plain
+
+    seen: set = set()
+    pending = [assertions_mixin, _typeset, graph]
+    while pending:
+        cls = pending.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        pending.extend(cls.__subclasses__())
+        for name, attr in list(vars(cls).items()):
+            if isinstance(attr, property):
+                fget, fset = variant(attr.fget), variant(attr.fset)
+                if fget is not attr.fget or fset is not attr.fset:
+                    setattr(cls, name, property(fget, fset, attr.fdel, attr.__doc__))
+            elif (swapped := variant(attr)) is not attr:
+                setattr(cls, name, swapped)
+
+
 class assertions_mixin:
     '''
     Mixin for objects that can have assertions (edges and properties)
     '''
+    @_writes
     def add_property(self, label: I | str, value: str, interp: I | str | None = None):
+        self._before_change()
         p = property_(self, label, value)
         if interp is not None:
             p.interp = interp
         self.properties.add(p)
+        if self._by_label is not None:
+            self._by_label[0].setdefault(label, set()).add(p)
+        if self._graph is not None:
+            self._graph._attach(p)
+            self._graph._touch(self)
         return p
 
+    @_writes
     def add_edge(self, label: I | str, target: 'node'):
+        self._before_change()
         e = edge(self, label, target)
         self.edges.add(e)
+        if self._by_label is not None:
+            self._by_label[1].setdefault(label, set()).add(e)
+        if self._graph is not None:
+            self._graph._attach(e)
+            self._graph._touch(self)
         return e
 
+    @_writes
     def remove_property(self, prop: 'property_'):
+        self._before_change()
         self.properties.remove(prop)
+        if self._by_label is not None:
+            _discard_labelled(self._by_label[0], prop)
+        if prop._graph is not None:
+            prop._graph._detach(prop)
 
+    @_writes
     def remove_edge(self, edge_: 'edge'):
+        self._before_change()
         self.edges.remove(edge_)
-
+        if self._by_label is not None:
+            _discard_labelled(self._by_label[1], edge_)
+        if edge_._graph is not None:
+            edge_._graph._detach(edge_)
+
+    def _adopt(self, a: 'assertion') -> None:
+        '''Reparent `a` (taken from another container) onto this one, keeping the label index current.'''
+        self._before_change()
+        old_origin = a.origin
+        a.origin = self
+        root = self._root
+        if a._root is not root:  # moved under another node: the whole subtree follows
+            a._root = root
+            for child in iter_assertions((a,), snapshot=False):
+                child._root = root
+        is_edge = isinstance(a, edge)
+        (self.edges if is_edge else self.properties).add(a)
+        if self._by_label is not None:
+            self._by_label[is_edge].setdefault(a.label, set()).add(a)
+        g = self._graph
+        if g is not None and a._graph is g and old_origin is not self:  # a move within the graph (merge)
+            g._mutations += 1
+            if g._journal is not None:
+                g._log('move', a, old_origin, self)
+
+    def _before_change(self) -> None:
+        '''Called just before this container is mutated: lets open snapshots keep its prior state.'''
+        g = self._graph
+        if g is not None and g._snapshots:
+            g._preserve(self._root.id)
+
+    def _label_index(self):
+        '''
+        The (properties, edges) pair of label -> assertion-set maps, built on first use; None
+        while the container is below `LABEL_INDEX_THRESHOLD` (a plain scan is cheaper there).
+        '''
+        idx = self._by_label
+        if idx is None:
+            if len(self.properties) + len(self.edges) < LABEL_INDEX_THRESHOLD:
+                return None
+            props: dict = {}
+            edges: dict = {}
+            for p in self.properties:
+                props.setdefault(p.label, set()).add(p)
+            for e in self.edges:
+                edges.setdefault(e.label, set()).add(e)
+            idx = self._by_label = (props, edges)
+        return idx
+
+    def _labelled(self, kind: int, label: I | str) -> list:
+        '''The properties (`kind` 0) or edges (1) directly under this container with `label`.'''
+        idx = self._label_index()
+        if idx is not None:
+            return list(idx[kind].get(label, ()))
+        return [a for a in (self.edges if kind else self.properties) if a.label == label]
+
+    @_reads_labelled(0)
     def getprop(self, label: I | str):
         '''Get properties with a given label'''
+        idx = self._label_index()
+        if idx is not None:
+            yield from tuple(idx[0].get(label, ()))
+            return
         for prop in self.properties:
             if prop.label == label:
                 yield prop
-    
+
+    @_reads_labelled(1)
     def getedge(self, label: I | str):
         '''Get edges with a given label'''
+        idx = self._label_index()
+        if idx is not None:
+            yield from tuple(idx[1].get(label, ()))
+            return
         for edge_ in self.edges:
             if edge_.label == label:
                 yield edge_
 
 
+def _discard_labelled(by_label: dict, a: 'assertion') -> None:
+    bucket = by_label.get(a.label)
+    if bucket is not None:
+        bucket.discard(a)
+        if not bucket:
+            del by_label[a.label]
+
+
+class _typeset(set):
+    '''
+    A node's set of types. Behaves exactly like a `set`, but reports additions and removals
+    to the graph owning the node, so that graph's type index stays current however the set
+    is mutated (`n.types.add(t)`, `n.types |= other`, ...).
+    '''
+    __slots__ = ('_node',)
+
+    def __init__(self, owner: 'node', iterable=()):
+        super().__init__(iterable)
+        self._node = owner
+
+    @property
+    def _graph(self) -> 'graph | None':
+        return self._node._graph  # whose lock guards this set (see `_writes`)
+
+    def __reduce__(self):
+        return (_typeset, (self._node, list(self)))
+
+    def __copy__(self) -> set:
+        return set(self)  # a detached plain copy; only the node's own set reports changes
+
+    def _before_change(self) -> None:
+        self._node._before_change()
+
+    def _changed(self, added, removed) -> None:
+        g = self._node._graph
+        if g is not None and (added or removed):
+            g._retype(self._node, added, removed)
+
+    @_writes
+    def _bulk(self, op, *args):
+        self._before_change()
+        before = set(self)
+        result = op(self, *args)
+        self._changed(self - before, before - self)
+        return result
+
+    @_writes
+    def add(self, t) -> None:
+        if t not in self:
+            self._before_change()
+            g = self._node._graph
+            if g is not None:
+                t = g.intern(t)
+            super().add(t)
+            self._changed((t,), ())
+
+    @_writes
+    def discard(self, t) -> None:
+        if t in self:
+            self._before_change()
+            super().discard(t)
+            self._changed((), (t,))
+
+    @_writes
+    def remove(self, t) -> None:
+        if t in self:
+            self._before_change()
+        super().remove(t)
+        self._changed((), (t,))
+
+    @_writes
+    def pop(self):
+        if self:
+            self._before_change()
+        t = super().pop()
+        self._changed((), (t,))
+        return t
+
+    @_writes
+    def clear(self) -> None:
+        if self:
+            self._before_change()
+        removed = tuple(self)
+        super().clear()
+        self._changed((), removed)
+
+    def update(self, *others) -> None:
+        self._bulk(set.update, *others)
+
+    def difference_update(self, *others) -> None:
+        self._bulk(set.difference_update, *others)
+
+    def intersection_update(self, *others) -> None:
+        self._bulk(set.intersection_update, *others)
+
+    def symmetric_difference_update(self, other) -> None:
+        self._bulk(set.symmetric_difference_update, other)
+
+    def __ior__(self, other):
+        return self._bulk(set.__ior__, other)
+
+    def __isub__(self, other):
+        return self._bulk(set.__isub__, other)
+
+    def __iand__(self, other):
+        return self._bulk(set.__iand__, other)
+
+    def __ixor__(self, other):
+        return self._bulk(set.__ixor__, other)
+
+
 class node(assertions_mixin):
     '''
     A node in the Onya graph.
@@ -87,31 +422,55 @@ class node(assertions_mixin):
     A node has an identifier (IRI), optional types (IRIs), and assertions
     (edges and properties). Both edges and properties are sets, not sequences,
     because pervasive ordering is not a core requirement of the model.
+
+    A node belongs to (and keeps the indexes of) the graph it was most recently added to;
+    `_graph` is None for a free-standing node. Mutate through the methods here
+    (`add_edge`, `remove_property`, ...) rather than the raw sets so those indexes stay current.
     '''
-    __slots__ = ['id', 'types', 'properties', 'edges']
+    __slots__ = ['id', '_types', 'properties', 'edges', '_graph', '_by_label']
 
     def __init__(self, id_: I | str, types: I | str | set[I | str] | None = None):
         self.id = id_
+        self._graph: 'graph | None' = None
         if isinstance(types, str):
             types = I(types)
         if isinstance(types, I):
             types = {types}
-        self.types: set[I | str] = set(types) if types else set()
+        self._types = _typeset(self, types or ())
         self.properties: set['property_'] = set()
         self.edges: set['edge'] = set()
-    
+        self._by_label = None  # lazy label index; see `assertions_mixin._label_index`
+
+    @property
+    def types(self) -> set[I | str]:
+        return self._types
+
+    @types.setter
+    @_writes
+    def types(self, new_types) -> None:
+        self._before_change()
+        old = set(self._types)
+        self._types = _typeset(self, new_types)
+        self._types._changed(self._types - old, old - self._types)
+
+    @property
+    def _root(self) -> 'node':
+        return self  # a node tops its own origin chain (see `assertion._root`)
+
     def traverse(self, label: I | str) -> Iterator['edge']:
         '''Find edges with a given label'''
-        for e in self.edges:
-            if e.label == label:
-                yield e
+        return self.getedge(label)
 
+    @_reads
     def reverse(self, label: I | str, graph: 'graph') -> Iterator['edge']:
-        '''Find edges targeting this node with a given label (requires graph access)'''
-        for nid, nobj in graph.nodes.items():
-            for e in nobj.traverse(label):
-                if e.target == self:
-                    yield e
+        '''
+        Find edges targeting this node with a given label (requires graph access). Answered
+        from the graph's incoming-edge index, so the cost is proportional to the number of
+        matching edges rather than to the size of the graph.
+        '''
+        for e in graph._incoming_edges(_target_key(self), label):
+            if e.target is self and not isinstance(e.origin, assertion):  # first-level edges only
+                yield e
 
 
 class assertion(assertions_mixin, ABC):
@@ -129,7 +488,8 @@ class assertion(assertions_mixin, ABC):
     The implicit type is class-level and shared: it is not stored per instance and is not
     serialized.
     '''
-    __slots__ = ['origin', 'label', 'id', 'interp', 'properties', 'edges']
+    __slots__ = ['origin', '_label', '_id', '_interp', 'properties', 'edges', '_graph', '_by_label', '_skel',
+                 '_root']
 
     # Implicit, read-only type shared by all assertions (see class docstring). frozenset so
     # it cannot be mutated through an instance; not part of __slots__, so purely class-level.
@@ -137,14 +497,87 @@ class assertion(assertions_mixin, ABC):
 
     def __init__(self, origin: 'node | assertion', label: I | str):
         self.origin = origin
-        self.label = label
-        self.id: I | str | None = None  # optional explicit identifier; see SPEC: Assertion Identifiers
+        self._root = origin._root  # the node at the top of the origin chain
+        self._label = label
+        self._id: I | str | None = None  # optional explicit identifier; see SPEC: Assertion Identifiers
         # Optional interpretation: a recorded contract about how this assertion's string value is
         # meant to be read (see SPEC: Data contract layers). Excluded from the merge skeleton, like
         # `id`; the model stores the IRI as data and never applies it. None means no contract.
-        self.interp: I | str | None = None
+        self._interp: I | str | None = None
         self.properties: set['property_'] = set()
         self.edges: set['edge'] = set()
+        self._graph: 'graph | None' = None  # set while the assertion is part of a graph
+        self._by_label = None  # lazy label index; see `assertions_mixin._label_index`
+        self._skel = None  # cached `_skeleton`; cleared when the label, value or target changes
+
+    @property
+    def _skeleton(self):
+        '''
+        Identity core used for merge (see SPEC: Identity and graph merge), computed by
+        `_compute_skeleton` and cached until the label, value or target changes.
+        '''
+        skel = self._skel
+        if skel is None:
+            skel = self._compute_skeleton()
+            if self._skeleton_cacheable():
+                self._skel = skel
+        return skel
+
+    def _skeleton_cacheable(self) -> bool:
+        return True
+
+    @property
+    def interp(self) -> I | str | None:
+        return self._interp
+
+    @interp.setter
+    @_writes
+    def interp(self, new_interp: I | str | None) -> None:
+        old_interp = self._interp
+        if old_interp != new_interp:
+            self._before_change()
+        self._interp = new_interp
+        if self._graph is not None and old_interp != new_interp:
+            self._graph._reinterp(self, old_interp, new_interp)
+
+    @property
+    def label(self) -> I | str:
+        return self._label
+
+    @label.setter
+    @_writes
+    def label(self, new_label: I | str) -> None:
+        old_label = self._label
+        if old_label == new_label:
+            return
+        self._before_change()
+        # Re-file under the new label in the origin's label index and the graph's indexes.
+        is_edge = isinstance(self, edge)
+        by_label = getattr(self.origin, '_by_label', None)
+        if by_label is not None:
+            _discard_labelled(by_label[is_edge], self)
+        self._label = new_label
+        self._skel = None
+        if by_label is not None:
+            by_label[is_edge].setdefault(new_label, set()).add(self)
+        if self._graph is not None:
+            self._graph._relabel(self, old_label, new_label)
+
+    @property
+    def id(self) -> I | str | None:
+        return self._id
+
+    @id.setter
+    @_writes
+    def id(self, new_id: I | str | None) -> None:
+        # An assertion that is part of a graph stays findable through `assertion_ids` (the
+        # graph keeps the first binding of an id; `register_assertion_id` enforces uniqueness).
+        old_id = self._id
+        if old_id != new_id:
+            self._before_change()
+        self._id = new_id
+        if self._graph is not None and old_id != new_id:
+            self._graph._reidentify(self, old_id, new_id)
 
 
 class property_(assertion):
@@ -155,49 +588,85 @@ class property_(assertion):
     No numbers, dates, or other types at the core layer - those can be
     handled by annotation systems built on top.
     '''
-    __slots__ = ['value']
+    __slots__ = ['_value']
 
     def __init__(self, origin: 'node | assertion', label: I | str, value: str):
         super().__init__(origin, label)
-        self.value: str = value
+        self._value: str = value
+
+    @property
+    def value(self) -> str:
+        return self._value
+
+    @value.setter
+    @_writes
+    def value(self, new_value: str) -> None:
+        old_value = self._value
+        if old_value != new_value:
+            self._before_change()
+        self._value = new_value
+        self._skel = None
+        if self._graph is not None and old_value != new_value:
+            self._graph._revalue(self, old_value, new_value)
 
     def __repr__(self):
         return f'property_({self.label}={self.value!r})'
 
-    @property
-    def _skeleton(self):
+    def _compute_skeleton(self):
         '''
         Identity core used for merge (see SPEC: Identity and graph merge). Excludes the
         `id`, the `interp`, and nested assertions: annotating an assertion never changes
         its identity. Origin is excluded because skeletons are only ever compared among
         assertions that already share an origin (siblings under one container).
         '''
-        return ('property', self.label, self.value)
+        return ('property', self._label, self._value)
 
 
 class edge(assertion):
     '''
     An edge assertion connects an origin node to a target node via an IRI label.
+
+    `target` may be rebound after creation (the parser and the stores resolve forward
+    references this way); the owning graph's incoming-edge index follows the change.
     '''
-    __slots__ = ['target']
+    __slots__ = ['_target']
 
     def __init__(self, origin: 'node | assertion', label: I | str, target: 'node'):
         super().__init__(origin, label)
-        self.target: 'node' = target
-    
+        self._target: 'node' = target
+
+    @property
+    def target(self) -> 'node':
+        return self._target
+
+    @target.setter
+    @_writes
+    def target(self, new_target: 'node') -> None:
+        old_target = self._target
+        if old_target is not new_target:
+            self._before_change()
+        self._target = new_target
+        self._skel = None
+        if self._graph is not None:
+            self._graph._retarget(self, old_target, new_target)
+
     def __repr__(self):
         target_id = self.target.id if self.target is not None else '?'
         return f'edge({self.label} -> {target_id})'
 
-    @property
-    def _skeleton(self):
+    def _skeleton_cacheable(self) -> bool:
+        # An assertion target is keyed by its `@id`, which can be assigned after the fact;
+        # node targets are keyed by node id, which is fixed.
+        return not isinstance(self._target, assertion)
+
+    def _compute_skeleton(self):
         '''
-        Identity core used for merge (see `property_._skeleton`). An edge's target is part
+        Identity core used for merge (see `property_._compute_skeleton`). An edge's target is part
         of its skeleton. An identified assertion target is keyed by object identity (it is
         a distinct occurrence); an ordinary node target is keyed by its node id, so the
         same edge extracted from two sources — pointing at the same node — merges.
         '''
-        tgt = self.target
+        tgt = self._target
         if isinstance(tgt, assertion):
             # An identified assertion target is addressed by its explicit `@id` — the very
             # point of the id is that two edges naming it, from any source, point at the
@@ -210,7 +679,7 @@ class edge(assertion):
             target_key = ('assertion', tgt.id if tgt.id is not None else id(tgt))
         else:
             target_key = ('node', tgt.id if tgt is not None else None)
-        return ('edge', self.label, target_key)
+        return ('edge', self._label, target_key)
 
 
 def _absorb(keeper: assertion, other: assertion) -> None:
@@ -219,14 +688,12 @@ def _absorb(keeper: assertion, other: assertion) -> None:
     an interp it lacks (one-sided adoption), then `other`'s nested assertions are reparented
     onto the keeper. The caller re-merges the combined nested set.
     '''
-    if keeper.interp is None and other.interp is not None:
-        keeper.interp = other.interp
+    if keeper._interp is None and other._interp is not None:
+        keeper.interp = other._interp
     for p in other.properties:
-        p.origin = keeper
-        keeper.properties.add(p)
+        keeper._adopt(p)
     for e in other.edges:
-        e.origin = keeper
-        keeper.edges.add(e)
+        keeper._adopt(e)
 
 
 def _merge_identified(rows: list) -> list:
@@ -240,17 +707,17 @@ def _merge_identified(rows: list) -> list:
     keepers: dict = {}
     order: list = []
     for a in rows:
-        keeper = keepers.get(a.id)
+        keeper = keepers.get(a._id)
         if keeper is None:
-            keepers[a.id] = a
-            order.append(a.id)
+            keepers[a._id] = a
+            order.append(a._id)
             continue
         if keeper._skeleton != a._skeleton:
             raise GraphMergeError(
                 f'Assertions sharing id {a.id!r} have mismatched skeletons: '
                 f'{keeper._skeleton!r} vs {a._skeleton!r}'
             )
-        ki, ai = keeper.interp, a.interp
+        ki, ai = keeper._interp, a._interp
         if ki is not None and ai is not None and ki != ai:
             raise GraphMergeError(
                 f'Assertions sharing id {a.id!r} carry differing interpretations: '
@@ -279,13 +746,14 @@ def _merge_anonymous_skeleton_group(rows: list) -> list:
     interp_order: list = []
     nulls: list = []
     for r in rows:
-        if r.interp is None:
+        interp = r._interp
+        if interp is None:
             nulls.append(r)
             continue
-        keeper = by_interp.get(r.interp)
+        keeper = by_interp.get(interp)
         if keeper is None:
-            by_interp[r.interp] = r
-            interp_order.append(r.interp)
+            by_interp[interp] = r
+            interp_order.append(interp)
         else:
             _absorb(keeper, r)
     survivors = [by_interp[i] for i in interp_order]
@@ -308,25 +776,237 @@ def _merge_anonymous_skeleton_group(rows: list) -> list:
 def _merge_container(container) -> None:
     '''
     Collapse the direct child assertions of `container` (a node or an assertion) into one
-    occurrence each per the SPEC identity rules, then recurse into the survivors.
-    Order-independent and idempotent: re-running on an already-merged container is a no-op.
+    occurrence each per the SPEC identity rules, then descend into the survivors (with an
+    explicit stack, so reification chains may be arbitrarily deep). Order-independent and
+    idempotent: re-running on an already-merged container is a no-op. Assertions folded
+    away are detached from the owning graph, so its indexes drop them.
     '''
+    g = container._graph
+    container._before_change()
+    stack = [container]
+    while stack:  # explicit stack: reification chains may be arbitrarily deep
+        _merge_children(stack.pop(), g, stack)
+
+
+def _merge_children(container, g, pending: list) -> None:
+    '''Merge the direct children of `container`, queueing the survivors on `pending`.'''
     for attr in ('properties', 'edges'):
+        before = getattr(container, attr)
+        if not before:  # most assertions are leaves
+            continue
         identified: list = []
         anon_by_skeleton: dict = {}
-        for a in getattr(container, attr):
-            if a.id is not None:
+        for a in before:
+            if a._id is not None:
                 identified.append(a)
             else:
                 anon_by_skeleton.setdefault(a._skeleton, []).append(a)
+        if len(anon_by_skeleton) + len({a._id for a in identified}) == len(before):
+            pending.extend(before)  # no two children are the same assertion: nothing to fold
+            continue
 
-        kept = _merge_identified(identified)
+        kept = _merge_identified(identified) if identified else []
         for group in anon_by_skeleton.values():
             kept.extend(_merge_anonymous_skeleton_group(group))
 
-        setattr(container, attr, set(kept))
-        for a in kept:
-            _merge_container(a)
+        kept_set = set(kept)
+        setattr(container, attr, kept_set)
+        container._by_label = None  # rebuilt on the next lookup
+        if g is not None and len(kept_set) != len(before):
+            for a in before:
+                if a not in kept_set:
+                    g._detach(a)
+            for a in kept:
+                if a._id is not None:  # a same-id duplicate folded away: rebind the id to its keeper
+                    g.assertion_ids.setdefault(a._id, a)
+        pending.extend(kept)
+
+
+def _copy_node(n: node, copies: dict | None = None) -> node:
+    '''
+    A free-standing deep copy of `n`: its types and every nested assertion, with ids and
+    interps. Edge targets still reference the original target objects. With `copies`, each
+    copied assertion is recorded there as id(original) -> copy.
+    '''
+    c = node(n.id)
+    set.update(c._types, n._types)
+    stack = [(n, c)]
+    while stack:  # explicit stack: reification chains may be arbitrarily deep
+        src, dst = stack.pop()
+        for a in src.properties:
+            p = property_(dst, a._label, a._value)
+            p._id, p._interp = a._id, a._interp
+            dst.properties.add(p)
+            if copies is not None:
+                copies[id(a)] = p
+            if a.properties or a.edges:
+                stack.append((a, p))
+        for a in src.edges:
+            e = edge(dst, a._label, a._target)
+            e._id, e._interp = a._id, a._interp
+            dst.edges.add(e)
+            if copies is not None:
+                copies[id(a)] = e
+            if a.properties or a.edges:
+                stack.append((a, e))
+    return c
+
+
+def iter_assertions(containers: Iterable[node | assertion], *, snapshot: bool = True,
+                    deep: bool = True) -> Iterator[assertion]:
+    '''
+    Yield every assertion under each of `containers` (nodes or assertions), depth-first in
+    pre-order: a container's properties then its edges, each followed by everything nested
+    under it. Only first-level assertions when `deep` is False.
+
+    The walk keeps an explicit stack of iterators, so arbitrarily deep reification chains
+    cannot hit the recursion limit, and leaf assertions cost no allocation. By default each
+    container's assertions are snapshotted as it is entered, so the caller may add or remove
+    assertions mid-walk; pass `snapshot=False` to iterate the live sets when the caller will
+    not mutate any container during the walk.
+    '''
+    chain = _snapshot_children if snapshot else _live_children
+    for root in containers:
+        stack = [chain(root)]
+        while stack:
+            for a in stack[-1]:
+                yield a
+                if deep and (a.properties or a.edges):
+                    stack.append(chain(a))
+                break
+            else:
+                stack.pop()
+
+
+def _snapshot_children(container) -> Iterator[assertion]:
+    return iter((*container.properties, *container.edges))
+
+
+def _live_children(container) -> Iterator[assertion]:
+    yield from container.properties
+    yield from container.edges
+
+
+@dataclass
+class SelectPlan:
+    '''
+    The access path `graph.select()` chose for a pattern, as reported by `graph.explain()`.
+
+    `access` names the path: `'assertion_id'` (the `assertion_ids` map, for `id=`),
+    `'incoming'` (the incoming-edge index, for `target=`), `'origin'` (the origin container's
+    own assertions), `'value'` (the opt-in (label, value) index, for `value=`), `'label'` (the
+    graph-wide label index), or `'scan'` (walk every node).
+    `estimate` is the number of candidates the path yields before the remaining constraints
+    filter them; for a scan it is read off `graph.stats()` when a current catalogue is cached,
+    else None. `considered` lists every `(access, estimate)` weighed.
+    '''
+    access: str
+    estimate: int | None
+    considered: list
+    _candidates: Callable[[], Iterable[assertion]] = field(default=list, repr=False, compare=False)
+
+
+@dataclass
+class InternStats:
+    '''
+    What the IRI interning table of a `graph` holds and saves, as reported by
+    `graph.memory_stats()`.
+
+    `distinct` is the number of distinct IRIs/ids in the table and `table_bytes` their
+    footprint (strings plus the table itself). `shared` counts the references that were
+    pointed at an already-interned object instead of keeping their own equal copy, and
+    `bytes_saved` estimates the string memory those duplicates would otherwise hold.
+    '''
+    distinct: int
+    shared: int
+    table_bytes: int
+    bytes_saved: int
+
+
+@dataclass(frozen=True)
+class ChangeRecord:
+    '''
+    One entry of a graph's change journal (see `graph.enable_journal()`). `version` is the
+    graph's `version` once the change was made. `op` and the meaning of `old`/`new`:
+
+    - `'add_node'` / `'remove_node'`: `subject` is the node.
+    - `'add'` / `'remove'`: `subject` is the assertion, with everything nested under it. For
+      `'remove'`, `old` is the container it was removed from.
+    - `'move'`: `merge()` reparented `subject` from container `old` to container `new`.
+    - `'types'`: `subject` is the node; `new` holds the types added, `old` those removed.
+    - `'label'`, `'value'`, `'target'`, `'id'`, `'interp'`: `subject` is the assertion,
+      with the previous and current component in `old` and `new`.
+    '''
+    version: int
+    op: str
+    subject: object
+    old: object = None
+    new: object = None
+
+
+@dataclass
+class LabelStats:
+    '''
+    Figures for one label in a `GraphStats` catalogue. `assertions` counts occurrences at
+    any depth, split into `properties` and `edges`. `origins` is the number of distinct
+    containers carrying the label, `targets` the number of distinct edge targets, and
+    `values` the number of distinct property values.
+    '''
+    assertions: int = 0
+    properties: int = 0
+    edges: int = 0
+    origins: int = 0
+    targets: int = 0
+    values: int = 0
+
+    @property
+    def out_degree(self) -> float:
+        '''Average number of these assertions on a container that has any.'''
+        return self.assertions / self.origins if self.origins else 0.0
+
+    @property
+    def in_degree(self) -> float:
+        '''Average number of these edges arriving at a target that has any.'''
+        return self.edges / self.targets if self.targets else 0.0
+
+
+@dataclass
+class GraphStats:
+    '''
+    A statistics catalogue of a `graph`, as reported by `graph.stats()`: the figures a
+    query planner needs for cardinality estimates and capacity planning needs for sizing.
+
+    `nodes` counts nodes, `assertions` assertions at any depth and `top_level` those whose
+    origin is a node. `labels` maps each label to its `LabelStats`, and `types` maps each
+    type IRI to the number of nodes carrying it. `version` is the graph's mutation count
+    when the catalogue was taken. The catalogue is a snapshot, so treat it as read-only.
+    '''
+    nodes: int = 0
+    assertions: int = 0
+    top_level: int = 0
+    labels: dict = field(default_factory=dict)
+    types: dict = field(default_factory=dict)
+    version: int = 0
+
+    def label(self, label: I | str) -> LabelStats:
+        '''The figures for `label` (all zero if it does not occur).'''
+        return self.labels.get(label) or LabelStats()
+
+    @property
+    def out_degree(self) -> float:
+        '''Average number of first-level assertions per node.'''
+        return self.top_level / self.nodes if self.nodes else 0.0
+
+
+def _target_key(tgt):
+    '''
+    Key under which the incoming-edge index files an edge target: its id (a node id, or an
+    identified assertion's `@id`), else the object itself for an anonymous in-memory
+    assertion target. None for an unresolved (pending) target.
+    '''
+    if tgt is None:
+        return None
+    return tgt.id if tgt.id is not None else tgt
 
 
 class graph(MutableMapping):
@@ -334,23 +1014,81 @@ class graph(MutableMapping):
     A collection of nodes managed and queried together.
 
     This is the top-level container for an Onya graph.
+
+    The graph maintains an incoming-edge index (target id -> label -> edges, covering edges
+    at every depth) so that "who points at X" questions — `node.reverse()`,
+    `select(target=...)` — cost time proportional to the answer, and a type index (type IRI
+    -> node ids) that does the same for `typematch()`. The indexes follow every mutation made
+    through the model API: `add_edge`/`remove_edge` (and their property counterparts), edge
+    retargeting, changes to a node's `types`, adding or deleting nodes, `union()` and `merge()`.
     '''
     def __init__(self, nodes: list[node] = ()):
         self.nodes: dict[I | str, node] = {}
-        self.nodes.update({n.id: n for n in nodes})
         # Explicit assertion identifiers (see SPEC: Assertion Identifiers), sharing the
         # node id space. Maps id -> assertion, so an identified assertion can be an edge target.
         self.assertion_ids: dict[I | str, assertion] = {}
+        # Incoming-edge index: target key (see `_target_key`) -> label -> set of edges.
+        self._incoming: dict = {}
+        # Type index: type IRI -> node ids carrying it (a dict used as an insertion-ordered set).
+        self._by_type: dict = {}
+        # Graph-wide label index: label -> assertions (any depth). Built by the first
+        # label-driven `select()` and maintained from then on; None until needed.
+        self._assertions_by_label: dict | None = None
+        # Opt-in property value index (see `enable_value_index`): (label, value) -> properties,
+        # plus label -> sorted distinct string values for prefix/range scans. None while off.
+        self._values: dict | None = None
+        self._sorted_values: dict | None = None
+        # IRI interning table (see `intern`): value -> the one shared object for it.
+        self._iris: dict = {}
+        self._shared_iris = 0
+        self._shared_bytes = 0
+        # Ids of nodes whose subtree changed since it was last merged (see `dirty`). None until
+        # the first merge: every node counts as dirty then, so inserts record nothing.
+        self._dirty: set | None = None
+        # Bumped by every index-maintenance hook below; derived caches (e.g. the path
+        # reachability memo, see `path()`) compare it to tell whether they are still current.
+        self._mutations = 0
+        self._reach_memo: dict = {}
+        self._reach_at = 0
+        self._stats: GraphStats | None = None
+        # Opt-in change journal (see `enable_journal`) and its subscribers; None while off.
+        self._journal: list | None = None
+        self._listeners: list = []
+        # Open `snapshot()` views, told about each node just before it first changes; None
+        # until the first snapshot is taken.
+        self._snapshots: weakref.WeakSet | None = None
+        # Reader/writer lock while in thread-safe mode (see `enable_thread_safety`), else None.
+        # `_graph` names the lock's owner as it does on nodes and assertions, so `_writes` and
+        # `_reads` serve graph methods too.
+        self._rwlock: RWLock | None = None
+        self._graph = self
+        for n in nodes:
+            self[n.id] = n
 
     def __getitem__(self, key: I | str) -> node:
         return self.nodes[key]
 
+    @_writes
     def __delitem__(self, nid: I | str) -> None:
-        del self.nodes[nid]
+        if self._snapshots and nid in self.nodes:
+            self._preserve(nid)
+        nobj = self.nodes.pop(nid)
+        self._detach_node(nobj)
 
+    @_writes
     def __setitem__(self, nid: I | str, nobj: node) -> None:
+        nid = self.intern(nid)
+        existing = self.nodes.get(nid)
+        if existing is nobj:
+            return
+        if self._snapshots:
+            self._preserve(nid)
+        if existing is not None:
+            self._detach_node(existing)
         self.nodes[nid] = nobj
+        self._attach_node(nobj)
 
+    @_reads
     def __iter__(self) -> Iterator[I | str]:
         return iter(self.nodes)
 
@@ -368,6 +1106,187 @@ class graph(MutableMapping):
         self[nid] = n
         return n
 
+    def intern(self, value, factory: Callable | None = None):
+        '''
+        Return the graph's one shared object equal to `value` (an IRI label, type, node id or
+        assertion id), recording `value` as that object if it is new. Every label, type and id
+        that enters the graph — through the model API, the Literate parser, the SQL stores or
+        `union()` — is interned, so a graph with millions of assertions over a few hundred
+        labels holds each label string once.
+
+        With `factory` (e.g. `I`), `value` is raw text: a hit returns the shared object without
+        constructing anything, and a miss interns `factory(value)`. An equal value of a
+        different type (a plain `str` id against an `I`) is left as is. Non-strings pass
+        through. The table only grows; see `memory_stats()`.
+        '''
+        if not isinstance(value, str):
+            return value
+        found = self._iris.get(value)
+        if found is None:
+            found = value if factory is None or isinstance(value, factory) else factory(value)
+            self._iris[found] = found
+            return found
+        if found is value:
+            return found
+        if type(found) is not (factory or type(value)):
+            return value if factory is None else factory(value)
+        self._shared_iris += 1
+        self._shared_bytes += sys.getsizeof(value)
+        return found
+
+    def memory_stats(self) -> InternStats:
+        '''Report the size of the IRI interning table and what it has saved (see `intern`).'''
+        table_bytes = sys.getsizeof(self._iris) + sum(sys.getsizeof(v) for v in self._iris)
+        return InternStats(len(self._iris), self._shared_iris, table_bytes, self._shared_bytes)
+
+    @_reads
+    def stats(self) -> GraphStats:
+        '''
+        The graph's statistics catalogue (see `GraphStats`): label frequencies, per-type
+        node counts, average out/in degree per label and distinct value counts. The
+        catalogue is computed in one walk and cached until the graph next changes through
+        the model API, so repeated calls between mutations cost nothing. `explain()` uses a
+        current catalogue to cost a scan, and the `graph.query()` planner uses it to
+        estimate join fan-out.
+
+            >>> g.stats().label(KNOWS).out_degree
+            1.5
+        '''
+        cached = self._stats
+        if cached is not None and cached.version == self._mutations:
+            return cached
+        per_label: dict = {}
+        origins: dict = {}
+        targets: dict = {}
+        values: dict = {}
+        total = 0
+        for a in iter_assertions(self.nodes.values(), snapshot=False):
+            total += 1
+            ls = per_label.get(a._label)
+            if ls is None:
+                ls = per_label[a._label] = LabelStats()
+                origins[a._label], targets[a._label], values[a._label] = set(), set(), set()
+            ls.assertions += 1
+            origins[a._label].add(id(a.origin))
+            if isinstance(a, edge):
+                ls.edges += 1
+                key = _target_key(a._target)
+                if key is not None:
+                    targets[a._label].add(key if isinstance(key, str) else id(key))
+            else:
+                ls.properties += 1
+                values[a._label].add(a._value)
+        for label, ls in per_label.items():
+            ls.origins, ls.targets, ls.values = len(origins[label]), len(targets[label]), len(values[label])
+        top_level = sum(len(n.properties) + len(n.edges) for n in self.nodes.values())
+        types = {t: len(nids) for t, nids in self._by_type.items()}
+        self._stats = GraphStats(len(self.nodes), total, top_level, per_label, types, self._mutations)
+        return self._stats
+
+    @property
+    def version(self) -> int:
+        '''
+        A counter that grows with every change made through the model API. It is monotonic,
+        so a consumer can remember it and later ask `changes(since=...)` what happened.
+        '''
+        return self._mutations
+
+    def enable_journal(self) -> 'graph':
+        '''
+        Start recording an append-only change journal: one `ChangeRecord` per node added or
+        removed, assertion added, removed or moved, and type, label, value, target, id or
+        interp change. Every mutation path feeds it, including `union()`, `merge()` and the
+        Literate parser, which build through the model API. Derived structures can then
+        follow the graph incrementally instead of rescanning it. Idempotent.
+        '''
+        if self._journal is None:
+            self._journal = []
+        return self
+
+    def disable_journal(self) -> 'graph':
+        '''Stop recording and drop the journal. Subscribers are dropped too.'''
+        self._journal = None
+        self._listeners = []
+        return self
+
+    def changes(self, since: int = 0) -> list[ChangeRecord]:
+        '''Journal records made after version `since` (all of them by default), oldest first.'''
+        journal = self._journal or []
+        i = len(journal)
+        while i and journal[i - 1].version > since:
+            i -= 1
+        return journal[i:]
+
+    def truncate_journal(self, upto: int) -> None:
+        '''Discard journal records at or before version `upto`, once every consumer has seen them.'''
+        if self._journal:
+            self._journal[:] = self.changes(since=upto)
+
+    def subscribe(self, listener: Callable[[ChangeRecord], None]) -> None:
+        '''
+        Call `listener` with each `ChangeRecord` as it is journaled (enabling the journal).
+        Listeners run synchronously inside the mutation, so they must not mutate the graph.
+        '''
+        self.enable_journal()
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[ChangeRecord], None]) -> None:
+        self._listeners.remove(listener)
+
+    def _log(self, op: str, subject, old=None, new=None) -> None:
+        rec = ChangeRecord(self._mutations, op, subject, old, new)
+        self._journal.append(rec)
+        for listener in self._listeners:
+            listener(rec)
+
+    def enable_thread_safety(self) -> 'graph':
+        '''
+        Switch to thread-safe mode: a reader/writer lock (`onya.rwlock.RWLock`) guards the node
+        table and the containers of every node and assertion this graph owns. Each mutation
+        through the model API (`add_*`/`remove_*`, the label, value, target, id and interp
+        setters, `types` changes, `g[nid] = n`, `del g[nid]`, `union()`, `merge()`, `apply()`)
+        holds the write lock. The query methods (`select()`, `match()`, `typematch()`,
+        `valuematch()`, `query()`, `path()`, `getprop()`, `getedge()`, `reverse()`, iteration,
+        `stats()`, `explain()`, `copy()`, `diff()`, `freeze()`) hold the read lock, and those
+        that return iterators collect their results first, so callers iterate a stable list
+        while writers proceed. Direct access to the raw sets (`n.properties`, `n.types`, ...)
+        and to `nodes` is not guarded: wrap it in `with g.reading():`.
+
+        Off by default, and free while off: the model classes carry their plain methods until
+        some graph in the process enables the mode, and get them back once none is left in it
+        (each having been disabled or garbage collected). Meanwhile each call on any graph pays
+        one attribute check. Idempotent.
+        '''
+        with _thread_safe_guard:
+            if self._rwlock is None:
+                self._rwlock = RWLock()
+                weakref.finalize(self, _release_locking).atexit = False
+            if _none_thread_safe():
+                _set_locking(True)
+            _thread_safe[id(self)] = self
+        return self
+
+    def disable_thread_safety(self) -> 'graph':
+        '''Leave thread-safe mode. Call it only while no other thread is using the graph.'''
+        with _thread_safe_guard:
+            self._rwlock = None
+            _thread_safe.pop(id(self), None)
+            if _none_thread_safe():
+                _set_locking(False)
+        return self
+
+    def reading(self) -> AbstractContextManager:
+        '''
+        Hold the read lock for a compound read, or around direct access to the raw sets (a no-op
+        outside thread-safe mode).
+        '''
+        return self._rwlock.reading() if self._rwlock is not None else nullcontext(self)
+
+    def writing(self) -> AbstractContextManager:
+        '''Hold the write lock across several mutations (a no-op outside thread-safe mode).'''
+        return self._rwlock.writing() if self._rwlock is not None else nullcontext(self)
+
+    @_writes
     def register_assertion_id(self, id_: I | str, assertion_obj: assertion) -> assertion:
         '''
         Bind an explicit identifier to an assertion, enforcing uniqueness among
@@ -376,6 +1295,7 @@ class graph(MutableMapping):
         to a different assertion. (Collision against node ids shares the same id space
         and is validated separately once all nodes and ids are known.)
         '''
+        id_ = self.intern(id_)
         existing = self.assertion_ids.get(id_)
         if existing is not None and existing is not assertion_obj:
             raise AssertionIdConflict(f'Assertion id {id_!r} is already assigned to another assertion')
@@ -383,7 +1303,233 @@ class graph(MutableMapping):
         self.assertion_ids[id_] = assertion_obj
         return assertion_obj
 
-    def merge(self) -> 'graph':
+    # --- index maintenance ---------------------------------------------------------
+
+    def _attach_node(self, nobj: node) -> None:
+        '''Take ownership of `nobj` and index every assertion under it.'''
+        self._mutations += 1
+        if self._journal is not None:
+            self._log('add_node', nobj)
+        nobj._graph = self
+        nobj.id = self.intern(nobj.id)
+        if self._dirty is not None:
+            self._dirty.add(nobj.id)
+        types = nobj._types
+        if types:
+            shared = [self.intern(t) for t in types]
+            set.clear(types)  # re-fill in place with the shared objects, bypassing change reports
+            set.update(types, shared)
+        self._retype(nobj, types, ())
+        for a in nobj.properties:
+            self._attach(a)
+        for a in nobj.edges:
+            self._attach(a)
+
+    def _detach_node(self, nobj: node) -> None:
+        '''Release `nobj` (if owned here) and drop its assertions from the indexes.'''
+        if nobj._graph is not self:
+            return
+        self._mutations += 1
+        if self._journal is not None:
+            self._log('remove_node', nobj)
+        self._retype(nobj, (), nobj.types)
+        for a in nobj.properties:
+            self._detach(a)
+        for a in nobj.edges:
+            self._detach(a)
+        nobj._graph = None
+
+    def _retype(self, nobj: node, added, removed) -> None:
+        '''Follow a change to the types of `nobj` (a node owned by this graph).'''
+        self._mutations += 1
+        if self._journal is not None and (added or removed):
+            self._log('types', nobj, tuple(removed), tuple(added))
+        for t in added:
+            self._by_type.setdefault(t, {})[nobj.id] = None
+        for t in removed:
+            nids = self._by_type.get(t)
+            if nids is not None:
+                nids.pop(nobj.id, None)
+                if not nids:
+                    del self._by_type[t]
+
+    def _attach(self, a: assertion) -> None:
+        '''Record that assertion `a` (with everything nested under it) is now part of this graph.'''
+        self._mutations += 1
+        if self._journal is not None:
+            self._log('add', a)
+        stack = [a]
+        while stack:  # explicit stack: reification chains may be arbitrarily deep
+            a = stack.pop()
+            a._graph = self
+            a._label = self.intern(a._label)
+            if a._id is not None:
+                a._id = self.intern(a._id)
+            if a._interp is not None:
+                a._interp = self.intern(a._interp)
+            if isinstance(a, edge):
+                self._index_incoming(a)
+            if a.id is not None:
+                self.assertion_ids.setdefault(a.id, a)
+            if self._assertions_by_label is not None:
+                self._assertions_by_label.setdefault(a.label, set()).add(a)
+            if self._values is not None and isinstance(a, property_):
+                self._index_value(a, a.label, a.value)
+            stack.extend(a.properties)
+            stack.extend(a.edges)
+
+    def _detach(self, a: assertion) -> None:
+        '''
+        Record that assertion `a` has left this graph, along with the nested assertions that
+        still belong to it. A child whose `origin` has already moved elsewhere (reparented by
+        `merge()`) is left alone.
+        '''
+        if a._graph is not self:
+            return
+        self._mutations += 1
+        if self._journal is not None:
+            self._log('remove', a, a.origin)
+        stack = [a]
+        while stack:
+            a = stack.pop()
+            if a._graph is not self:
+                continue
+            if isinstance(a, edge):
+                self._unindex_incoming(a, a.target)
+            if a._id is not None and self.assertion_ids.get(a._id) is a:
+                del self.assertion_ids[a._id]
+            if self._assertions_by_label is not None:
+                _discard_labelled(self._assertions_by_label, a)
+            if self._values is not None and isinstance(a, property_):
+                self._unindex_value(a, a.label, a.value)
+            a._graph = None
+            if a.properties:
+                stack.extend(child for child in a.properties if child.origin is a)
+            if a.edges:
+                stack.extend(child for child in a.edges if child.origin is a)
+
+    def _touch(self, container: node | assertion) -> None:
+        '''Mark the node at the top of `container`'s origin chain as needing a merge.'''
+        if self._dirty is not None:
+            self._dirty.add(container._root.id)
+
+    def _reidentify(self, a: assertion, old_id, new_id) -> None:
+        '''Follow an assertion whose explicit `id` was (re)assigned.'''
+        self._mutations += 1
+        if self._journal is not None:
+            self._log('id', a, old_id, new_id)
+        self._touch(a)
+        if old_id is not None and self.assertion_ids.get(old_id) is a:
+            del self.assertion_ids[old_id]
+        if new_id is not None:
+            self.assertion_ids.setdefault(new_id, a)
+
+    def _reinterp(self, a: assertion, old_interp, new_interp) -> None:
+        '''Follow an assertion whose `interp` was changed.'''
+        self._mutations += 1
+        if self._journal is not None:
+            self._log('interp', a, old_interp, new_interp)
+        self._touch(a)
+
+    def _relabel(self, a: assertion, old_label, new_label) -> None:
+        '''Follow an assertion whose `label` was changed.'''
+        self._mutations += 1
+        if self._journal is not None:
+            self._log('label', a, old_label, new_label)
+        self._touch(a)
+        if isinstance(a, edge):
+            self._unindex_incoming(a, a.target, old_label)
+            self._index_incoming(a)
+        elif self._values is not None:
+            self._unindex_value(a, old_label, a.value)
+            self._index_value(a, new_label, a.value)
+        if self._assertions_by_label is not None:
+            bucket = self._assertions_by_label.get(old_label)
+            if bucket is not None:
+                bucket.discard(a)
+                if not bucket:
+                    del self._assertions_by_label[old_label]
+            self._assertions_by_label.setdefault(new_label, set()).add(a)
+
+    def _revalue(self, p: property_, old_value, new_value) -> None:
+        '''Follow a property whose `value` was changed.'''
+        self._mutations += 1
+        if self._journal is not None:
+            self._log('value', p, old_value, new_value)
+        self._touch(p)
+        if self._values is not None:
+            self._unindex_value(p, p.label, old_value)
+            self._index_value(p, p.label, new_value)
+
+    def _index_value(self, p: property_, label, value) -> None:
+        bucket = self._values.get((label, value))
+        if bucket is None:
+            bucket = self._values[(label, value)] = set()
+            if isinstance(value, str):
+                insort(self._sorted_values.setdefault(label, []), value)
+        bucket.add(p)
+
+    def _unindex_value(self, p: property_, label, value) -> None:
+        bucket = self._values.get((label, value))
+        if bucket is None:
+            return
+        bucket.discard(p)
+        if not bucket:
+            del self._values[(label, value)]
+            ordered = self._sorted_values.get(label)
+            if ordered is not None and isinstance(value, str):
+                i = bisect_left(ordered, value)
+                if i < len(ordered) and ordered[i] == value:
+                    del ordered[i]
+                if not ordered:
+                    del self._sorted_values[label]
+
+    def _retarget(self, e: edge, old_target, new_target) -> None:
+        '''Follow an edge whose `target` was rebound.'''
+        if _target_key(old_target) == _target_key(new_target):
+            return
+        self._mutations += 1
+        if self._journal is not None:
+            self._log('target', e, old_target, new_target)
+        self._touch(e)
+        self._unindex_incoming(e, old_target)
+        self._index_incoming(e)
+
+    def _index_incoming(self, e: edge) -> None:
+        key = _target_key(e.target)
+        if key is None:  # target not resolved yet; indexed when it is bound
+            return
+        self._incoming.setdefault(key, {}).setdefault(e.label, set()).add(e)
+
+    def _unindex_incoming(self, e: edge, target, label=None) -> None:
+        key = _target_key(target)
+        by_label = self._incoming.get(key)
+        if by_label is None:
+            return
+        label = e.label if label is None else label
+        edges = by_label.get(label)
+        if edges is None:
+            return
+        edges.discard(e)
+        if not edges:
+            del by_label[label]
+            if not by_label:
+                del self._incoming[key]
+
+    def _incoming_edges(self, key, label: I | str | None = None) -> list[edge]:
+        '''
+        Edges (at any depth) whose target key is `key`, optionally restricted to `label`.
+        Returned as a fresh list, so the caller may mutate the graph while iterating.
+        '''
+        by_label = self._incoming.get(key)
+        if not by_label:
+            return []
+        if label is not None:
+            return list(by_label.get(label, ()))
+        return [e for edges in by_label.values() for e in edges]
+
+    @_writes
+    def merge(self, containers: Iterable[node | assertion] | None = None) -> 'graph':
         '''
         Normalize the graph by collapsing duplicate assertions into a single occurrence,
         per the SPEC identity rules (idempotent graph union). Anonymous assertions with
@@ -394,69 +1540,94 @@ class graph(MutableMapping):
         This is an **explicit, on-demand** operation — never called automatically.
         Parsing several overlapping documents into one graph accumulates their assertions
         as distinct occurrences; they collapse only when a consumer calls `merge()`.
+
+        `containers` restricts the pass to the given nodes/assertions (and everything nested
+        under them); pass `self.dirty` to re-merge only what changed since the last merge.
+        Skeletons are cached per assertion, so re-merging an unchanged container is cheap.
         '''
-        for n in self.nodes.values():
-            _merge_container(n)
+        if containers is None:
+            targets = list(self.nodes.values())
+            self._dirty = set()
+        else:
+            targets = list(containers)
+            if self._dirty is None:  # never merged: every node is dirty until this pass takes it
+                self._dirty = set(self.nodes)
+        for c in targets:
+            _merge_container(c)
+            if isinstance(c, node) and self.nodes.get(c.id) is c:
+                self._dirty.discard(c.id)
         return self
 
-    def _iter_assertions(self) -> Iterator[assertion]:
-        '''Yield every assertion in the graph, recursively (properties then edges).'''
-        def rec(container):
-            for a in list(container.properties):
-                yield a
-                yield from rec(a)
-            for a in list(container.edges):
-                yield a
-                yield from rec(a)
-        for n in self.nodes.values():
-            yield from rec(n)
+    @property
+    @_reads
+    def dirty(self) -> list[node]:
+        '''
+        Nodes whose assertions (at any depth) were added, relabelled, revalued, retargeted,
+        re-identified or re-interpreted through the model API since the node was last merged
+        — the minimal argument to `merge()` for an already-merged graph. A node added to the
+        graph counts as dirty until merged.
+        '''
+        if self._dirty is None:
+            return list(self.nodes.values())
+        return [self.nodes[nid] for nid in list(self._dirty) if nid in self.nodes]
 
-    def _rebind_node_targets(self) -> None:
+    @_reads
+    def _iter_assertions(self, *, snapshot: bool = True) -> Iterator[assertion]:
+        '''Yield every assertion in the graph, at any depth (see `iter_assertions`).'''
+        return iter_assertions(list(self.nodes.values()), snapshot=snapshot)
+
+    def _rebind_node_targets(self, ids: Iterable[I | str] | None = None) -> None:
         '''
         Point every node-valued edge target at this graph's canonical node object for that
         id. After a `union`, edges brought in from the other graph still reference the other
         graph's node objects; rebinding keeps traversal and `reverse()` consistent. Edge
-        targets that are identified assertions are handled in `_reindex_assertion_ids`.
-        '''
-        for a in self._iter_assertions():
-            if isinstance(a, edge):
-                tgt = a.target
-                if tgt is not None and not isinstance(tgt, assertion):
-                    canon = self.nodes.get(tgt.id)
-                    if canon is not None:
-                        a.target = canon
+        targets that are identified assertions are handled in `_rebind_assertion_targets`.
 
-    def _reindex_assertion_ids(self) -> None:
+        With `ids`, only edges targeting those ids are visited (via the incoming-edge index).
         '''
-        Rebuild `assertion_ids` from the assertions that actually survive in the graph, then
-        rebind any edge pointing at an identified assertion to the surviving occurrence. A
-        `merge()` collapses same-id duplicates onto one keeper; this makes the id index and
-        edge targets agree with that keeper.
+        if ids is None:
+            edges = (a for a in self._iter_assertions(snapshot=False) if isinstance(a, edge))
+        else:
+            edges = (e for nid in ids if nid in self.nodes for e in self._incoming_edges(nid))
+        for e in list(edges):
+            tgt = e.target
+            if tgt is not None and not isinstance(tgt, assertion):
+                canon = self.nodes.get(tgt.id)
+                if canon is not None and canon is not tgt:
+                    e.target = canon
+
+    def _rebind_assertion_targets(self, ids: Iterable[I | str]) -> None:
         '''
-        surviving: dict[I | str, assertion] = {}
-        for a in self._iter_assertions():
-            if a.id is not None:
-                surviving[a.id] = a
-        self.assertion_ids = surviving
-        for a in self._iter_assertions():
-            if isinstance(a, edge) and isinstance(a.target, assertion) and a.target.id is not None:
-                canon = surviving.get(a.target.id)
-                if canon is not None:
-                    a.target = canon
+        Point edges that target one of the given assertion ids at the occurrence that survived
+        `merge()`. `assertion_ids` itself is kept current by attach/detach and `merge()` (which
+        rebinds a folded-away id to its keeper), so only the edges need visiting.
+        '''
+        for aid in ids:
+            canon = self.assertion_ids.get(aid)
+            if canon is None:
+                continue
+            for e in self._incoming_edges(aid):
+                if isinstance(e.target, assertion) and e.target is not canon:
+                    e.target = canon
 
-    def validate_id_space(self) -> None:
+    def validate_id_space(self, ids: Iterable[I | str] | None = None) -> None:
         '''
         Enforce the shared identifier space (SPEC: Assertion Identifiers): no explicit
         assertion `@id` may equal a node id. Raises `AssertionIdConflict` listing the
         offending ids. The parser checks this at parse time; the store write path calls it
         so a graph assembled programmatically (or by `union`) cannot persist a collision.
+        With `ids`, only those ids are checked (`union` passes the ids the other graph brings).
         '''
-        collisions = set(self.assertion_ids) & set(self.nodes)
+        if ids is None:
+            collisions = set(self.assertion_ids) & set(self.nodes)
+        else:
+            collisions = {i for i in ids if i in self.assertion_ids and i in self.nodes}
         if collisions:
             raise AssertionIdConflict(
                 f'Assertion id(s) collide with node id(s): {sorted(map(str, collisions))}'
             )
 
+    @_writes
     def union(self, other: 'graph') -> 'graph':
         '''
         Merge `other` into this graph, in place, and normalize per the SPEC identity rules —
@@ -467,6 +1638,12 @@ class graph(MutableMapping):
         assertions are collapsed by `merge()`, so the result is observationally identical to
         parsing both sources into one graph and calling `merge()`.
 
+        The work is confined to the frontier `other` touches: target rebinding visits only
+        edges (found through the incoming-edge index) pointing at ids `other` holds or
+        references, the id-space check covers only ids `other` brings in, and only nodes
+        touched since their last merge are re-merged (see `dirty`) — so folding a small delta
+        into a large graph costs time proportional to the delta, not to the graph.
+
         Raises `GraphMergeError` on a Rule 1 violation (same `@id`, mismatched skeleton or
         conflicting non-absent interp) and `AssertionIdConflict` on a node-id vs
         assertion-id collision.
@@ -476,35 +1653,209 @@ class graph(MutableMapping):
         Pass a throwaway (e.g. a freshly parsed copy) when the argument must survive; the
         store backends do exactly this so a caller's graph is never mutated.
         '''
+        # Frontier: every id `other` defines or points at.
+        frontier_ids = set(other.nodes) | set(other.assertion_ids)
+        frontier_ids.update(k for k in other._incoming if isinstance(k, str))
         for nid, onode in other.nodes.items():
             keeper = self.nodes.get(nid)
             if keeper is None:
-                self.nodes[nid] = onode
+                self[nid] = onode
                 continue
             keeper.types |= set(onode.types)
+            if onode.properties or onode.edges:
+                self._touch(keeper)
             for p in list(onode.properties):
-                p.origin = keeper
-                keeper.properties.add(p)
+                keeper._adopt(p)
+                self._attach(p)
             for e in list(onode.edges):
-                e.origin = keeper
-                keeper.edges.add(e)
+                keeper._adopt(e)
+                self._attach(e)
         for aid, a in other.assertion_ids.items():
             self.assertion_ids.setdefault(aid, a)
-        self._rebind_node_targets()
-        self.validate_id_space()
-        self.merge()
-        self._reindex_assertion_ids()
+        self._rebind_node_targets(frontier_ids)
+        self.validate_id_space(frontier_ids)
+        dirty = self.dirty
+        # Identified assertions under a dirty node may be folded onto a same-id keeper.
+        frontier_ids.update(a.id for a in iter_assertions(dirty, snapshot=False) if a.id is not None)
+        self.merge(dirty)  # nodes untouched since the last merge are already normal
+        self._rebind_assertion_targets(frontier_ids)
         return self
 
+    def snapshot(self) -> 'graph_snapshot':
+        '''
+        Return a read-only, copy-on-write view of this graph as it stands now
+        (`onya.snapshot.graph_snapshot`). Taking one is O(1): the view shares the live node
+        table, and a node is copied into it at most once — the first time a reader asks for
+        it, or just before the live graph first changes it, whichever comes first. Readers
+        on other threads therefore never see a write made after the snapshot, and writers
+        never wait on a reader beyond that one copy. Close the view (or let it be collected)
+        to stop the live graph reporting changes to it.
+        '''
+        from onya.snapshot import graph_snapshot
+        return graph_snapshot(self)
+
+    @_reads
+    def copy(self) -> 'graph':
+        '''
+        A structural deep copy: every node, nested assertion, type, id and interp is cloned,
+        and edge targets are rebound to the copy's own nodes and assertions. Nothing is
+        shared with this graph, so the copy can be handed to `union()` (which consumes its
+        argument) or mutated freely. An edge target outside this graph (a node never added
+        to it) is cloned too. The copy keeps this graph's `assertion_ids` bindings, its
+        pending-merge state (`dirty`) and whether the value index is enabled.
+        '''
+        copies: dict = {}  # id(original assertion) -> copy
+        nodes = {nid: _copy_node(n, copies) for nid, n in self.nodes.items()}
+        strays: dict = {}  # id(target node outside this graph) -> its copy
+
+        def counterpart(tgt):
+            if isinstance(tgt, assertion):
+                return copies.get(id(tgt), tgt)
+            if self.nodes.get(tgt.id) is tgt:
+                return nodes[tgt.id]
+            found = strays.get(id(tgt))
+            if found is None:
+                found = strays[id(tgt)] = _copy_node(tgt, copies)
+            return found
+
+        pending = list(nodes.values())
+        while pending:  # stray targets are cloned on the way and their edges rebound in turn
+            n = pending.pop()
+            for a in iter_assertions((n,), snapshot=False):
+                if isinstance(a, edge) and a._target is not None:
+                    known = len(strays)
+                    a._target = counterpart(a._target)
+                    if len(strays) > known:
+                        pending.append(a._target)
+
+        g = graph()
+        if self._values is not None:
+            g.enable_value_index()
+        for nid, n in nodes.items():
+            g[nid] = n
+        g.assertion_ids = {aid: copies[id(a)] for aid, a in self.assertion_ids.items() if id(a) in copies}
+        g._dirty = None if self._dirty is None else set(self._dirty)
+        return g
+
+    @_reads
+    def diff(self, other: 'graph') -> 'GraphDelta':
+        '''
+        The minimal delta (`onya.delta.GraphDelta`) that turns this graph into `other`. It
+        records nodes added and removed, type changes, assertions added (with their nested
+        assertions) and removed, and interp adoptions. Assertions are paired by explicit id,
+        else by skeleton and interp. The delta is plain data; ship it and `apply()` it to a
+        replica of this graph.
+        '''
+        from onya.delta import diff
+        return diff(self, other)
+
+    @_writes
+    def apply(self, delta: 'GraphDelta') -> 'graph':
+        '''
+        Patch this graph in place with `delta` (from `diff()`), in time proportional to the
+        delta. Raises `onya.delta.DeltaConflict` if the delta addresses something this graph
+        lacks.
+        '''
+        from onya.delta import apply
+        return apply(self, delta)
+
+    def _preserve(self, nid: I | str) -> None:
+        '''Hand every open snapshot that still shares node `nid` its current state (see `snapshot`).'''
+        copied: list = []  # one copy serves every snapshot that needs it
+        for snap in list(self._snapshots):
+            snap._preserve(nid, copied)
+
+    @_reads
+    def freeze(self) -> 'frozen_graph':
+        '''
+        Return an immutable, columnar copy of this graph (`onya.frozen.frozen_graph`): ids,
+        labels and values integer-coded into parallel arrays, with CSR offsets for nesting, at
+        a fraction of the memory of the object model. It answers `select()`, `match()`,
+        `typematch()` and traversal; `thaw()` turns it back into a `graph`. Later changes to
+        this graph are not reflected in it.
+        '''
+        from onya.frozen import frozen_graph
+        return frozen_graph(self)
+
+    @_reads
     def typematch(self, types: I | str | set[I | str]) -> Iterator[node]:
-        '''Find nodes with matching types'''
+        '''
+        Find nodes with matching types (any of `types`). Answered from the type index, in
+        time proportional to the number of matching nodes.
+        '''
         if isinstance(types, (str, I)):
             types = {types}
-        types_set = set(types)
-        for n in self.nodes.values():
-            if n.types & types_set:
+        buckets = [self._by_type[t] for t in set(types) if t in self._by_type]
+        if len(buckets) == 1:
+            nids = list(buckets[0])
+        else:
+            nids = list(dict.fromkeys(nid for b in buckets for nid in b))
+        for nid in nids:
+            n = self.nodes.get(nid)
+            if n is not None:
                 yield n
 
+    @_writes
+    def enable_value_index(self) -> 'graph':
+        '''
+        Build the property value index and keep it maintained from then on. It is opt-in
+        because it holds an entry per distinct (label, value) pair: once on, `select(label=...,
+        value=...)` is a single dict lookup and `valuematch()` prefix/range scans cost
+        O(log n + k) over a sorted list of each label's distinct string values. Idempotent.
+        '''
+        if self._values is None:
+            self._values, self._sorted_values = {}, {}
+            for a in self._iter_assertions(snapshot=False):
+                if isinstance(a, property_):
+                    self._index_value(a, a.label, a.value)
+        return self
+
+    @_writes
+    def disable_value_index(self) -> None:
+        '''Drop the property value index (see `enable_value_index`).'''
+        self._values = self._sorted_values = None
+
+    @_reads
+    def valuematch(self, label: I | str, *, prefix: str | None = None,
+                   lo: str | None = None, hi: str | None = None,
+                   deep: bool = False) -> Iterator[property_]:
+        '''
+        Yield the properties labelled `label` whose string value starts with `prefix` and/or
+        falls in the half-open range `lo <= value < hi`, in value order. Answered by bisection
+        when the value index is enabled; otherwise the label's properties are filtered and
+        sorted. Only first-level properties unless `deep`.
+
+            >>> [p.value for p in g.valuematch(IDENTIFIER, prefix='isbn:')]
+            ['isbn:0140449132', 'isbn:0316769487']
+        '''
+        def wanted(v) -> bool:
+            return isinstance(v, str) and (prefix is None or v.startswith(prefix)) \
+                and (lo is None or v >= lo) and (hi is None or v < hi)
+
+        def shallow_ok(p) -> bool:
+            return deep or not isinstance(p.origin, assertion)
+
+        if self._values is None:
+            found = [a for a in self._label_bucket(label)
+                     if isinstance(a, property_) and wanted(a.value) and shallow_ok(a)]
+            found.sort(key=lambda p: p.value)
+            yield from found
+            return
+
+        ordered = self._sorted_values.get(label, [])
+        start = bisect_left(ordered, max(lo or '', prefix or ''))
+        # Snapshot the matching run of values so mutation during iteration is safe.
+        run = []
+        for v in ordered[start:]:
+            if (hi is not None and v >= hi) or (prefix is not None and not v.startswith(prefix)):
+                break
+            run.append(v)
+        for v in run:
+            for p in list(self._values.get((label, v), ())):
+                if shallow_ok(p):
+                    yield p
+
+    @_reads
     def select(self, origin: I | str | node | assertion | None = None,
                label: I | str | None = None, *,
                value: str | None = None,
@@ -536,9 +1887,14 @@ class graph(MutableMapping):
 
         Results are drawn from a materialized snapshot per container, so removing a yielded
         assertion from its origin mid-iteration is safe.
+
+        A small planner picks the access path (see `explain()`): the `assertion_ids` map for
+        `id=`, the incoming-edge index for `target=`, the origin container's own assertions
+        (label-indexed on hub nodes) for `origin=`, the (label, value) index for `value=` when
+        it is enabled (see `enable_value_index()`), or the graph-wide label index for a bare
+        `label=`. Only a pattern constraining none of these walks every node.
         '''
-        if value is not None and target is not None:
-            raise ValueError('select() takes at most one of value= (properties) or target= (edges)')
+        plan = self.explain(origin, label, value=value, target=target, id=id, deep=deep)
 
         want_props = target is None  # a target= constraint can only be satisfied by an edge
         want_edges = value is None   # a value= constraint can only be satisfied by a property
@@ -574,38 +1930,156 @@ class graph(MutableMapping):
                 return False
             return True
 
-        def walk(container):
-            # Iterate snapshots so a caller may remove a yielded assertion mid-iteration.
-            for p in list(container.properties):
-                yield p
-                if deep:
-                    yield from walk(p)
-            for e in list(container.edges):
-                yield e
-                if deep:
-                    yield from walk(e)
+        for a in plan._candidates():
+            if keep(a):
+                yield a
 
-        # Pick the walk roots. The common case — `origin` is an existing node id — is O(1)
-        # and preserves match()'s historical performance; anything else walks every node and
-        # lets `origin_ok` filter.
-        if isinstance(origin, str):
-            node_root = self.nodes.get(origin)
-            if node_root is not None:
-                roots: list = [node_root]
-            elif origin in self.assertion_ids:  # an identified-assertion origin, nested somewhere
-                roots = list(self.nodes.values())
-            else:  # a bare id matching no node and no assertion -> nothing to select
-                roots = []
-        elif origin is not None and self.nodes.get(getattr(origin, 'id', None)) is origin:
-            roots = [origin]  # a node object passed directly
-        else:
-            roots = list(self.nodes.values())  # origin is None, or an assertion object
+    @_reads
+    def explain(self, origin: I | str | node | assertion | None = None,
+                label: I | str | None = None, *,
+                value: str | None = None,
+                target: I | str | node | assertion | None = None,
+                id: I | str | None = None,
+                deep: bool = False) -> 'SelectPlan':
+        '''
+        Report the access path `select()` would use for the same arguments, without running
+        it. Each applicable path is costed by the number of candidates it would produce
+        (bucket and container sizes, read off the indexes in O(1)); the cheapest wins, and a
+        full walk of every node is chosen only when no constraint maps to an index.
+
+            >>> g.explain(label=KNOWS)
+            SelectPlan(access='label', estimate=2, considered=[('label', 2)])
+        '''
+        if value is not None and target is not None:
+            raise ValueError('select() takes at most one of value= (properties) or target= (edges)')
+
+        def first_level(candidates):
+            # Index-backed paths cover every depth; without `deep`, keep node-origin assertions.
+            return candidates if deep else [a for a in candidates if not isinstance(a.origin, assertion)]
+
+        paths: list = []  # (access, estimate, candidate thunk), in tie-break preference order
+
+        if id is not None:  # noqa: A002 - `id` names the @id component
+            a = self.assertion_ids.get(id)
+            hit = [a] if a is not None and a._graph is self and a.id == id else []
+            paths.append(('assertion_id', len(hit), lambda: first_level(hit)))
 
-        for n in roots:
-            for a in walk(n):
-                if keep(a):
-                    yield a
+        if target is not None:
+            key = target if isinstance(target, str) else _target_key(target)
+            by_label = self._incoming.get(key, {})
+            if label is not None:
+                estimate = len(by_label.get(label, ()))
+            else:
+                estimate = sum(len(edges) for edges in by_label.values())
+            paths.append(('incoming', estimate,
+                          lambda: first_level(self._incoming_edges(key, label))))
+
+        if origin is not None:
+            container = self._resolve_origin(origin)
+            if container is None or (isinstance(container, assertion) and not deep):
+                # Unknown origin, or a nested origin without `deep`: nothing can match.
+                paths.append(('origin', 0, list))
+            else:
+                want_props, want_edges = target is None, value is None
+                idx = container._label_index() if label is not None else None
+                if idx is not None:
+                    estimate = (len(idx[0].get(label, ())) if want_props else 0) + \
+                               (len(idx[1].get(label, ())) if want_edges else 0)
+                else:
+                    estimate = (len(container.properties) if want_props else 0) + \
+                               (len(container.edges) if want_edges else 0)
+
+                def from_origin(container=container, want_props=want_props, want_edges=want_edges):
+                    found: list = []
+                    if want_props:
+                        found.extend(container.properties if label is None else container.getprop(label))
+                    if want_edges:
+                        found.extend(container.edges if label is None else container.getedge(label))
+                    return found
+                paths.append(('origin', estimate, from_origin))
+
+        if value is not None and self._values is not None:
+            if label is not None:
+                hits = self._values.get((label, value), set())
+            elif isinstance(value, str):
+                hits = set().union(*(self._values.get((lbl, value), ()) for lbl in self._sorted_values))
+            else:
+                hits = None
+            if hits is not None:
+                paths.append(('value', len(hits), lambda: first_level(list(hits))))
+
+        if not paths and label is not None:
+            bucket = self._label_bucket(label)
+            paths.append(('label', len(bucket), lambda: first_level(list(bucket))))
+
+        considered = [(access, estimate) for access, estimate, _ in paths]
+        if not paths:
+            stats = self._stats
+            estimate = None
+            if stats is not None and stats.version == self._mutations:
+                estimate = stats.assertions if deep else stats.top_level
+            return SelectPlan('scan', estimate, [('scan', estimate)], lambda: self._walk_all(deep))
+        access, estimate, thunk = min(paths, key=lambda p: p[1])
+        return SelectPlan(access, estimate, considered, thunk)
+
+    @_reads
+    def query(self, patterns: Iterable['Pattern']) -> Iterator[dict]:
+        '''
+        Evaluate a conjunctive, multi-hop query: a list of `onya.query.Pattern`s (each shaped
+        like a `select()` call) whose components may be shared `Var`s. Yields one dict of
+        variable name -> bound value per solution, as a stream. Patterns are ordered by
+        estimated selectivity and joined through the indexes (see `onya.query`).
+
+            >>> from onya.query import Pattern, Var
+            >>> for b in g.query([Pattern('?p', KNOWS, target='?f'), Pattern('?f', KNOWS, target='?ff')]):
+            ...     print(b['p'].id, b['ff'].id)
+        '''
+        from onya.query import execute
+        return execute(self, patterns)
+
+    @_reads
+    def path(self, start, expr, *, base: str | None = None, prefixes: dict | None = None) -> list:
+        '''
+        Items reached from `start` (a node, an assertion, an id, or an iterable of these) by
+        walking path expression `expr`: text such as `'knows+/worksFor'` or `'^knows{1,3}'`,
+        compiled against `base`/`prefixes`, or an already-built `onya.path` term. Results are
+        distinct and in discovery order. Unbounded repetitions share a reachability memo that
+        lives until the graph is next changed, so repeated closure queries are cheap (see
+        `onya.path`).
+
+            >>> g.path('http://e.o/Chuks', 'knows+', base='https://schema.org/')
+        '''
+        from onya.path import compile_path, evaluate
+        if isinstance(expr, str):
+            expr = compile_path(expr, base=base, prefixes=prefixes)
+        return evaluate(self, expr, start)
 
+    def _resolve_origin(self, origin):
+        '''The node or assertion of this graph that `origin` (an id or an object) names, or None.'''
+        if isinstance(origin, str):
+            found = self.nodes.get(origin)
+            if found is None:
+                found = self.assertion_ids.get(origin)
+        else:
+            found = origin
+        if isinstance(found, node):
+            return found if self.nodes.get(found.id) is found else None
+        return found if found is not None and found._graph is self else None
+
+    def _label_bucket(self, label: I | str) -> set:
+        '''Assertions (any depth) carrying `label`, building the graph-wide label index on first use.'''
+        if self._assertions_by_label is None:
+            by_label: dict = {}
+            for a in self._iter_assertions(snapshot=False):
+                by_label.setdefault(a.label, set()).add(a)
+            self._assertions_by_label = by_label
+        return self._assertions_by_label.get(label, set())
+
+    def _walk_all(self, deep: bool) -> Iterator[assertion]:
+        '''Every assertion, first-level only unless `deep`; snapshots each container as it goes.'''
+        return iter_assertions(list(self.nodes.values()), deep=deep)
+
+    @_reads
     def match(self, origin: I | str | None = None,
               label: I | str | None = None,
               ) -> Iterator[tuple[I | str, I | str, str | I, dict]]:
@@ -634,3 +2108,59 @@ class graph(MutableMapping):
             else:
                 target = a.value
             yield (a.origin.id, a.label, target, annotations)
+
+
+def union_all(graphs: Iterable[graph], *, workers: int | None = None) -> graph:
+    '''
+    Union many graphs into one by folding them left to right with `graph.union()`
+    (`graphs[0].union(graphs[1]).union(graphs[2])...`).
+
+    Without `workers` (or with 1) that fold runs in-process: each `union()` costs time
+    proportional to the graph folded in, so the accumulator is never re-walked, and the first
+    graph is consumed and returned, as `union()` would.
+
+    With `workers=N`, the graphs are frozen (see `graph.freeze()`, the compact form that is
+    shipped between processes) and reduced as a tree across a `ProcessPoolExecutor`: N
+    contiguous chunks are folded in parallel, then adjacent partial results are unioned
+    pairwise, level by level, until one remains. Order is preserved throughout, so where the
+    merge rules keep a first occurrence the sequential fold's choice is kept. The result is a
+    new graph, and the inputs are left untouched.
+
+    The tree regroups the unions, and merging is not associative under the interp rules: an
+    interp-free anonymous assertion folds into the one interp its skeleton carries, but is
+    dropped once that skeleton carries two differing ones (see
+    `_merge_anonymous_skeleton_group`). The tree can meet such an assertion beside one interp
+    inside its chunk where the fold has already seen two, or beside a different one, so where
+    the inputs attach differing interps to the same anonymous assertion and also carry it
+    without one, the parallel result can keep that occurrence's nested assertions under an
+    interp the sequential fold drops or files them under. Inputs without that pattern give
+    the sequential result.
+    '''
+    graphs = list(graphs)
+    if not graphs:
+        return graph()
+    if not workers or workers <= 1 or len(graphs) < 2:
+        return _fold_union(graphs)
+
+    from concurrent.futures import ProcessPoolExecutor
+    frozen = [g.freeze() for g in graphs]
+    size = -(-len(frozen) // min(workers, len(frozen)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        level = list(pool.map(_union_frozen, [frozen[i:i + size] for i in range(0, len(frozen), size)]))
+        while len(level) > 1:
+            level = list(pool.map(_union_frozen, [level[i:i + 2] for i in range(0, len(level), 2)]))
+    result = level[0].thaw()
+    result._dirty = set()  # the last step was a union, so every node is already merged
+    return result
+
+
+def _fold_union(graphs: list[graph]) -> graph:
+    acc = graphs[0]
+    for g in graphs[1:]:
+        acc.union(g)
+    return acc
+
+
+def _union_frozen(frozen: list) -> 'frozen_graph':
+    '''Worker step for `union_all`: thaw, fold left to right, and freeze for the trip back.'''
+    return _fold_union([fg.thaw() for fg in frozen]).freeze()
@@ -27,6 +27,7 @@ from typing import Protocol, runtime_checkable
 from amara import iri as _iri
 from amara.iri import I
 
+from onya.graph import iter_assertions
 from onya.terms import ONYA_INTERP
 
 
@@ -324,19 +325,9 @@ def _origin_id(assertion):
 
 # --- graph traversal helpers --------------------------------------------------------
 
-def _iter_assertions(container):
-    '''Yield every assertion under `container`, recursively (properties and edges).'''
-    for prop in container.properties:
-        yield prop
-        yield from _iter_assertions(prop)
-    for edge in container.edges:
-        yield edge
-        yield from _iter_assertions(edge)
-
-
 def _all_assertions(graph):
-    for n in graph.nodes.values():
-        yield from _iter_assertions(n)
+    '''Every assertion in `graph`, at any depth. Read-only callers, so no snapshotting.'''
+    return iter_assertions(graph.nodes.values(), snapshot=False)
 
 
 # --- application API (on demand, never ambient) -------------------------------------
@@ -0,0 +1,308 @@
+# SPDX-FileCopyrightText: 2023-present Oori Data <info@oori.dev>
+# SPDX-License-Identifier: Apache-2.0
+# onya.path
+'''
+Path expressions over an Onya graph — `graph.path()`.
+
+A path expression describes the edge walks to take from a start node, in the spirit of
+SPARQL property paths:
+
+    knows                   one `knows` edge
+    knows/worksFor          sequence
+    knows|follows           alternation
+    ^knows                  inverse: an edge arriving at the current node
+    knows* knows+ knows?    zero-or-more, one-or-more, zero-or-one
+    knows{2} knows{1,3}     bounded repetition ({n,} is unbounded)
+    (knows|^knows)+/name    grouping
+
+A label is `<full-iri>`, `prefix:local` (with `prefixes=`) or a bare name (resolved against
+`base=`, e.g. `https://schema.org/`). Text compiles to a tree of hashable `Link`, `Seq`,
+`Alt` and `Repeat` terms, which may also be built directly; `^` is pushed down to the links
+at compile time, so `^(a/b)` is `^b/^a`. Forward steps read the origin's own edges, and
+inverse steps use the graph's incoming-edge index, so each costs time proportional to the
+edges actually followed.
+
+Evaluation is set-at-a-time: the result is the distinct items (nodes, or assertions for
+edges that target identified assertions) reached, in discovery order. Unbounded
+repetitions are answered from a per-graph reachability memo. Each start's closure under a
+given step expression is kept, and a later walk that reaches a node whose closure is already
+known takes that closure whole rather than re-exploring. So repeated closure queries over the
+same label are cheap. Any change to the graph through the model API invalidates the memo.
+
+    >>> g.path(CHUKS, 'knows+/worksFor', base='https://schema.org/')
+'''
+
+from __future__ import annotations
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+import re
+
+from amara.iri import I
+
+__all__ = ['Link', 'Seq', 'Alt', 'Repeat', 'compile_path', 'evaluate']
+
+
+@dataclass(frozen=True)
+class Link:
+    '''One edge step labelled `label`: forward, or against the edge direction if `inverse`.'''
+    label: I | str
+    inverse: bool = False
+
+    def __str__(self) -> str:
+        return f'{"^" if self.inverse else ""}<{self.label}>'
+
+
+@dataclass(frozen=True)
+class Seq:
+    '''Each of `parts` in turn.'''
+    parts: tuple
+
+    def __str__(self) -> str:
+        return '/'.join(_group(p, Alt) for p in self.parts)
+
+
+@dataclass(frozen=True)
+class Alt:
+    '''Any one of `parts`.'''
+    parts: tuple
+
+    def __str__(self) -> str:
+        return '|'.join(str(p) for p in self.parts)
+
+
+@dataclass(frozen=True)
+class Repeat:
+    '''`expr` applied between `min` and `max` times; `max` None is unbounded.'''
+    expr: object
+    min: int = 0
+    max: int | None = None
+
+    def __post_init__(self):
+        if self.min < 0 or (self.max is not None and self.max < self.min):
+            raise ValueError(f'Bad repetition bounds {{{self.min},{self.max}}}')
+
+    def __str__(self) -> str:
+        suffix = {(0, None): '*', (1, None): '+', (0, 1): '?'}.get((self.min, self.max))
+        if suffix is None:
+            suffix = f'{{{self.min},{"" if self.max is None else self.max}}}'
+        return _group(self.expr, (Seq, Alt, Repeat)) + suffix
+
+
+def _group(expr, kinds) -> str:
+    return f'({expr})' if isinstance(expr, kinds) else str(expr)
+
+
+def _inverse(expr):
+    if isinstance(expr, Link):
+        return Link(expr.label, not expr.inverse)
+    if isinstance(expr, Seq):
+        return Seq(tuple(_inverse(p) for p in reversed(expr.parts)))
+    if isinstance(expr, Alt):
+        return Alt(tuple(_inverse(p) for p in expr.parts))
+    return Repeat(_inverse(expr.expr), expr.min, expr.max)
+
+
+# --- compiling text ------------------------------------------------------------
+
+_TOKEN = re.compile(r'\s*(?:(<[^>]*>)|(\{\s*\d+\s*(?:,\s*\d*\s*)?\})|([/|^*+?()])|([^\s/|^*+?(){}<>]+))')
+
+
+def _tokenize(text: str) -> list[str]:
+    tokens, pos, text = [], 0, text.rstrip()
+    while pos < len(text):
+        m = _TOKEN.match(text, pos)
+        if m is None or m.end() == pos:
+            raise ValueError(f'Unexpected {text[pos:]!r} in path expression {text!r}')
+        tokens.append(m.group(m.lastindex))
+        pos = m.end()
+    return tokens
+
+
+class _parser:
+    '''Recursive descent: alt := seq ('|' seq)*; seq := unary ('/' unary)*; unary := '^'* postfix.'''
+    def __init__(self, text, base, prefixes):
+        self.text, self.base, self.prefixes = text, base, prefixes
+        self.tokens = _tokenize(text)
+        self.pos = 0
+
+    def error(self, msg):
+        return ValueError(f'{msg} in path expression {self.text!r}')
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self):
+        tok = self.peek()
+        self.pos += 1
+        return tok
+
+    def parse(self):
+        if not self.tokens:
+            raise self.error('Empty path')
+        expr = self.alt()
+        if self.peek() is not None:
+            raise self.error(f'Unexpected {self.peek()!r}')
+        return expr
+
+    def alt(self):
+        parts = [self.seq()]
+        while self.peek() == '|':
+            self.take()
+            parts.append(self.seq())
+        return parts[0] if len(parts) == 1 else Alt(tuple(parts))
+
+    def seq(self):
+        parts = [self.unary()]
+        while self.peek() == '/':
+            self.take()
+            parts.append(self.unary())
+        return parts[0] if len(parts) == 1 else Seq(tuple(parts))
+
+    def unary(self):
+        if self.peek() == '^':
+            self.take()
+            return _inverse(self.unary())
+        expr = self.primary()
+        while True:
+            tok = self.peek()
+            if tok == '*':
+                expr = Repeat(expr, 0, None)
+            elif tok == '+':
+                expr = Repeat(expr, 1, None)
+            elif tok == '?':
+                expr = Repeat(expr, 0, 1)
+            elif tok is not None and tok.startswith('{'):
+                lo, _, hi = tok[1:-1].partition(',')
+                lo = int(lo)
+                hi = (None if not hi.strip() else int(hi)) if ',' in tok else lo
+                expr = Repeat(expr, lo, hi)
+            else:
+                return expr
+            self.take()
+
+    def primary(self):
+        tok = self.take()
+        if tok == '(':
+            expr = self.alt()
+            if self.take() != ')':
+                raise self.error("Missing ')'")
+            return expr
+        if tok is None or tok in '/|^*+?)' or tok.startswith('{'):
+            raise self.error(f'Expected a label, got {tok!r}')
+        if tok.startswith('<'):
+            return Link(I(tok[1:-1]))
+        prefix, colon, local = tok.partition(':')
+        if colon and prefix in self.prefixes:
+            return Link(I(self.prefixes[prefix] + local))
+        if colon or self.base is None:
+            return Link(I(tok) if colon else tok)
+        return Link(I(self.base + tok))
+
+
+@lru_cache(maxsize=256)
+def _compile(text: str, base, prefixes: tuple):
+    return _parser(text, base, dict(prefixes)).parse()
+
+
+def compile_path(text: str, *, base: str | None = None, prefixes: dict | None = None):
+    '''
+    Compile path expression `text` (see module docstring) to a `Link`/`Seq`/`Alt`/`Repeat`
+    term. Raises `ValueError` on a syntax error. Compiled forms are cached.
+    '''
+    return _compile(text, base, tuple(sorted((prefixes or {}).items())))
+
+
+# --- evaluation ----------------------------------------------------------------
+
+def _step(g, link: Link, frontier: dict) -> dict:
+    out: dict = {}
+    if link.inverse:
+        for item in frontier:
+            key = item.id if item.id is not None else item
+            for e in g._incoming_edges(key, link.label):
+                out[e.origin] = None
+    else:
+        for item in frontier:
+            for e in item.getedge(link.label):
+                if e.target is not None:
+                    out[e.target] = None
+    return out
+
+
+def _eval(g, expr, frontier: dict) -> dict:
+    if not frontier:
+        return frontier
+    if isinstance(expr, Link):
+        return _step(g, expr, frontier)
+    if isinstance(expr, Seq):
+        for part in expr.parts:
+            frontier = _eval(g, part, frontier)
+        return frontier
+    if isinstance(expr, Alt):
+        out: dict = {}
+        for part in expr.parts:
+            out.update(_eval(g, part, frontier))
+        return out
+    for _ in range(expr.min):
+        frontier = _eval(g, expr.expr, frontier)
+    if expr.max == expr.min:
+        return frontier
+    if expr.max is None:
+        out = dict(frontier)
+        for item in frontier:
+            out.update(_closure(g, expr.expr, item))
+        return out
+    # bounded: breadth-first, never re-expanding an item already reached (a shorter walk
+    # to it reaches everything a longer one would, within the bound)
+    out = dict(frontier)
+    for _ in range(expr.max - expr.min):
+        frontier = {x: None for x in _eval(g, expr.expr, frontier) if x not in out}
+        if not frontier:
+            break
+        out.update(frontier)
+    return out
+
+
+def _closure(g, expr, start) -> dict:
+    '''Everything reachable from `start` by one or more `expr` walks, memoized per graph.'''
+    if g._reach_at != g._mutations:
+        g._reach_memo.clear()
+        g._reach_at = g._mutations
+    memo = g._reach_memo.setdefault(expr, {})
+    found = memo.get(start)
+    if found is not None:
+        return found
+    out: dict = {}
+    queue = [start]
+    while queue:
+        item = queue.pop()
+        for nxt in _eval(g, expr, {item: None}):
+            if nxt in out:
+                continue
+            out[nxt] = None
+            known = memo.get(nxt)
+            if known is not None:  # take a finished closure whole
+                out.update(known)
+            else:
+                queue.append(nxt)
+    memo[start] = out
+    return out
+
+
+def evaluate(g, expr, start: Iterable | object) -> list:
+    '''
+    Items reached from `start` (a node or assertion object, an id, or an iterable of
+    either) along path `expr` (a compiled term) in graph `g`, distinct and in discovery
+    order.
+    '''
+    if isinstance(start, str) or not isinstance(start, Iterable):
+        start = [start]
+    frontier: dict = {}
+    for s in start:
+        if isinstance(s, str):
+            s = g.nodes.get(s) or g.assertion_ids.get(s)
+            if s is None:
+                continue
+        frontier[s] = None
+    return list(_eval(g, expr, frontier))
@@ -0,0 +1,295 @@
+# SPDX-FileCopyrightText: 2023-present Oori Data <info@oori.dev>
+# SPDX-License-Identifier: Apache-2.0
+# onya.query
+'''
+Conjunctive (multi-hop) pattern matching over an Onya graph — `graph.query()`.
+
+A query is a list of `Pattern`s, each shaped like one `graph.select()` call, whose
+components may be `Var`s shared between patterns. A solution binds every variable so that
+all patterns hold at once; solutions stream out as dicts of variable name -> bound value
+(a node or assertion object for origin/target/assertion positions, a string for
+label/value/id positions).
+
+    >>> P, F, O = Var('p'), Var('f'), Var('o')
+    >>> g.query([
+    ...     Pattern(P, KNOWS, target=F),
+    ...     Pattern(F, WORKS_FOR, target=O),
+    ...     Pattern(O, NAME, value='Acme'),
+    ... ])
+
+Patterns over nested assertions bind the matched assertion itself with `assertion=` and use
+that variable as another pattern's `origin` (or `target`):
+
+    >>> K = Var('k')
+    >>> g.query([Pattern(P, KNOWS, target=F, assertion=K), Pattern(K, SINCE, value='2018')])
+
+`plan()` orders the patterns greedily by estimated cardinality (read off the graph's
+indexes via `graph.explain()`, refined by its statistics catalogue, `graph.stats()`, when
+that is current), preferring at each step a pattern that an already-bound variable lets the
+indexes answer. Each step then runs as an index join — one indexed
+`select()` per distinct join key, memoized — or, when the shared variables sit only in
+positions no index covers, as a hash join: the pattern's matches are materialized once,
+hashed on the join variables and probed per incoming solution.
+'''
+
+from __future__ import annotations
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from amara.iri import I
+
+from onya.graph import assertion, edge, property_
+
+__all__ = ['Var', 'Pattern', 'JoinStep', 'plan', 'execute']
+
+# Pattern components, in the order `select()` names them
+COMPONENTS = ('origin', 'label', 'value', 'target', 'id')
+
+
+@dataclass(frozen=True)
+class Var:
+    '''A query variable. `'?name'` strings are accepted as shorthand wherever a `Var` is.'''
+    name: str
+
+    def __repr__(self) -> str:
+        return f'?{self.name}'
+
+
+def _term(x):
+    if isinstance(x, str) and not isinstance(x, I) and x.startswith('?'):
+        return Var(x[1:])
+    return x
+
+
+@dataclass
+class Pattern:
+    '''
+    One triple-shaped pattern: `origin`, `label`, `value`/`target`, `id` as in
+    `graph.select()`, each a constant, a `Var`, or None (wildcard). `assertion` optionally
+    names a variable bound to the matched assertion itself, so later patterns can reach
+    into its nested assertions. A `value` (constant or variable) restricts matches to
+    properties, a `target` to edges. `deep` lets an unanchored pattern match nested
+    assertions too; it is implied when `origin` is an assertion.
+    '''
+    origin: object = None
+    label: object = None
+    value: object = None
+    target: object = None
+    id: object = None
+    assertion: Var | str | None = None
+    deep: bool = False
+
+    def __post_init__(self):
+        for comp in (*COMPONENTS, 'assertion'):
+            setattr(self, comp, _term(getattr(self, comp)))
+        if self.value is not None and self.target is not None:
+            raise ValueError('A pattern takes at most one of value= (properties) or target= (edges)')
+        if self.assertion is not None and not isinstance(self.assertion, Var):
+            raise ValueError(f'assertion= names a variable, got {self.assertion!r}')
+
+    def variables(self) -> set[str]:
+        return {t.name for t in (*(getattr(self, c) for c in COMPONENTS), self.assertion) if isinstance(t, Var)}
+
+
+@dataclass
+class JoinStep:
+    '''
+    One step of a query plan. `method` is `'scan'` (the pattern shares no variable with
+    earlier steps: its matches are computed once and crossed with every solution so far),
+    `'index'` (a bound variable feeds an indexed `select()` per distinct join key) or
+    `'hash'` (matches are materialized once and hashed on `join_vars`). `estimate` is the
+    expected number of matches per incoming solution.
+    '''
+    pattern: Pattern
+    method: str
+    estimate: float
+    join_vars: tuple = ()
+    index_on: tuple = field(default=(), repr=False)
+
+
+def _positions(p: Pattern, bound: set[str], g) -> tuple:
+    '''Components of `p` holding an already-bound variable that an index can answer.'''
+    indexed = ['origin', 'target', 'id', 'label']
+    if g._values is not None:
+        indexed.append('value')
+    return tuple(c for c in indexed if isinstance(getattr(p, c), Var) and getattr(p, c).name in bound)
+
+
+def _constants(p: Pattern) -> dict:
+    return {c: getattr(p, c) for c in COMPONENTS if getattr(p, c) is not None and not isinstance(getattr(p, c), Var)}
+
+
+def _estimate(g, p: Pattern, bound: set[str], index_on: tuple, deep: bool) -> float:
+    '''
+    Expected matches of `p` per incoming solution: the candidates its constants' access
+    path yields, narrowed by the catalogue (`graph.stats()`) — an unindexed constant value
+    keeps one in `values` of a label's occurrences, and a bound origin or target variable
+    keeps about one container's (or target's) worth, the label's average out/in degree.
+
+    The catalogue is used only if one is current: rebuilding it walks the whole graph, which
+    planning must not do after every write. Otherwise the `explain()` estimates stand alone,
+    and a scan is costed at one assertion per node.
+    '''
+    if isinstance(p.assertion, Var) and p.assertion.name in bound:
+        return 1
+    if 'id' in index_on:
+        return 1
+    const = _constants(p)
+    explained = g.explain(**const, deep=deep)
+    stats = g._stats
+    if stats is None or stats.version != g._mutations:
+        return float(len(g.nodes) if explained.estimate is None else explained.estimate)
+    if explained.estimate is None:  # a scan
+        est = float(stats.assertions if deep else stats.top_level)
+    else:
+        est = float(explained.estimate)
+    ls = stats.label(p.label) if 'label' in const else None
+    if 'value' in const and explained.access != 'value' and ls is not None and ls.values:
+        est /= ls.values
+    fanouts = []
+    if 'origin' in index_on:
+        fanouts.append(ls.out_degree if ls is not None else stats.out_degree)
+    if 'target' in index_on:
+        fanouts.append(ls.in_degree if ls is not None else stats.out_degree)
+    if 'value' in index_on and ls is not None and ls.values:
+        fanouts.append(ls.properties / ls.values)
+    if 'label' in index_on and stats.labels:
+        fanouts.append(stats.assertions / len(stats.labels))
+    if fanouts:
+        est = min(est, *fanouts)
+    return est
+
+
+def plan(g, patterns: Iterable[Pattern]) -> list[JoinStep]:
+    '''
+    Order `patterns` into join steps: greedily, the cheapest pattern given the variables
+    bound so far goes next, preferring patterns joined to what is already bound over
+    disconnected ones (which would multiply the solutions). Ties keep the given order.
+    '''
+    remaining = list(patterns)
+    nested = {p.assertion.name for p in remaining if p.assertion is not None}
+    bound: set[str] = set()
+    steps: list[JoinStep] = []
+    while remaining:
+        best = None
+        for p in remaining:
+            deep = _is_deep(p, nested)
+            index_on = _positions(p, bound, g)
+            shared = tuple(sorted(p.variables() & bound))
+            est = _estimate(g, p, bound, index_on, deep)
+            # connected patterns first (when anything is bound yet), then by estimate
+            key = (bool(bound) and not shared, est)
+            if best is None or key < best[0]:
+                if p.assertion is not None and p.assertion.name in bound:
+                    method = 'index'
+                else:
+                    method = 'index' if index_on else 'hash' if shared else 'scan'
+                best = (key, p, JoinStep(p, method, est, shared, index_on))
+        remaining.remove(best[1])
+        steps.append(best[2])
+        bound |= best[1].variables()
+    return steps
+
+
+def _is_deep(p: Pattern, nested: set[str]) -> bool:
+    o = p.origin
+    return p.deep or isinstance(o, assertion) or (isinstance(o, Var) and o.name in nested)
+
+
+def _component(a, comp: str):
+    if comp == 'value':
+        return a.value if isinstance(a, property_) else _MISSING
+    if comp == 'target':
+        return a.target if isinstance(a, edge) else _MISSING
+    return getattr(a, comp)
+
+
+_MISSING = object()
+
+
+def _extend(binding: dict, p: Pattern, a) -> dict | None:
+    '''`binding` extended so that `p` matches assertion `a`, or None if they conflict.'''
+    if p.value is not None and not isinstance(a, property_):
+        return None
+    if p.target is not None and not isinstance(a, edge):
+        return None
+    out = binding
+    for comp in (*COMPONENTS, 'assertion'):
+        term = getattr(p, comp)
+        if not isinstance(term, Var):
+            continue
+        val = a if comp == 'assertion' else _component(a, comp)
+        if val is _MISSING:
+            return None
+        if term.name in out:
+            have = out[term.name]
+            if have is not val and have != val:
+                return None
+        else:
+            if out is binding:
+                out = dict(binding)
+            out[term.name] = val
+    return out
+
+
+def _step(g, step: JoinStep, nested: set[str], solutions: Iterator[dict]) -> Iterator[dict]:
+    p = step.pattern
+    deep = _is_deep(p, nested)
+    const = _constants(p)
+
+    if step.method == 'index':
+        cache: dict = {}
+        for b in solutions:
+            if p.assertion is not None and p.assertion.name in b:
+                candidates = [b[p.assertion.name]]
+            else:
+                key = tuple(b[getattr(p, c).name] for c in step.index_on)
+                candidates = cache.get(key)
+                if candidates is None:
+                    args = dict(const, **{c: v for c, v in zip(step.index_on, key)})
+                    if 'value' in args and not isinstance(args['value'], str):
+                        candidates = []  # a non-string can never be a property value
+                    else:
+                        nested_origin = isinstance(args.get('origin'), assertion)
+                        candidates = cache[key] = list(g.select(**args, deep=deep or nested_origin))
+            for a in candidates:
+                out = _extend(b, p, a)
+                if out is not None:
+                    yield out
+        return
+
+    matches = list(g.select(**const, deep=deep))
+    if step.method == 'scan':
+        for b in solutions:
+            for a in matches:
+                out = _extend(b, p, a)
+                if out is not None:
+                    yield out
+        return
+
+    # hash join on the shared variables
+    table: dict = {}
+    for a in matches:
+        probe = _extend({}, p, a)
+        if probe is not None:
+            table.setdefault(tuple(_key(probe[v]) for v in step.join_vars), []).append(a)
+    for b in solutions:
+        for a in table.get(tuple(_key(b[v]) for v in step.join_vars), ()):
+            out = _extend(b, p, a)
+            if out is not None:
+                yield out
+
+
+def _key(v):
+    # Strings join by value; nodes and assertions by identity (they do not define equality).
+    return v if isinstance(v, str) else id(v)
+
+
+def execute(g, patterns: Iterable[Pattern]) -> Iterator[dict]:
+    '''Stream the solutions of the conjunctive query `patterns` over `g` (see `graph.query`).'''
+    patterns = list(patterns)
+    nested = {p.assertion.name for p in patterns if p.assertion is not None}
+    solutions: Iterator[dict] = iter([{}])
+    for step in plan(g, patterns):
+        solutions = _step(g, step, nested, solutions)
+    return solutions
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2023-present Oori Data <info@oori.dev>
+# SPDX-License-Identifier: Apache-2.0
+# onya.rwlock
+'''
+The reader/writer lock behind `graph.enable_thread_safety()`.
+
+Many threads may read at once; a writer waits for the readers in progress to finish and
+then runs alone. Writers are preferred: once one is waiting, new readers queue behind it,
+so a steady stream of readers cannot starve an ingest thread. Both sides are reentrant per
+thread, since a mutation such as `union()` calls other mutations and readers call other
+readers, and the thread holding the write lock may also read. Upgrading is not possible (two
+readers upgrading at once would deadlock), so asking for the write lock while holding only
+the read lock raises `RuntimeError`.
+'''
+
+from __future__ import annotations
+import threading
+from contextlib import contextmanager
+
+__all__ = ['RWLock']
+
+
+class RWLock:
+    '''A writer-preferring, per-thread reentrant reader/writer lock (see module docstring).'''
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers: dict = {}  # thread ident -> read depth
+        self._writer: int | None = None  # thread ident holding the write lock
+        self._depth = 0  # write depth of that thread
+        self._waiting = 0  # writers queued
+
+    def acquire_read(self) -> None:
+        me = threading.get_ident()
+        with self._cond:
+            held = self._readers.get(me, 0)
+            if not held and self._writer != me:
+                while self._writer is not None or self._waiting:
+                    self._cond.wait()
+            self._readers[me] = held + 1
+
+    def release_read(self) -> None:
+        me = threading.get_ident()
+        with self._cond:
+            held = self._readers[me] - 1
+            if held:
+                self._readers[me] = held
+            else:
+                del self._readers[me]
+                if not self._readers:
+                    self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._depth += 1
+                return
+            if me in self._readers:
+                raise RuntimeError('Cannot take the write lock while holding only the read lock')
+            self._waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting -= 1
+            self._writer = me
+            self._depth = 1
+
+    def release_write(self) -> None:
+        with self._cond:
+            self._depth -= 1
+            if not self._depth:
+                self._writer = None
+                self._cond.notify_all()
+
+    @contextmanager
+    def reading(self):
+        self.acquire_read()
+        try:
+            yield self
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def writing(self):
+        self.acquire_write()
+        try:
+            yield self
+        finally:
+            self.release_write()
@@ -13,6 +13,7 @@ Onya Literate, or Onya Lit, is a Markdown-based format.
 see: the [Onya Literate format documentation](https://github.com/OoriData/Onya/blob/main/SPEC.md#onya-literate-serialization)
 '''
 
+import io
 import re
 import warnings
 from dataclasses import dataclass
@@ -75,6 +76,29 @@ class doc_info:
     pending_edges: list = None  # deferred (edge, target_id) links resolved after all @ids are known
     interp_defaults: dict = None  # docheader @interpretations: resolved label IRI -> interp IRI/_CANCEL
     interp_defaults_raw: list = None  # raw (label_str, interp_raw) pairs, resolved after header parse
+    pending_text_refs: list = None  # streaming: (property, text-ref name) bound once all are defined
+    resolved: dict = None   # memo for expand_iri: (raw token, base, checked) -> IRI
+    resolve_hits: int = 0   # expand_iri calls answered from `resolved`
+    resolve_misses: int = 0  # expand_iri calls that resolved from scratch
+
+
+def _new_doc() -> doc_info:
+    doc = doc_info()
+    doc.iris = {}  # Initialize the iris dictionary
+    doc.text_refs = {}  # Initialize the text references dictionary
+    doc.pending_edges = []  # Edge targets are resolved after all @id declarations are seen
+    doc.resolved = {}  # Each distinct reference is expanded once per document
+    return doc
+
+
+def _node_ids(graph_obj) -> set:
+    return set(getattr(graph_obj, 'nodes', {}).keys()) if hasattr(graph_obj, 'nodes') else set(graph_obj)
+
+
+def _intern(graph_obj, value):
+    '''`value` as interned by `graph_obj` (see `graph.intern`); as is for a target without the table.'''
+    intern = getattr(graph_obj, 'intern', None)
+    return value if intern is None else intern(value)
 
 
 class SchemaPrefixConflict(ValueError):
@@ -245,9 +269,16 @@ def ensure_namespace_separator(name: str, base: str | None, *, strict: bool) ->
     return base + '/'
 
 
+def _forget_resolved(doc: doc_info) -> None:
+    '''Drop memoized expansions: an `@iri` prefix changed, so CURIEs may now expand differently.'''
+    if doc.resolved:
+        doc.resolved.clear()
+
+
 def _register_iri_prefix(doc: doc_info, prefix: str, uri: str | None) -> None:
     if uri is None:
         return
+    _forget_resolved(doc)
     if doc.iris is None:
         doc.iris = {}
     uri_norm = uri if uri.endswith('#') else namespace_for_curie(uri)
@@ -277,6 +308,8 @@ def _sync_schema_prefix(doc: doc_info) -> None:
             f'@schema ({doc.schemabase!r}); after normalization: '
             f'{doc.iris["schema"]!r} vs {canonical!r}'
         )
+    if doc.iris.get('schema') != canonical:
+        _forget_resolved(doc)
     doc.iris['schema'] = canonical
 
 
@@ -285,6 +318,22 @@ class value_info:
     verbatim: int = None    # Literal value input text
     typeindic: int = None   # Value type indicator (from value_type enum)
 
+
+@dataclass
+class ParseProfile:
+    '''
+    Counters from one parse. `lookups` counts IRI references resolved (labels, types, node
+    ids, edge targets, `@id`s, interpretations); `hits` counts those answered by the
+    document's memo of earlier expansions (see `expand_iri`) rather than resolved afresh.
+    '''
+    lookups: int = 0
+    hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
 @dataclass
 class ParseResult:
     '''
@@ -296,6 +345,7 @@ class ParseResult:
     honest alternative to guessing a convention from a graph, which holds only full IRIs.
     `prefixes` is the `@iri` map excluding the auto-registered `schema` entry (matching
     `write`'s `prefixes` parameter). Each is `None`/empty when the document did not declare it.
+    `profile` holds a `ParseProfile`, or None when the result was loaded from a parse cache.
     '''
     doc_iri: str | None
     graph: object
@@ -304,6 +354,7 @@ class ParseResult:
     nodebase: str | None = None
     typebase: str | None = None
     prefixes: dict | None = None
+    profile: ParseProfile | None = None
 
 
 class LiterateParser:
@@ -317,7 +368,8 @@ class LiterateParser:
                  strict_namespace_bases: bool = False,
                  warn_implicit_doc_ids: bool = False,
                  warn_empty_blocks: bool = True,
-                 lenient_arrows: bool = False):
+                 lenient_arrows: bool = False,
+                 cache=None):
         '''
         document_source_assertions -- if set, add @source sub-properties on created assertions,
             including nested assertions but excluding document header declarations
@@ -339,6 +391,9 @@ class LiterateParser:
             such a line raises `EdgeArrowError`, naming the character and showing the
             corrected line. If set, the stray arrow is accepted as an edge, a warning is
             emitted, and parsing continues. Valid edge arrows remain only `->` and `→`.
+        cache -- an `onya.serial.parsecache.ParseCache`, or a directory path for one. If set,
+            `parse()` stores each document it parses there and loads it back instead of
+            parsing when the same text comes up again with the same flags. Off by default.
         '''
         self.document_source_assertions = document_source_assertions
         self.encoding = encoding
@@ -346,9 +401,13 @@ class LiterateParser:
         self.warn_implicit_doc_ids = warn_implicit_doc_ids
         self.warn_empty_blocks = warn_empty_blocks
         self.lenient_arrows = lenient_arrows
+        if cache is not None and not hasattr(cache, 'key'):
+            from onya.serial.parsecache import ParseCache
+            cache = ParseCache(cache)
+        self.cache = cache
 
     def parse(self, lit_text, graph_obj=None, *, encoding: str | None = None,
-              merge: bool = False) -> ParseResult:
+              merge: bool = False, workers: int | None = None) -> ParseResult:
         '''
         Parse Onya Literate source text
 
@@ -360,22 +419,35 @@ class LiterateParser:
           (collapsing duplicate assertions per the SPEC identity rules). Defaults to False,
           preserving the on-demand, never-ambient default; it is purely a one-call
           shorthand for the common parse-then-merge workflow.
+        - `workers` -- if more than 1, split the text at node-header boundaries and parse
+          the pieces in a pool of that many processes (see `_parse_parallel`). The graph
+          is still built here, in document order, so it is exactly the serial result. Pays
+          off for large documents outside the line scanner's subset.
+
+        With a `cache` (see `__init__`), text seen before is loaded rather than parsed, into
+        a new graph or any `onya.graph.graph`; see `_parse_cached`.
 
         Returns: `ParseResult(doc_iri, graph, nodes_added)`
         '''
+        if self.cache is not None and isinstance(lit_text, str):
+            from onya.graph import graph as graph_cls
+            if graph_obj is None or isinstance(graph_obj, graph_cls):
+                return self._parse_cached(lit_text, graph_obj, merge, workers)
+        return self._parse_text(lit_text, graph_obj, merge, workers)
+
+    def _parse_text(self, lit_text, graph_obj, merge: bool, workers: int | None) -> ParseResult:
         if graph_obj is None:
             # Lazy import to avoid circular dependency concerns
             from onya.graph import graph as graph_cls
             graph_obj = graph_cls()
 
-        nodes_before = set(getattr(graph_obj, 'nodes', {}).keys()) if hasattr(graph_obj, 'nodes') else set(graph_obj)
+        nodes_before = _node_ids(graph_obj)
+        doc = _new_doc()
 
-        doc = doc_info()
-        doc.iris = {}  # Initialize the iris dictionary
-        doc.text_refs = {}  # Initialize the text references dictionary
-        doc.pending_edges = []  # Edge targets are resolved after all @id declarations are seen
-
-        parsed = self._parse_string(lit_text)
+        if workers is not None and workers > 1:
+            parsed = self._parse_parallel(lit_text, workers)
+        else:
+            parsed = self._parse_string(lit_text)
 
         # First pass: collect all text reference definitions
         for item in parsed:
@@ -388,11 +460,178 @@ class LiterateParser:
             if not (isinstance(item, tuple) and item[0] == 'text_ref_def'):
                 process_nodeblock(item, graph_obj, doc, self)
 
+        return self._finish(graph_obj, doc, nodes_before, merge)
+
+    def _parse_cached(self, lit_text: str, graph_obj, merge: bool, workers: int | None) -> ParseResult:
+        '''
+        `parse()` through `self.cache`. On a miss the text is parsed on its own, into an empty
+        graph, and stored as the delta from the empty graph to the result, plus the
+        `ParseResult` metadata and the warnings raised. Those warnings are re-issued on every
+        hit. The delta is then applied to `graph_obj`, which builds what parsing into it would
+        have, except where the text touches an assertion @id `graph_obj` already holds: a
+        parse in place links an edge naming it to that assertion, and rejects a redeclaration
+        with its own diagnostic. Such text is parsed in place instead, so it builds, or fails,
+        exactly as without a cache.
+        '''
+        from onya.graph import graph as graph_cls
+        from onya.serial.parsecache import CacheEntry
+
+        key = self.cache.key(lit_text, self._cache_flags())
+        entry = self.cache.get(key)
+        fresh = None
+        if entry is None:
+            caught: list = []
+            try:
+                with warnings.catch_warnings(record=True) as caught:
+                    warnings.simplefilter('always')
+                    fresh = self._parse_text(lit_text, graph_cls(), False, workers)
+            finally:
+                recorded = [(str(w.message), w.category, w.filename, w.lineno) for w in caught]
+                _replay_warnings(recorded)
+            meta = {'doc_iri': fresh.doc_iri, 'schema': fresh.schema, 'nodebase': fresh.nodebase,
+                    'typebase': fresh.typebase, 'prefixes': fresh.prefixes}
+            entry = CacheEntry(graph_cls().diff(fresh.graph), meta, recorded)
+            self.cache.put(key, entry)
+        else:
+            _replay_warnings(entry.warnings)
+
+        if graph_obj is None and fresh is not None:
+            graph_obj, nodes_before = fresh.graph, set()
+        else:
+            if graph_obj is None:
+                graph_obj = graph_cls()
+            held = graph_obj.assertion_ids
+            if held and any(rec.id in held or (rec.kind == 'edge' and rec.obj is not None
+                            and rec.obj[0] == 'node' and rec.obj[1] in held)
+                            for rec in entry.delta.added):
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')  # already issued above
+                    return self._parse_text(lit_text, graph_obj, merge, workers)
+            nodes_before = _node_ids(graph_obj)
+            graph_obj.apply(entry.delta)
+        nodes_added = self._settle(graph_obj, nodes_before, merge)
+        meta = dict(entry.meta)
+        return ParseResult(meta.pop('doc_iri'), graph_obj, nodes_added, **meta,
+                           profile=fresh.profile if fresh is not None else None)
+
+    def _cache_flags(self) -> tuple:
+        '''The settings that shape a parse result, part of every cache key.'''
+        return (self.document_source_assertions, self.strict_namespace_bases,
+                self.warn_implicit_doc_ids, self.warn_empty_blocks, self.lenient_arrows)
+
+    def parse_stream(self, fp, graph_obj=None, *, encoding: str | None = None,
+                     merge: bool = False) -> ParseResult:
+        '''
+        Parse Onya Literate from the file-like object `fp` a block at a time (see
+        `iter_parse`), so that the text and parse tree in memory at once are one block's
+        worth rather than the whole document's. Builds exactly the graph `parse()` would
+        from the same text.
+
+        Returns: `ParseResult(doc_iri, graph, nodes_added)`
+        '''
+        blocks = self.iter_parse(fp, graph_obj, encoding=encoding, merge=merge)
+        while True:
+            try:
+                next(blocks)
+            except StopIteration as done:
+                return done.value
+
+    def iter_parse(self, fp, graph_obj=None, *, encoding: str | None = None,
+                   merge: bool = False):
+        '''
+        Generator: parse Onya Literate from the file-like object `fp` (any iterable of text
+        or bytes lines), splitting it at top-level `#` node headers and `:name = """…"""`
+        definitions, and yield each node as soon as its block is built (the document node for
+        the `@docheader` block).
+
+        Edge targets and `::` text references are bound only once the input is exhausted,
+        since either may be defined further down: until then a yielded node's edges have no
+        target and its text-reference properties are empty. The `ParseResult` is the
+        generator's return value; `parse_stream()` runs the generator and returns it. Syntax
+        errors report line numbers within the whole document.
+        '''
+        if graph_obj is None:
+            from onya.graph import graph as graph_cls
+            graph_obj = graph_cls()
+
+        nodes_before = _node_ids(graph_obj)
+        doc = _new_doc()
+        doc.pending_text_refs = []  # text references are resolved at the end, see _create_assertion
+        encoding = encoding or self.encoding
+
+        for first_line, text in _split_blocks(fp, encoding):
+            for item in self._parse_string(text, line_offset=first_line - 1):
+                if isinstance(item, tuple) and item[0] == 'text_ref_def':
+                    doc.text_refs[item[1]] = str(item[2])
+                    continue
+                built = process_nodeblock(item, graph_obj, doc, self)
+                if built is not None:
+                    yield built
+
+        for prop, ref_name in doc.pending_text_refs:
+            prop.value = doc.text_refs.get(ref_name, '')
+        return self._finish(graph_obj, doc, nodes_before, merge)
+
+    def _parse_parallel(self, lit_text: str, workers: int) -> list:
+        '''
+        `_parse_string` over a process pool, for text the line scanner (`_scan`) declines;
+        text it accepts is scanned here, faster than any pool. The text is cut into blocks as
+        for streaming (`_split_blocks`), and runs of consecutive blocks, a few per worker, are
+        parsed independently, each still trying the scanner first. The items come back in
+        document order. Warnings raised in a worker are re-issued here. A piece that fails is
+        parsed again in this process, so the error raised is the one a serial parse of that
+        piece gives, with document line numbers.
+        '''
+        from concurrent.futures import ProcessPoolExecutor
+
+        if (items := _scan(lit_text)) is not None:
+            return items  # the scanner beats any pool; only grammar work is worth farming out
+        blocks = list(_split_blocks(io.StringIO(lit_text), self.encoding))
+        if len(blocks) < 2:
+            return self._parse_string(lit_text)
+        target = max(1, len(lit_text) // (workers * _PIECES_PER_WORKER))
+        jobs, pending, first, size = [], [], 1, 0
+        for line, text in blocks:
+            if not pending:
+                first = line
+            pending.append(text)
+            size += len(text)
+            if size >= target:
+                jobs.append((self.lenient_arrows, first - 1, ''.join(pending)))
+                pending, size = [], 0
+        if pending:
+            jobs.append((self.lenient_arrows, first - 1, ''.join(pending)))
+
+        parsed = []
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            for job, (items, caught) in zip(jobs, pool.map(_parse_piece, jobs)):
+                for message, category in caught:
+                    warnings.warn(message, category, stacklevel=3)
+                if items is None:
+                    items = self._parse_string(job[2], line_offset=job[1])
+                parsed.extend(items)
+        return parsed
+
+    def _finish(self, graph_obj, doc: doc_info, nodes_before: set, merge: bool) -> ParseResult:
+        '''Bind deferred edges, check id collisions, optionally merge, and report.'''
         # Third pass: resolve deferred edge targets now that every @id is known. A target
         # id matching a registered assertion @id links to that assertion; otherwise it is a
         # node id (an existing node, else a freshly-minted one).
         _resolve_pending_edges(graph_obj, doc)
 
+        nodes_added = self._settle(graph_obj, nodes_before, merge)
+
+        # Surface the docheader namespace convention so consumers can re-serialize compactly.
+        # `doc.iris` includes the auto-registered `schema` entry; exclude it (schema travels
+        # separately, matching write()'s `prefixes` parameter).
+        prefixes = {k: v for k, v in (doc.iris or {}).items() if k != 'schema'}
+        profile = ParseProfile(doc.resolve_hits + doc.resolve_misses, doc.resolve_hits)
+        return ParseResult(doc.iri, graph_obj, nodes_added,
+                           schema=doc.schemabase, nodebase=doc.nodebase,
+                           typebase=doc.typebase, prefixes=prefixes, profile=profile)
+
+    def _settle(self, graph_obj, nodes_before: set, merge: bool) -> set:
+        '''Check id collisions and optionally merge; returns the ids of nodes added.'''
         # Parse-time collision: an @id shares the node id space, so it must not equal any node id.
         assertion_ids = getattr(graph_obj, 'assertion_ids', {})
         node_ids = getattr(graph_obj, 'nodes', {})
@@ -409,18 +648,9 @@ class LiterateParser:
         if merge:
             graph_obj.merge()
 
-        nodes_after = set(getattr(graph_obj, 'nodes', {}).keys()) if hasattr(graph_obj, 'nodes') else set(graph_obj)
-        nodes_added = nodes_after - nodes_before
-
-        # Surface the docheader namespace convention so consumers can re-serialize compactly.
-        # `doc.iris` includes the auto-registered `schema` entry; exclude it (schema travels
-        # separately, matching write()'s `prefixes` parameter).
-        prefixes = {k: v for k, v in (doc.iris or {}).items() if k != 'schema'}
-        return ParseResult(doc.iri, graph_obj, nodes_added,
-                           schema=doc.schemabase, nodebase=doc.nodebase,
-                           typebase=doc.typebase, prefixes=prefixes)
+        return _node_ids(graph_obj) - nodes_before
 
-    def _parse_string(self, lit_text):
+    def _parse_string(self, lit_text, *, line_offset: int = 0):
         '''
         Run the grammar, converting a stray-edge-arrow failure into either a friendly
         `EdgeArrowError` (default) or a warn-and-continue reparse (`lenient_arrows`).
@@ -430,7 +660,11 @@ class LiterateParser:
         arrow *there*, gated on an actual failure. That means arrows sitting harmlessly inside
         a property value never trigger this (those lines parse fine), and any failure whose
         line holds no known bad arrow is handed to `_diagnose_syntax` for a friendly message.
+        `line_offset` shifts reported line numbers for a block cut from a longer document.
         '''
+        # The common subset needs no grammar at all; see `_scan`.
+        if (items := _scan(lit_text)) is not None:
+            return items
         text = lit_text
         # Bound the lenient reparse loop: each pass fixes one line, so line-count+1 is ample.
         for _ in range(text.count('\n') + 2):
@@ -440,18 +674,18 @@ class LiterateParser:
                 match = _BAD_ARROW_RE.search(exc.line or '')
                 if match is None:
                     # Not an arrow slip — translate the raw failure into an actionable message.
-                    raise _diagnose_syntax(exc) from exc
+                    raise _diagnose_syntax(exc, line_offset) from exc
                 arrow = match.group(0)
                 corrected = _BAD_ARROW_RE.sub('->', exc.line)
                 if not self.lenient_arrows:
                     raise EdgeArrowError(
-                        f'line {exc.lineno}: {_describe_bad_arrow(arrow)} is not a valid Onya '
+                        f'line {exc.lineno + line_offset}: {_describe_bad_arrow(arrow)} is not a valid Onya '
                         f"edge arrow. Use '->' or '→' (U+2192) instead. Corrected line:\n"
                         f'    {corrected.strip()}'
                     ) from exc
                 # Lenient: warn, rewrite every bad arrow on the failing line, and reparse.
                 warnings.warn(
-                    f'line {exc.lineno}: {_describe_bad_arrow(arrow)} used as an edge arrow; '
+                    f'line {exc.lineno + line_offset}: {_describe_bad_arrow(arrow)} used as an edge arrow; '
                     "treating it as '->'. Prefer '->' or '→' (U+2192).",
                     stacklevel=3,
                 )
@@ -462,7 +696,7 @@ class LiterateParser:
         try:
             return node_seq.parse_string(text, parse_all=True)
         except ParseBaseException as exc:
-            raise _diagnose_syntax(exc) from exc
+            raise _diagnose_syntax(exc, line_offset) from exc
 
     def _node_base(self, doc: doc_info) -> str | None:
         '''
@@ -572,7 +806,7 @@ def _describe_bad_arrow(arrow: str) -> str:
     return f'{arrow!r} ({inner})'
 
 
-def _diagnose_syntax(exc) -> LiterateSyntaxError:
+def _diagnose_syntax(exc, line_offset: int = 0) -> LiterateSyntaxError:
     '''
     Translate a pyparsing failure into a `LiterateSyntaxError` with an actionable message.
 
@@ -581,9 +815,12 @@ def _diagnose_syntax(exc) -> LiterateSyntaxError:
     the common slips (a spaced node id, an unclosed `[Type]`, a stray/malformed assertion, a
     Markdown code fence, preamble prose) and always returns a clean message — falling back to
     a generic one that still names what the parser expected, never the raw grammar dump. The
-    original exception is chained via ``raise ... from exc`` at the call site.
+    original exception is chained via ``raise ... from exc`` at the call site. `line_offset`
+    is the number of document lines before the parsed text (for a block parsed on its own).
     '''
     lineno = getattr(exc, 'lineno', None)
+    if lineno and line_offset:
+        lineno += line_offset
     raw = getattr(exc, 'line', '') or ''
     stripped = raw.strip()
     where = f'line {lineno}' if lineno else 'input'
@@ -739,6 +976,205 @@ text_ref_def.set_parse_action(_make_text_ref_def)
 value_expr.set_parse_action(_make_value)
 
 
+# Line-oriented fast path. Literate is line-structured, so the common subset (headers, bullets,
+# whole-line comments between blocks, text reference definitions) is scanned here a line at a
+# time with plain regexes, producing exactly the node blocks and prop_info the grammar above
+# would. Anything outside that subset, including every syntax error, makes `_scan` return None
+# and the document goes through `node_seq`, which owns the diagnostics. The patterns mirror the
+# grammar terminals one for one; test_serial_literate_scan.py checks parity.
+_IRIREF_CHAR = r'[^<>"{}|^`\\\[\]\x00-\x20]'
+_SCAN_HEADER = re.compile(r'(#+)(?!#)[ \t]*(%s+)[ \t]*(?:\[([^\]\n\r]*)\])?[ \t]*$' % _IRIREF_CHAR)
+_SCAN_BULLET = re.compile(r'([ \t]*)\*[ \t]+')
+# explicit_iriref | CURIE_LABEL | IDENT_KEY, first match wins as in ASSERTION_LABEL
+_SCAN_LABEL = re.compile(r'<(%s*)>|([A-Za-z][\w.\-]*:[A-Za-z][\w.\-]*)|(@?[A-Za-z][A-Za-z0-9_-]*)' % _IRIREF_CHAR)
+_SCAN_CONNECTOR = re.compile(r'[ \t]*(::|:|->|→)[ \t]*')
+_SCAN_EXPLICIT_IRI = re.compile(r'<(%s*)>[ \t]*' % _IRIREF_CHAR)
+_SCAN_IRIREF = re.compile(r'%s+[ \t]*' % _IRIREF_CHAR)
+_SCAN_COMMENT_LINE = re.compile(r'[ \t]*(?:<!--(?:(?!-->)[\s\S])*-->[ \t]*)+')
+_SCAN_TEXT_REF_DEF = re.compile(r':[ \t]*([A-Za-z][A-Za-z0-9_-]*)[ \t]*=[ \t]*')
+_SCAN_TRIPLE_QUOTED = TRIPLE_QUOTED_STRING.re
+_SCAN_EOL = re.compile(r'[ \t]*(?:\n|\Z)')
+
+
+def _scan_value(rest: str):
+    '''
+    The value_info `value_expr` would build from `rest` (the line after the connector), or
+    None when pyparsing must decide.
+    '''
+    lead = rest[:1]
+    if lead == '<':
+        if m := _SCAN_EXPLICIT_IRI.match(rest):
+            if m.end() != len(rest):
+                return None
+            return value_info(verbatim=I(m.group(1)), typeindic=value_type.RES_VAL)
+    elif lead == '"' or lead == "'":
+        if '\\' in rest:
+            return None  # escapes are QuotedString's business
+        close = rest.find(lead, 1)
+        if close > 0:
+            if rest[close + 1:].strip(' \t'):
+                return None
+            return value_info(verbatim=LITERAL(rest[1:close]), typeindic=value_type.TEXT_VAL)
+    return value_info(verbatim=rest.strip(), typeindic=value_type.UNKNOWN_VAL)
+
+
+def _scan_bullet(line: str) -> prop_info | None:
+    '''The prop_info for one `* …` line, or None when pyparsing must decide.'''
+    if not (m := _SCAN_BULLET.match(line)) or m.end() == len(line):
+        return None
+    if not (lm := _SCAN_LABEL.match(line, m.end())):
+        return None
+    if lm.group(1) is not None:
+        key = I(lm.group(1))
+    else:
+        key = lm.group(2) or lm.group(3)
+    if not (cm := _SCAN_CONNECTOR.match(line, lm.end())):
+        return None
+    indent = len(m.group(1))
+    connector, rest = cm.group(1), line[cm.end():]
+    if connector == '::':
+        if not _SCAN_IRIREF.fullmatch(rest):
+            return None
+        return prop_info(indent=indent, key=key, value=I(rest.rstrip(' \t')), is_text_ref=True)
+    value = _scan_value(rest)
+    if value is None:
+        return None
+    return prop_info(indent=indent, key=key, value=value, is_edge=connector != ':')
+
+
+def _scan(text: str) -> list | None:
+    '''
+    Scan Onya Literate `text` into the items `node_seq` would produce: node blocks as
+    `[headermarks, nid, ntype, props]` and `('text_ref_def', name, LITERAL)` tuples. Returns
+    None if the text strays outside the subset the scanner handles (see above).
+    '''
+    if '\r' in text:
+        return None
+    if '\t' in text:
+        text = text.expandtabs()  # as pyparsing's parse_string does before matching
+    items = []
+    props = None  # the open block's propset; None at block level
+    started = False  # the propset has begun, so a blank line closes it
+    flush = False  # only empty lines since the block's header
+    pos, end = 0, len(text)
+    while pos < end:
+        nl = text.find('\n', pos)
+        stop = end if nl < 0 else nl
+        line = text[pos:stop]
+        lead = line[:1]
+        if lead == '#':
+            if nl < 0 or not (m := _SCAN_HEADER.match(line)):
+                return None
+            props, started, flush = [], False, True
+            items.append([m.group(1), I(m.group(2)), m.group(3), props])
+        elif lead == ':':
+            if not (m := _SCAN_TEXT_REF_DEF.match(text, pos)):
+                return None
+            if not (q := _SCAN_TRIPLE_QUOTED.match(text, m.end())) or not (eol := _SCAN_EOL.match(text, q.end())):
+                return None
+            items.append(('text_ref_def', m.group(1), LITERAL(q.group(1))))
+            props = None
+            pos = eol.end()
+            continue
+        elif not line.strip(' \t'):
+            if started:
+                props = None
+            flush = flush and not line
+        elif line.lstrip(' \t')[:1] == '*':
+            if props is None:
+                return None
+            if (pi := _scan_bullet(line)) is None:
+                return None
+            if not started and flush:
+                # The grammar skips the whitespace before a first bullet that directly follows
+                # the header's newlines, but keeps it after a comment or whitespace-only line
+                pi.indent = 0
+            props.append(pi)
+            started = True
+        elif _SCAN_COMMENT_LINE.fullmatch(line):
+            if started or nl < 0:
+                return None  # a propset COMMENT item, or a comment ending the text unterminated
+            flush = False
+        else:
+            return None
+        pos = stop + 1
+    return items or None
+
+
+# Pieces per worker in a parallel parse: enough to even out uneven blocks without paying
+# a process round trip per block
+_PIECES_PER_WORKER = 4
+
+
+def _replay_warnings(recorded) -> None:
+    '''Re-issue `(message, category, filename, lineno)` warnings recorded from a parse.'''
+    for message, category, filename, lineno in recorded:
+        warnings.warn_explicit(message, category, filename, lineno)
+
+
+def _parse_piece(job) -> tuple:
+    '''
+    Process-pool worker for `LiterateParser._parse_parallel`: parse one piece of a document
+    into plain (picklable) items, with the warnings raised meanwhile. Items are None if the
+    piece does not parse.
+    '''
+    lenient_arrows, line_offset, text = job
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        try:
+            items = LiterateParser(lenient_arrows=lenient_arrows)._parse_string(text, line_offset=line_offset)
+        except LiterateParseError:
+            return None, []
+    plain = [item if isinstance(item, tuple) else [item[0], item[1], item[2], list(item[3])]
+             for item in items]
+    return plain, [(str(w.message), w.category) for w in caught]
+
+
+def _comment_open(line: str, is_open: bool) -> bool:
+    '''Whether an html comment is still open after `line`, given whether one was before it.'''
+    pos = 0
+    while True:
+        found = line.find('-->' if is_open else '<!--', pos)
+        if found < 0:
+            return is_open
+        pos = found + (3 if is_open else 4)
+        is_open = not is_open
+
+
+def _split_blocks(lines, encoding: str):
+    '''
+    Cut a stream of Literate lines into top-level blocks for `LiterateParser.iter_parse`,
+    yielding `(first_line_number, text)`. A block starts at a `#` header or `:name = """`
+    definition at column 0, except inside a definition's triple-quoted text or an open html
+    comment. Leading comments and blank lines ride with the first block. The split is
+    conservative: text the grammar would read differently (a comment opener swallowed by a
+    value, say) only makes a block larger.
+    '''
+    chunk, first, lineno = [], 1, 0
+    started = in_text = in_comment = False
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode(encoding)
+        lineno += 1
+        lead = line[:1]
+        if not in_text and not in_comment and (lead == '#' or lead == ':'):
+            if started:
+                yield first, ''.join(chunk)
+                chunk, first = [], lineno
+            started = True
+            if lead == ':':
+                in_text = line.count('"""') == 1  # opened, closed on a later line
+                chunk.append(line)
+                continue
+        elif in_text:
+            in_text = '"""' not in line
+            chunk.append(line)
+            continue
+        in_comment = _comment_open(line, in_comment)
+        chunk.append(line)
+    yield first, ''.join(chunk)  # the last block, or everything when there was none
+
+
 _SCHEME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+\-.]*:')
 
 
@@ -771,6 +1207,26 @@ def _expand_curie(iri_in: str, doc: doc_info | None) -> str | None:
 
 
 def expand_iri(iri_in, base, nodecontext=None, doc=None):
+    '''
+    Resolve the reference `iri_in` against `base` (see `_expand_iri`). With a `doc`, the
+    result is memoized in `doc.resolved`, so each distinct (token, base) pair is expanded
+    once per document. A token rejected under a `nodecontext` is never memoized, so it is
+    rejected every time.
+    '''
+    memo = doc.resolved if doc is not None else None
+    if memo is None or iri_in is None:
+        return _expand_iri(iri_in, base, nodecontext, doc)
+    key = (iri_in, base, bool(nodecontext))
+    result = memo.get(key)
+    if result is None:
+        doc.resolve_misses += 1
+        result = memo[key] = _expand_iri(iri_in, base, nodecontext, doc)
+    else:
+        doc.resolve_hits += 1
+    return result
+
+
+def _expand_iri(iri_in, base, nodecontext=None, doc=None):
     if iri_in is None:
         return ONYA_NULL
 
@@ -851,9 +1307,14 @@ def _create_assertion(parent, pi, assertion_label, doc, parser: LiterateParser |
     created = None
     if pi.is_text_ref:
         ref_name = str(pi.value) if pi.value else None
-        # Unknown reference falls back to an empty string value (kept lenient rather than raising).
-        str_val = doc.text_refs.get(ref_name, '') if ref_name else ''
-        created = parent.add_property(assertion_label, str_val)
+        if ref_name and doc.pending_text_refs is not None:
+            # Streaming: the definition may still be ahead; `iter_parse` fills the value in
+            created = parent.add_property(assertion_label, '')
+            doc.pending_text_refs.append((created, ref_name))
+        else:
+            # Unknown reference falls back to an empty string value (kept lenient rather than raising).
+            str_val = doc.text_refs.get(ref_name, '') if ref_name else ''
+            created = parent.add_property(assertion_label, str_val)
     elif pi.value is not None:
         val = pi.value.verbatim
         if pi.is_edge:
@@ -952,7 +1413,8 @@ def _build_assertions(node, props, graph_obj, doc, parser: LiterateParser | None
                 parent.interp = None if resolved is _CANCEL else resolved
             continue
 
-        assertion_label = expand_iri(pi.key, doc.schemabase, doc=doc)
+        # Interned, so the label object is shared by every assertion carrying it
+        assertion_label = _intern(graph_obj, expand_iri(pi.key, doc.schemabase, doc=doc))
         created = _create_assertion(parent, pi, assertion_label, doc, parser)
         if created is not None:
             saw_assertion = True
@@ -972,10 +1434,9 @@ def process_nodeblock(nodeblock, graph_obj, doc, parser: LiterateParser | None =
     headermarks, nid, ntype, props = nodeblock
 
     if nid == '@docheader':
-        process_docheader(props, graph_obj, doc, parser)
-        return
+        return process_docheader(props, graph_obj, doc, parser)
 
-    nid = _resolve_node_id(nid, doc, parser)
+    nid = _intern(graph_obj, _resolve_node_id(nid, doc, parser))
 
     # Get or create the node
     if nid not in graph_obj:
@@ -1002,6 +1463,7 @@ def process_nodeblock(nodeblock, graph_obj, doc, parser: LiterateParser | None =
             f'no change to the constructed model beyond ensuring the node id exists.',
             stacklevel=2,
         )
+    return n
 
 
 def process_docheader(props, graph_obj, doc, parser: LiterateParser | None = None):
@@ -1098,4 +1560,5 @@ def process_docheader(props, graph_obj, doc, parser: LiterateParser | None = Non
             doc_node = graph_obj[doc.iri]
         doc_node.types.add(ONYA_DOCUMENT)  # implicit type for document nodes
         _build_assertions(doc_node, assertion_props, graph_obj, doc, parser)
-    return
+        return doc_node
+    return None
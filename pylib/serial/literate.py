@@ -22,10 +22,12 @@ from onya.serial._literate_parse import (
     LiterateParser,
     LiterateSyntaxError,
     NamespaceBaseError,
+    ParseProfile,
     ParseResult,
     SchemaPrefixConflict,
     ensure_namespace_separator,
 )
+from onya.serial.parsecache import ParseCache
 
 __all__ = [
     'read',
@@ -33,6 +35,7 @@ __all__ = [
     'longtext',
     'LiterateParser',
     'ParseResult',
+    'ParseProfile',
     'SchemaPrefixConflict',
     'NamespaceBaseError',
     'InterpretationParseError',
@@ -40,6 +43,7 @@ __all__ = [
     'EdgeArrowError',
     'LiterateSyntaxError',
     'AssertionIdConflict',
+    'ParseCache',
 ]
 
 
@@ -236,7 +240,7 @@ def write(
 
 
 def read(fp, g=None, *, document_source_assertions: bool = False, encoding: str = 'utf-8',
-         merge: bool = False, lenient_arrows: bool = False):
+         merge: bool = False, lenient_arrows: bool = False, stream: bool = False, cache=None):
     '''
     Read Onya Literate format from a file-like object (or text string) into a graph.
 
@@ -248,13 +252,20 @@ def read(fp, g=None, *, document_source_assertions: bool = False, encoding: str
         False (parsing accumulates distinct occurrences; merge stays on-demand).
     lenient_arrows -- if True, accept a stray rightward arrow (e.g. ``➡``, ``=>``) used as an
         edge connector, warn, and continue. Default False raises ``EdgeArrowError``.
+    stream -- if True and ``fp`` is a file-like object, parse it a block at a time
+        (``LiterateParser.parse_stream``) instead of reading it whole; same resulting graph.
+    cache -- a ``ParseCache`` (or a directory path for one): documents read before are
+        loaded from it instead of parsed (see ``LiterateParser``). Not used when streaming.
 
     Returns: ``ParseResult(doc_iri, graph, nodes_added)``
     '''
-    text = fp if isinstance(fp, str) else fp.read()
     parser = LiterateParser(
         document_source_assertions=document_source_assertions,
         encoding=encoding,
         lenient_arrows=lenient_arrows,
+        cache=cache,
     )
+    if stream and not isinstance(fp, str):
+        return parser.parse_stream(fp, g, encoding=encoding, merge=merge)
+    text = fp if isinstance(fp, str) else fp.read()
     return parser.parse(text, g, encoding=encoding, merge=merge)
@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: 2023-present Oori Data <info@oori.dev>
+# SPDX-License-Identifier: Apache-2.0
+# onya.serial.parsecache
+'''
+An opt-in on-disk cache of Onya Literate parses, so that warm loads of unchanged documents
+skip parsing entirely.
+
+An entry is keyed by a SHA-256 over the document text, the parser flags that shape the
+result, the Onya version and the entry format, so any change to any of these is simply a
+miss. It holds the parsed graph as a `GraphDelta` from the empty graph (see `onya.delta`,
+plain data that pickles compactly and re-applies quickly), the `ParseResult` metadata and the
+warnings the parse raised, which are re-issued on every load.
+
+Entries are files under one directory. Each load refreshes the entry's mtime, and each store
+evicts least recently used entries until the directory is back under `max_bytes`. Entries
+are pickles: point the cache at a directory only you can write to.
+
+    from onya.serial.literate import LiterateParser, ParseCache
+
+    parser = LiterateParser(cache=ParseCache('~/.cache/onya'))
+    r = parser.parse(text)    # parses and stores; the next parse of `text` loads instead
+'''
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from onya.__about__ import __version__
+from onya.delta import GraphDelta
+
+__all__ = ['ParseCache', 'CacheEntry']
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Bump when CacheEntry or the way it is built changes
+FORMAT = 1
+SUFFIX = '.parse'
+
+
+@dataclass
+class CacheEntry:
+    '''
+    A cached parse: `delta` rebuilds the graph from an empty one, `meta` holds the
+    `ParseResult` fields other than the graph, and `warnings` lists the
+    `(message, category, filename, lineno)` the parse emitted.
+    '''
+    delta: GraphDelta
+    meta: dict
+    warnings: list = field(default_factory=list)
+
+
+class ParseCache:
+    '''
+    A directory of cached Literate parses, bounded to about `max_bytes` with least recently
+    used eviction (see module docstring). Counts `hits` and `misses`.
+    '''
+    def __init__(self, root: str | os.PathLike, *, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root).expanduser()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({str(self.root)!r}, max_bytes={self.max_bytes})'
+
+    @staticmethod
+    def key(text: str, flags: tuple) -> str:
+        '''The entry key for Literate `text` parsed with parser `flags`.'''
+        h = hashlib.sha256(f'{FORMAT}\0{__version__}\0{flags!r}\0'.encode('utf-8'))
+        h.update(text.encode('utf-8', 'surrogatepass'))
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f'{key}{SUFFIX}'
+
+    def get(self, key: str) -> CacheEntry | None:
+        '''The entry for `key`, marked most recently used, or None.'''
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:  # truncated or from an incompatible build: drop it and reparse
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        '''Store `entry` under `key` (atomically), then evict down to `max_bytes`.'''
+        path = self._path(key)
+        tmp = path.with_name(path.name + f'.tmp-{os.getpid()}')
+        with open(tmp, 'wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        self._evict(keep=path)
+
+    def _evict(self, keep: Path) -> None:
+        entries = []
+        total = 0
+        for p in self.root.glob(f'*{SUFFIX}'):
+            try:
+                st = p.stat()
+            except FileNotFoundError:  # evicted concurrently
+                continue
+            entries.append((st.st_mtime, p, st.st_size))
+            total += st.st_size
+        if total <= self.max_bytes:
+            return
+        for _, p, size in sorted(entries):
+            if p == keep:
+                continue
+            p.unlink(missing_ok=True)
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self) -> None:
+        '''Remove every entry.'''
+        for p in self.root.glob(f'*{SUFFIX}'):
+            p.unlink(missing_ok=True)
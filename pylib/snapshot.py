@@ -0,0 +1,212 @@
+# SPDX-FileCopyrightText: 2023-present Oori Data <info@oori.dev>
+# SPDX-License-Identifier: Apache-2.0
+# onya.snapshot
+'''
+Copy-on-write, read-only views of a live graph (see `graph.snapshot()`).
+
+A `graph_snapshot` starts out sharing the live graph's node table and owns nothing. A node
+becomes the snapshot's own private copy at most once, at whichever of two moments comes
+first:
+
+- a reader asks for it. The copy is taken under the snapshot's lock, and a writer cannot
+  start changing a node it has not yet handed over while that lock is held.
+- the live graph is about to change it. Every mutation path in the model API reports the
+  node at the top of the changed assertion's origin chain first, and the pre-change state is
+  copied in.
+
+Nodes added to the live graph after the snapshot are recorded as absent from it; deleted
+ones are copied in before they go. So an ingest thread can keep calling `union()` while
+readers work from a stable picture, and neither side waits on the other for longer than
+one node copy.
+
+Node and assertion objects read from a snapshot are private copies, and their edges still
+point at the live graph's target objects. Follow an edge with `snapshot.target(e)` to stay
+inside the snapshot.
+
+    >>> snap = g.snapshot()
+    >>> g.union(delta)            # e.g. on an ingest thread
+    >>> snap[CHUKS].edges         # as it was when the snapshot was taken
+'''
+
+from __future__ import annotations
+import threading
+import weakref
+from collections.abc import Iterator, Mapping
+
+from amara.iri import I
+
+from onya.graph import graph, node, assertion, edge, iter_assertions, _copy_node
+
+__all__ = ['graph_snapshot']
+
+_ABSENT = object()  # marks a node id the live graph did not hold when the snapshot was taken
+
+
+class graph_snapshot(Mapping):
+    '''
+    A read-only view of a `graph` frozen at the moment `graph.snapshot()` was called: a
+    `Mapping` of node id -> node (private copies, materialized on demand), with
+    `select()`, `match()`, `typematch()` and `target()` for reading. `close()` (or leaving a
+    `with` block) detaches it from the live graph.
+    '''
+    # Compared and hashed by identity (the live graph tracks open views in a WeakSet), not
+    # item-wise as a Mapping would, which would copy every node.
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __init__(self, g: graph):
+        self._live = g
+        self._own: dict = {}  # node id -> this snapshot's copy, or _ABSENT
+        self._lock = threading.Lock()
+        if g._snapshots is None:
+            g._snapshots = weakref.WeakSet()
+        g._snapshots.add(self)
+
+    def close(self) -> None:
+        '''Stop tracking the live graph. Nodes not yet copied become unreadable.'''
+        if self._live is not None and self._live._snapshots is not None:
+            self._live._snapshots.discard(self)
+        self._live = None
+
+    def __enter__(self) -> 'graph_snapshot':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _preserve(self, nid, copied: list) -> None:
+        '''Take node `nid`'s current live state, unless this snapshot already has its own.'''
+        if nid in self._own:
+            return
+        with self._lock:
+            if nid in self._own:
+                return
+            live = self._live.nodes.get(nid)
+            if live is None:
+                self._own[nid] = _ABSENT
+                return
+            if not copied:
+                copied.append(_copy_node(live))
+            self._own[nid] = copied[0]
+
+    def _node(self, nid):
+        found = self._own.get(nid)
+        if found is None:
+            if self._live is None:
+                raise ValueError('Snapshot is closed')
+            with self._lock:
+                found = self._own.get(nid)
+                if found is None:
+                    live = self._live.nodes.get(nid)
+                    found = self._own[nid] = _ABSENT if live is None else _copy_node(live)
+        return None if found is _ABSENT else found
+
+    def __getitem__(self, nid: I | str) -> node:
+        found = self._node(nid)
+        if found is None:
+            raise KeyError(nid)
+        return found
+
+    def __contains__(self, nid) -> bool:
+        return self._node(nid) is not None
+
+    def __iter__(self) -> Iterator[I | str]:
+        # List the live ids before copying the override table: a writer records a node in
+        # the table before adding or removing it, so this order cannot miss a change.
+        live_ids = list(self._live.nodes) if self._live is not None else []
+        own = dict(self._own)
+        for nid in live_ids:
+            if own.get(nid) is not _ABSENT:
+                yield nid
+        seen = set(live_ids)
+        for nid, found in own.items():
+            if found is not _ABSENT and nid not in seen:
+                yield nid
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__} of {self._live!r}'
+
+    def target(self, e: edge) -> node | assertion | None:
+        '''
+        The snapshot's version of edge `e`'s target: the node with the target's id, or for an
+        identified assertion target, the assertion with that id under its node's copy.
+        '''
+        tgt = e.target
+        if tgt is None:
+            return None
+        if not isinstance(tgt, assertion):
+            return self._node(tgt.id)
+        root = self._node(tgt._root.id)
+        if root is None or tgt.id is None:
+            return None
+        return next((a for a in iter_assertions((root,), snapshot=False) if a.id == tgt.id), None)
+
+    def typematch(self, types: I | str | set[I | str]) -> Iterator[node]:
+        '''Find nodes with matching types (any of `types`). Walks (and so copies) every node.'''
+        if isinstance(types, (str, I)):
+            types = {types}
+        types = set(types)
+        for nid in list(self):
+            n = self._node(nid)
+            if n is not None and not types.isdisjoint(n.types):
+                yield n
+
+    def select(self, origin: I | str | node | assertion | None = None,
+               label: I | str | None = None, *,
+               value: str | None = None,
+               target: I | str | node | assertion | None = None,
+               id: I | str | None = None,
+               deep: bool = False) -> Iterator[assertion]:
+        '''
+        `graph.select()` over the snapshot, with the same constraints and results drawn from
+        the snapshot's copies. The live graph's indexes describe its current state, not this
+        one, so only an `origin=` anchor avoids walking (and copying) every node. An origin
+        object must itself come from this snapshot.
+        '''
+        if value is not None and target is not None:
+            raise ValueError('select() takes at most one of value= (properties) or target= (edges)')
+        if origin is None:
+            containers = (self._node(nid) for nid in list(self))
+        elif isinstance(origin, assertion):
+            containers = [origin] if deep else []
+        else:
+            containers = [self._node(origin if isinstance(origin, str) else origin.id)]
+        for c in containers:
+            if c is None:
+                continue
+            walk = iter_assertions((c,), deep=deep) if origin is None else (*c.properties, *c.edges)
+            for a in walk:
+                if label is not None and a.label != label:
+                    continue
+                if id is not None and a.id != id:  # noqa: A002 - `id` names the @id component
+                    continue
+                if value is not None and (isinstance(a, edge) or a.value != value):
+                    continue
+                if target is not None and not (isinstance(a, edge) and _target_matches(a.target, target)):
+                    continue
+                yield a
+
+    def match(self, origin: I | str | None = None,
+              label: I | str | None = None,
+              ) -> Iterator[tuple[I | str, I | str, str | I, dict]]:
+        '''`graph.match()` over the snapshot: `(origin, relation, target, annotations)` tuples.'''
+        for a in self.select(origin=origin, label=label):
+            annotations = {p.label: p.value for p in a.properties}
+            if isinstance(a, edge):
+                yield (a.origin.id, a.label, a.target.id if a.target is not None else None, annotations)
+            else:
+                yield (a.origin.id, a.label, a.value, annotations)
+
+
+def _target_matches(tgt, wanted) -> bool:
+    if tgt is None:
+        return False
+    if isinstance(wanted, str):
+        return tgt.id == wanted
+    if tgt is wanted:
+        return True
+    # the snapshot's copies stand in for the live objects their edges still point at
+    return tgt.id is not None and tgt.id == wanted.id and isinstance(tgt, assertion) == isinstance(wanted, assertion)
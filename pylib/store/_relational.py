@@ -40,7 +40,7 @@ from __future__ import annotations
 import hashlib
 from dataclasses import dataclass
 
-from onya.graph import GraphMergeError, edge
+from onya.graph import GraphMergeError, edge, iter_assertions
 
 SKELETON_HASH_VERSION = '1'
 SCHEMA_VERSION = '1'
@@ -187,28 +187,27 @@ class ARecord:
 def iter_records(node) -> list[ARecord]:
     '''Flatten a node's assertions (recursively) into pre-order ``ARecord``s with hashes.'''
     records: list[ARecord] = []
-
-    def walk(container, parent, origin_key: str):
-        for a in list(container.properties) + list(container.edges):
-            is_edge = isinstance(a, edge)
-            kind = 'E' if is_edge else 'P'
-            label = str(a.label)
-            if is_edge:
-                target_id = str(a.target.id)
-                value = None
-                payload = target_id
-            else:
-                target_id = None
-                value = str(a.value)
-                payload = value
-            sk = skeleton_hash(kind, origin_key, label, payload)
-            eid = str(a.id) if a.id is not None else None
-            interp = str(a.interp) if a.interp is not None else None
-            records.append(ARecord(a, parent, kind, label, target_id, value, interp, eid, sk))
-            child_key = eid if eid is not None else hexhash(sk)
-            walk(a, a, child_key)
-
-    walk(node, None, str(node.id))
+    # An assertion's children are keyed by its explicit id, else by its skeleton hash
+    keys = {id(node): str(node.id)}
+    for a in iter_assertions((node,)):
+        parent = a.origin if a.origin is not node else None
+        is_edge = isinstance(a, edge)
+        kind = 'E' if is_edge else 'P'
+        label = str(a.label)
+        if is_edge:
+            target_id = str(a.target.id)
+            value = None
+            payload = target_id
+        else:
+            target_id = None
+            value = str(a.value)
+            payload = value
+        sk = skeleton_hash(kind, keys[id(a.origin)], label, payload)
+        eid = str(a.id) if a.id is not None else None
+        interp = str(a.interp) if a.interp is not None else None
+        records.append(ARecord(a, parent, kind, label, target_id, value, interp, eid, sk))
+        if a.properties or a.edges:
+            keys[id(a)] = eid if eid is not None else hexhash(sk)
     return records
 
 
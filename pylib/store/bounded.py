@@ -0,0 +1,276 @@
+# SPDX-FileCopyrightText: 2023-present Oori Data <info@oori.dev>
+# SPDX-License-Identifier: Apache-2.0
+# onya.store.bounded
+'''
+A bounded-memory ``graph`` over an ``AssertionStore``, for graphs larger than RAM.
+
+``bounded_graph`` keeps at most ``capacity`` nodes resident. Its node table
+(``graph.nodes``) is an LRU: looking a node up by id (``g[nid]``, ``nid in g``, ``g.get``)
+faults it in from the store with ``subgraph(name, {nid}, hops=0)`` when it is not resident,
+and the least recently used *clean* nodes are evicted to make room. A node is unsaved
+(pinned in memory) from its first change through the model API until ``flush()`` writes it
+back with ``put(merge=True)``, so no change is ever evicted unwritten.
+
+Everything else is the familiar ``graph`` API, answered over the resident nodes:
+``select()``, ``typematch()``, ``node.reverse()``, ``query()`` and iteration see what is in
+memory right now. Use ``prefetch()`` to bring a working set in with one store round trip,
+and the store's own ``match()`` for questions about the whole stored graph.
+
+An edge whose target is not resident points at a bare placeholder node carrying the
+target's id, exactly as the store's ``subgraph()`` represents a dangling target. When the
+target is an identified assertion whose node was evicted, the placeholder is an assertion
+with that ``@id``, so the edge keeps its kind for ``select()`` and merge. Follow
+edges with ``target(e)`` (as on ``onya.snapshot.graph_snapshot``), which faults the real
+target in; placeholders are rebound to the real object whenever it becomes resident.
+
+Write-back follows the store's merge-on-write semantics: assertions and nodes added in
+memory reach the store, but removals and node deletions change the resident copy only.
+Store calls run the coroutine with ``asyncio.run``, so, as for ``onya.store.sync``, use a
+loop-per-call backend (``sqlite:``) from synchronous code.
+
+    from onya.store import connect
+    from onya.store.bounded import bounded_graph
+
+    store = asyncio.run(connect('sqlite:big.db'))
+    g = bounded_graph(store, 'http://example.org/g', capacity=50_000)
+    for e in g[START].traverse(KNOWS):
+        print(g.target(e).id)
+'''
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from amara.iri import I
+
+from onya.graph import graph, node, assertion, edge, iter_assertions, _copy_node
+from onya.store.base import AssertionStore
+
+__all__ = ['bounded_graph']
+
+DEFAULT_CAPACITY = 10_000
+
+
+class _assertion_placeholder(assertion):
+    '''
+    Stands in, outside any graph, for a non-resident identified assertion as an edge target:
+    it carries the `@id` (and, when known, the label) and keys as an assertion target.
+    '''
+    __slots__ = ()
+
+    def __init__(self, aid: I | str, home: I | str, label: I | str | None = None):
+        super().__init__(node(home), label)
+        self._id = aid
+
+    def _compute_skeleton(self):
+        return ('placeholder', self.label, self._id)
+
+
+class bounded_graph(graph):
+    '''
+    A ``graph`` holding at most ``capacity`` nodes of the named graph ``name`` in ``store``
+    (an ``AssertionStore``), faulting the rest in on demand (see module docstring). Unsaved
+    nodes are never evicted, so the bound can be exceeded until ``flush()``.
+    '''
+    def __init__(self, store, name: I | str, *, capacity: int = DEFAULT_CAPACITY):
+        if not isinstance(store, AssertionStore):
+            raise TypeError(f'bounded_graph needs an AssertionStore (with subgraph()), not {type(store).__name__}')
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        super().__init__()
+        self.nodes: OrderedDict = OrderedDict()  # resident nodes, least recently used first
+        self._dirty = set()  # what the store holds is merged, so track changes from the start
+        self._store = store
+        self._name = name
+        self.capacity = capacity
+        # Ids of resident nodes changed since they were loaded or last flushed (pinned).
+        self._unsaved: set = set()
+        # Identified assertion id -> id of its node, remembered across eviction so that
+        # `target()` knows which node to fault in for an assertion target.
+        self._homes: dict = {}
+        self._loading = False
+        self._deferred = False  # inside union(): evict only once it is done
+        self.faults = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__} with {len(self.nodes)} of at most {self.capacity} nodes resident'
+
+    # --- the LRU node table ---------------------------------------------------------
+
+    def __getitem__(self, nid: I | str) -> node:
+        found = self.nodes.get(nid)
+        if found is not None:
+            self.nodes.move_to_end(nid)
+            return found
+        self._fault((nid,))
+        return self.nodes[nid]
+
+    def __setitem__(self, nid: I | str, nobj: node) -> None:
+        super().__setitem__(nid, nobj)
+        self._pin(nobj.id)
+        if not self._deferred:
+            self._shrink(keep={nobj.id})
+
+    def prefetch(self, nids: Iterable[I | str]) -> None:
+        '''Fault in every node of `nids` that is not resident, in one store round trip.'''
+        self._fault(nids)
+
+    def target(self, e: edge) -> node | assertion | None:
+        '''
+        Edge `e`'s target as a resident object, faulting in the node that holds it. None when
+        the target is unresolved or the store does not hold it.
+        '''
+        tgt = e.target
+        if tgt is None or tgt._graph is self:
+            return tgt
+        tid = tgt.id
+        home = self._homes.get(tid)
+        self._fault((tid,) if home is None else (home,))
+        found = self.assertion_ids.get(tid)
+        return found if found is not None else self.nodes.get(tid)
+
+    def _fault(self, nids: Iterable[I | str]) -> None:
+        wanted = dict.fromkeys(nid for nid in nids if nid not in self.nodes)  # in request (LRU) order
+        if not wanted:
+            return
+        sub = asyncio.run(self._store.subgraph(self._name, set(wanted), hops=0))
+        loaded = [sub.nodes[nid] for nid in wanted if nid in sub.nodes]
+        if not loaded:
+            return
+        stubs: dict = {}
+        for n in loaded:
+            del sub.nodes[n.id]
+            self._rebind_outgoing(n, wanted, stubs)
+        self._quietly(self._load, loaded)
+        self.faults += len(loaded)
+        self._shrink(keep={n.id for n in loaded})
+
+    def _rebind_outgoing(self, n: node, loaded_ids: set, stubs: dict) -> None:
+        '''Point `n`'s edges at resident objects, or at placeholders, rather than `sub`'s stand-ins.'''
+        for a in iter_assertions((n,), snapshot=False):
+            if not isinstance(a, edge):
+                continue
+            tgt = a._target
+            if tgt is None or isinstance(tgt, assertion) or tgt.id in loaded_ids:
+                continue  # already bound within the loaded batch
+            tid = tgt.id
+            real = self.assertion_ids.get(tid)
+            if real is None:
+                real = self.nodes.get(tid)
+            if real is None:
+                real = stubs.get(tid)
+                if real is None:
+                    home = self._homes.get(tid)
+                    real = stubs[tid] = node(tid) if home is None else _assertion_placeholder(tid, home)
+            a._target = real
+            a._skel = None
+
+    def _load(self, loaded: list) -> None:
+        for n in loaded:
+            # not through __setitem__: arriving from the store is no change for snapshots
+            self.nodes[self.intern(n.id)] = n
+            self._attach_node(n)
+            self._dirty.discard(n.id)
+        # edges already resident that point at placeholders for what just arrived
+        for n in loaded:
+            self._rebind_incoming(n.id, n)
+            for a in iter_assertions((n,), snapshot=False):
+                if a.id is not None:
+                    self._homes[a.id] = n.id
+                    self._rebind_incoming(a.id, a)
+
+    def _rebind_incoming(self, key, real) -> None:
+        for e in self._incoming_edges(key):
+            if e._target is not real:
+                e._target = real
+                e._skel = None
+
+    # --- eviction -------------------------------------------------------------------
+
+    def _shrink(self, keep: set) -> None:
+        '''Evict least recently used clean nodes until at most `capacity` are resident.'''
+        excess = len(self.nodes) - self.capacity
+        if excess <= 0:
+            return
+        victims = []
+        for nid in self.nodes:
+            if nid not in self._unsaved and nid not in keep:
+                victims.append(nid)
+                if len(victims) == excess:
+                    break
+        if victims:
+            self._quietly(self._evict, victims)
+
+    def _evict(self, victims: list) -> None:
+        for nid in victims:
+            if self._snapshots:
+                self._preserve(nid)
+            n = self.nodes.pop(nid)
+            self._dirty.discard(nid)
+            self._detach_node(n)
+            self._rebind_incoming(nid, node(nid))
+            for a in iter_assertions((n,), snapshot=False):
+                if a.id is not None:
+                    self._rebind_incoming(a.id, _assertion_placeholder(a.id, nid, a.label))
+        self.evictions += len(victims)
+
+    def _quietly(self, fn, *args) -> None:
+        '''Run `fn` as residency bookkeeping: no pinning and no change journal entries.'''
+        journal, self._journal = self._journal, None
+        self._loading = True
+        try:
+            fn(*args)
+        finally:
+            self._loading = False
+            self._journal = journal
+
+    # --- write tracking and write-back ----------------------------------------------
+
+    def _pin(self, nid) -> None:
+        if not self._loading:
+            self._unsaved.add(nid)
+
+    def _touch(self, container: node | assertion) -> None:
+        super()._touch(container)
+        self._pin(container._root.id)
+
+    def _retype(self, nobj: node, added, removed) -> None:
+        super()._retype(nobj, added, removed)
+        if added or removed:
+            self._pin(nobj.id)
+
+    def _detach(self, a: assertion) -> None:
+        if a._graph is self:
+            self._pin(a._root.id)
+        super()._detach(a)
+
+    def union(self, other: graph) -> 'graph':
+        '''`graph.union()`, after faulting in the nodes `other` shares with the store.'''
+        self.prefetch(other.nodes)
+        self._deferred = True
+        try:
+            return super().union(other)
+        finally:
+            self._deferred = False
+            self._shrink(keep=set())
+
+    @property
+    def unsaved(self) -> list[node]:
+        '''Resident nodes changed since they were loaded or last flushed (pinned in memory).'''
+        return [self.nodes[nid] for nid in list(self._unsaved) if nid in self.nodes]
+
+    def flush(self) -> None:
+        '''
+        Write unsaved nodes back to the store with ``put(merge=True)``; they become clean and
+        evictable again.
+        '''
+        out = graph()
+        for n in self.unsaved:
+            out[n.id] = _copy_node(n)
+        if out.nodes:
+            asyncio.run(self._store.put(self._name, out, merge=True))
+        self._unsaved.clear()
+        self._shrink(keep=set())
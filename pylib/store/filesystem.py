@@ -70,8 +70,14 @@ def _url_to_root(url: str) -> Path:
 class FileStore:
     '''A directory of Onya Literate files, one per named graph. Satisfies ``GraphStore``.'''
 
-    def __init__(self, root: Path):
+    def __init__(self, root: Path, *, parse_cache=None):
+        '''
+        parse_cache -- an ``onya.serial.parsecache.ParseCache`` (or a directory path for one)
+            through which stored files are parsed, so unchanged files load without a parse.
+        '''
         self.root = Path(root)
+        if parse_cache is not None:
+            self._reader = LiterateParser(warn_empty_blocks=False, cache=parse_cache)
 
     # --- construction / lifecycle ---------------------------------------------------
 
@@ -174,11 +180,10 @@ class FileStore:
         lock = self._acquire_lock(name)
         try:
             if merge:
-                # "Parse existing, union in memory, re-serialize." The incoming graph is copied
-                # through a serialize/parse round trip first, so (a) the caller's graph is never
-                # mutated by union's reparenting, and (b) same-`@id` assertions across the two
-                # sources go through the *model* union (Rule 1 merge) rather than the parser's
-                # one-document repeated-`@id` guard.
+                # "Parse existing, union in memory, re-serialize." The incoming graph is deep
+                # copied first so the caller's graph is never mutated by union's reparenting;
+                # same-`@id` assertions across the two sources then go through the *model*
+                # union (Rule 1 merge).
                 stored = graph()
                 existing = self._existing_path(name)
                 schema = nodebase = prefixes = None
@@ -188,7 +193,7 @@ class FileStore:
                     # Preserve the stored file's authoring convention across the round trip
                     # (keeps git diffs reviewable); a graph itself carries no convention.
                     schema, nodebase, prefixes = r.schema, r.nodebase, r.prefixes
-                incoming = self._from_literate(self._to_literate(g, name))
+                incoming = g.copy()
                 stored.union(incoming)
                 text = self._to_literate(stored, name, schema=schema, nodebase=nodebase, prefixes=prefixes)
             else:
@@ -212,7 +217,7 @@ class FileStore:
             if path is None:
                 raise KeyError(name)
             with open(path, encoding='utf-8') as f:
-                return self._from_literate(f.read())
+                return self._reader.parse(f.read()).graph
 
         return await asyncio.to_thread(_read)
 
@@ -430,11 +430,11 @@ async def _build_graph(conn, gpk: int, node_idents: set[int] | None = None) -> g
         id_by_npk[r['node_pk']] = nid
         wanted_npks.add(r['node_pk'])
         if nid not in g.nodes:
-            g.node(I(nid))
+            g.node(g.intern(nid, I))
     for npk in wanted_npks:
         trows = await conn.fetch('SELECT type_iri FROM onya_node_type WHERE node_pk = $1', npk)
         for tr in trows:
-            g[I(id_by_npk[npk])].types.add(I(tr['type_iri']))
+            g[id_by_npk[npk]].types.add(g.intern(tr['type_iri'], I))
 
     arows = await conn.fetch(
         'SELECT assertion_pk, kind, origin_node, origin_assertion, label, target_ident,'
@@ -445,20 +445,20 @@ async def _build_graph(conn, gpk: int, node_idents: set[int] | None = None) -> g
         if r['origin_node'] is not None:
             if node_idents is not None and r['origin_node'] not in wanted_npks:
                 continue
-            origin = g[I(id_by_npk[r['origin_node']])]
+            origin = g[id_by_npk[r['origin_node']]]
         else:
             origin = obj_by_apk.get(r['origin_assertion'])
             if origin is None:
                 continue
         if r['kind'] == 'P':
-            obj = origin.add_property(I(r['label']), r['value'])
+            obj = origin.add_property(g.intern(r['label'], I), r['value'])
         else:
-            obj = origin.add_edge(I(r['label']), None)
+            obj = origin.add_edge(g.intern(r['label'], I), None)
             pending_edges.append((obj, r['target_ident']))
         if r['interp'] is not None:
-            obj.interp = I(r['interp'])
+            obj.interp = g.intern(r['interp'], I)
         if r['ident_pk'] is not None:
-            g.register_assertion_id(I(id_by_ipk[r['ident_pk']]), obj)
+            g.register_assertion_id(g.intern(id_by_ipk[r['ident_pk']], I), obj)
         obj_by_apk[r['assertion_pk']] = obj
 
     for edge_obj, tident in pending_edges:
@@ -468,7 +468,7 @@ async def _build_graph(conn, gpk: int, node_idents: set[int] | None = None) -> g
         elif tid in g.nodes:
             edge_obj.target = g[tid]
         else:
-            edge_obj.target = g.node(I(tid))
+            edge_obj.target = g.node(g.intern(tid, I))
     return g
 
 
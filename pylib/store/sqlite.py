@@ -172,71 +172,65 @@ def _build_graph(cur, gpk: int, node_idents: set[int] | None = None) -> graph:
     '''
     Reconstruct a graph from its relational rows. When ``node_idents`` is given, only those
     node idents are materialized as full nodes; edge targets outside the set become bare
-    (dangling) nodes, exactly as the parser represents an undescribed target.
+    (dangling) nodes, exactly as the parser represents an undescribed target. A scoped build
+    reads only the rows under the wanted nodes (see ``_scoped_rows``), so its cost follows
+    the size of the answer rather than that of the stored graph.
     '''
     g = graph()
 
-    # idents: ident_pk -> id
-    cur.execute('SELECT ident_pk, id FROM onya_ident WHERE graph_pk = ?', (gpk,))
-    id_by_ipk = {ipk: idv for ipk, idv in cur.fetchall()}
+    if node_idents is None:
+        # nodes (node_pk, ident_pk), then assertions in pk order (parents precede children,
+        # matching the write path)
+        cur.execute(
+            'SELECT n.node_pk, n.ident_pk FROM onya_node n'
+            ' JOIN onya_ident i ON i.ident_pk = n.ident_pk WHERE i.graph_pk = ?',
+            (gpk,),
+        )
+        node_rows = cur.fetchall()
+        cur.execute(
+            'SELECT assertion_pk, kind, origin_node, origin_assertion, label, target_ident,'
+            ' value, ident_pk, interp FROM onya_assertion WHERE graph_pk = ? ORDER BY assertion_pk',
+            (gpk,),
+        )
+        assertion_rows = cur.fetchall()
+        # idents: ident_pk -> id
+        cur.execute('SELECT ident_pk, id FROM onya_ident WHERE graph_pk = ?', (gpk,))
+        id_by_ipk = {ipk: idv for ipk, idv in cur.fetchall()}
+    else:
+        node_rows, assertion_rows = _scoped_rows(cur, gpk, node_idents)
+        ipks = {ipk for _, ipk in node_rows}
+        for row in assertion_rows:
+            ipks.update(x for x in (row[5], row[7]) if x is not None)  # target_ident, ident_pk
+        id_by_ipk = {}
+        for chunk in _chunks(tuple(ipks)):
+            cur.execute(f'SELECT ident_pk, id FROM onya_ident WHERE ident_pk IN ({_marks(chunk)})', chunk)
+            id_by_ipk.update(cur.fetchall())
 
     # nodes (node_pk -> id) and their types
-    cur.execute(
-        'SELECT n.node_pk, n.ident_pk FROM onya_node n'
-        ' JOIN onya_ident i ON i.ident_pk = n.ident_pk WHERE i.graph_pk = ?',
-        (gpk,),
-    )
-    node_rows = cur.fetchall()
     id_by_npk: dict[int, str] = {}
-    wanted_npks: set[int] = set()
     for npk, ipk in node_rows:
-        if node_idents is not None and ipk not in node_idents:
-            continue
         nid = id_by_ipk[ipk]
         id_by_npk[npk] = nid
-        wanted_npks.add(npk)
         if nid not in g.nodes:
-            g.node(I(nid))
-    for npk in wanted_npks:
+            g.node(g.intern(nid, I))
+    for npk, nid in id_by_npk.items():
         cur.execute('SELECT type_iri FROM onya_node_type WHERE node_pk = ?', (npk,))
         for (t,) in cur.fetchall():
-            g[I(id_by_npk[npk])].types.add(I(t))
+            g[nid].types.add(g.intern(t, I))
 
-    # assertions in pk order (parents precede children, matching the write path)
-    if node_idents is None:
-        cur.execute(
-            'SELECT assertion_pk, kind, origin_node, origin_assertion, label, target_ident,'
-            ' value, ident_pk, interp FROM onya_assertion WHERE graph_pk = ? ORDER BY assertion_pk',
-            (gpk,),
-        )
-    else:
-        # scope to assertions whose top-level origin node is in the wanted set (children follow
-        # via origin_assertion, which appears later in pk order)
-        cur.execute(
-            'SELECT assertion_pk, kind, origin_node, origin_assertion, label, target_ident,'
-            ' value, ident_pk, interp FROM onya_assertion WHERE graph_pk = ? ORDER BY assertion_pk',
-            (gpk,),
-        )
     obj_by_apk: dict[int, object] = {}
     pending_edges: list[tuple[object, int]] = []
-    for (apk, kind, onode, oassert, label, tident, value, ident_pk, interp) in cur.fetchall():
-        if onode is not None:
-            if node_idents is not None and onode not in wanted_npks:
-                continue
-            origin = g[I(id_by_npk[onode])]
-        else:
-            origin = obj_by_apk.get(oassert)
-            if origin is None:  # parent filtered out (subgraph scope) — skip descendant
-                continue
+    for (apk, kind, onode, oassert, label, tident, value, ident_pk, interp) in assertion_rows:
+        origin = g[id_by_npk[onode]] if onode is not None else obj_by_apk[oassert]
         if kind == 'P':
-            obj = origin.add_property(I(label), value)
+            obj = origin.add_property(g.intern(label, I), value)
         else:
-            obj = origin.add_edge(I(label), None)
+            obj = origin.add_edge(g.intern(label, I), None)
             pending_edges.append((obj, tident))
         if interp is not None:
-            obj.interp = I(interp)
+            obj.interp = g.intern(interp, I)
         if ident_pk is not None:
-            g.register_assertion_id(I(id_by_ipk[ident_pk]), obj)
+            g.register_assertion_id(g.intern(id_by_ipk[ident_pk], I), obj)
         obj_by_apk[apk] = obj
 
     # resolve edge targets: identified assertion, existing node, else a bare (dangling) node
@@ -247,10 +241,53 @@ def _build_graph(cur, gpk: int, node_idents: set[int] | None = None) -> graph:
         elif tid in g.nodes:
             edge_obj.target = g[tid]
         else:
-            edge_obj.target = g.node(I(tid))
+            edge_obj.target = g.node(g.intern(tid, I))
     return g
 
 
+# Most ids bound into one `IN (...)` list: SQLite builds before 3.32 allow 999 `?` parameters
+# per statement (later ones 32766), and a large subgraph or prefetch can name more ids
+_MAX_VARS = 900
+
+
+def _chunks(values: tuple):
+    for i in range(0, len(values), _MAX_VARS):
+        yield values[i:i + _MAX_VARS]
+
+
+def _marks(values) -> str:
+    return ','.join('?' * len(values))
+
+
+def _scoped_rows(cur, gpk: int, node_idents: set[int]) -> tuple[list, list]:
+    '''
+    The ``(node_pk, ident_pk)`` rows for the node idents in ``node_idents`` and, in pk order,
+    every assertion under those nodes: top-level rows through the ``origin_node`` index,
+    nested rows by a recursive walk down ``origin_assertion``. Ids are bound ``_MAX_VARS`` at
+    a time.
+    '''
+    node_rows: list = []
+    for chunk in _chunks(tuple(node_idents)):
+        cur.execute(f'SELECT node_pk, ident_pk FROM onya_node WHERE ident_pk IN ({_marks(chunk)})', chunk)
+        node_rows.extend(cur.fetchall())
+    assertion_rows: list = []
+    for chunk in _chunks(tuple(npk for npk, _ in node_rows)):
+        cur.execute(
+            'WITH RECURSIVE scoped(assertion_pk) AS ('
+            f' SELECT assertion_pk FROM onya_assertion WHERE graph_pk = ? AND origin_node IN ({_marks(chunk)})'
+            ' UNION ALL'
+            ' SELECT c.assertion_pk FROM onya_assertion c JOIN scoped s'
+            ' ON c.graph_pk = ? AND c.origin_assertion = s.assertion_pk)'
+            ' SELECT a.assertion_pk, a.kind, a.origin_node, a.origin_assertion, a.label,'
+            ' a.target_ident, a.value, a.ident_pk, a.interp'
+            ' FROM onya_assertion a JOIN scoped s ON a.assertion_pk = s.assertion_pk',
+            (gpk, *chunk, gpk),
+        )
+        assertion_rows.extend(cur.fetchall())
+    assertion_rows.sort(key=lambda row: row[0])  # pk order across chunks: parents precede children
+    return node_rows, assertion_rows
+
+
 def _annotations(cur, assertion_pk: int) -> dict:
     '''Direct child properties of an assertion, as a ``{label: value}`` dict (match() shape).'''
     cur.execute(
@@ -310,12 +347,13 @@ def _subgraph_blocking(conn, name: str, root_ids: set[str], hops: int) -> graph:
     for _ in range(max(hops, 0)):
         if not frontier:
             break
-        placeholders = ','.join('?' * len(frontier))
-        cur.execute(
-            f'SELECT DISTINCT target_ident FROM onya_edge_hop WHERE source_ident IN ({placeholders})',
-            tuple(frontier),
-        )
-        targets = {r[0] for r in cur.fetchall()}
+        targets: set[int] = set()
+        for chunk in _chunks(tuple(frontier)):
+            cur.execute(
+                f'SELECT DISTINCT target_ident FROM onya_edge_hop WHERE source_ident IN ({_marks(chunk)})',
+                chunk,
+            )
+            targets.update(r[0] for r in cur.fetchall())
         frontier = targets - included
         included |= frontier
     return _build_graph(cur, gpk, node_idents=included)
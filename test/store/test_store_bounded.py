@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# test/store/test_store_bounded.py
+'''
+Tests for ``onya.store.bounded.bounded_graph`` — an LRU node table over an
+``AssertionStore`` (SQLite here), faulting nodes in and evicting clean cold ones. The tests
+are synchronous because the graph drives the store with ``asyncio.run``.
+
+    pytest -s test/store/test_store_bounded.py
+'''
+
+import asyncio
+
+import pytest
+from amara.iri import I
+
+from onya.graph import assertion
+from onya.store import connect, sqlite
+from onya.store.bounded import bounded_graph
+from store_helpers import DOCHEADER, NAME, parse
+
+
+CHAIN = DOCHEADER + ''.join(f'''
+# P{i} [Person]
+
+* name: Person {i}
+* knows -> P{i + 1}
+  * since: {2000 + i}
+''' for i in range(20))
+
+REIFIED = DOCHEADER + '''
+# Chuks [Person]
+
+* knows -> Ify
+  * @id: chuks-ify
+
+# ReviewNote
+
+* disputes -> chuks-ify
+'''
+
+KNOWS = I('https://schema.org/knows')
+NAME_P = I('https://schema.org/name')
+PERSON = I('https://schema.org/Person')
+
+
+def _p(i):
+    return I(f'http://e.o/P{i}')
+
+
+@pytest.fixture
+def sqlite_store(tmp_path):
+    st = asyncio.run(connect(f'sqlite:{tmp_path}/app.db'))
+    asyncio.run(st.__aenter__())
+    yield st
+    asyncio.run(st.__aexit__(None, None, None))
+
+
+def _seed(store, doc=CHAIN):
+    asyncio.run(store.put(NAME, parse(doc)))
+
+
+def test_faults_in_and_stays_bounded(sqlite_store):
+    _seed(sqlite_store)
+    g = bounded_graph(sqlite_store, NAME, capacity=5)
+    assert len(g) == 0
+    n = g[_p(0)]
+    assert [p.value for p in n.getprop(NAME_P)] == ['Person 0']
+    assert g.faults == 1
+    # walk the whole chain through target(): never more than `capacity` resident
+    for _ in range(19):
+        n = g.target(next(n.traverse(KNOWS)))
+        assert len(g.nodes) <= 5
+    assert n.id == _p(19) and g.evictions == 15
+    assert list(g.nodes) == [_p(i) for i in range(15, 20)]
+    assert _p(0) in g and g.faults == 21  # re-faulted after eviction
+    with pytest.raises(KeyError):
+        g[I('http://e.o/Nobody')]
+
+
+def test_lru_order_and_indexes_follow_residency(sqlite_store):
+    _seed(sqlite_store)
+    g = bounded_graph(sqlite_store, NAME, capacity=3)
+    g.prefetch([_p(0), _p(1), _p(2)])
+    assert g.faults == 3
+    g[_p(0)]  # most recently used now
+    g[_p(5)]
+    assert set(g.nodes) == {_p(0), _p(2), _p(5)}
+    assert {n.id for n in g.typematch(PERSON)} == {_p(0), _p(2), _p(5)}
+    assert not list(g.select(target=_p(2)))  # P1's edge to P2 left along with P1
+    assert [e.origin.id for e in g.select(target=_p(1))] == [_p(0)]
+    # a resident edge to an evicted node points at a placeholder until it returns
+    e = next(g[_p(0)].traverse(KNOWS))
+    assert e.target is not None and e.target.id == _p(1) and not e.target.properties
+    p1 = g[_p(1)]
+    assert e.target is p1
+    assert [x.origin.id for x in p1.reverse(KNOWS, g)] == [_p(0)]
+
+
+def test_changes_are_pinned_until_flush(sqlite_store):
+    _seed(sqlite_store)
+    g = bounded_graph(sqlite_store, NAME, capacity=2)
+    g[_p(0)].add_property(NAME_P, 'Ada')
+    g[_p(1)].types.add(I('https://schema.org/Author'))
+    g.prefetch([_p(2), _p(3)])
+    assert {n.id for n in g.unsaved} == {_p(0), _p(1)}
+    assert {_p(0), _p(1)} <= set(g.nodes)  # over capacity rather than lose a write
+    g.flush()
+    assert g.unsaved == [] and len(g.nodes) == 2
+    fresh = bounded_graph(sqlite_store, NAME, capacity=2)
+    assert sorted(p.value for p in fresh[_p(0)].getprop(NAME_P)) == ['Ada', 'Person 0']
+    assert I('https://schema.org/Author') in fresh[_p(1)].types
+
+
+def test_residency_is_not_a_change(sqlite_store):
+    _seed(sqlite_store)
+    g = bounded_graph(sqlite_store, NAME, capacity=2).enable_journal()
+    for i in range(6):
+        g[_p(i)]
+    assert g.changes() == [] and g.unsaved == [] and g.dirty == []
+
+
+def test_union_merges_with_stored_nodes(sqlite_store):
+    _seed(sqlite_store)
+    g = bounded_graph(sqlite_store, NAME, capacity=4)
+    g.union(parse(DOCHEADER + '\n# P3 [Person]\n\n* name: Trey\n'))
+    assert sorted(p.value for p in g[_p(3)].getprop(NAME_P)) == ['Person 3', 'Trey']
+    assert [n.id for n in g.unsaved] == [_p(3)]
+
+
+def test_assertion_target_faults_in_its_node(sqlite_store):
+    _seed(sqlite_store, REIFIED)
+    g = bounded_graph(sqlite_store, NAME, capacity=1)
+    chuks_ify = I('http://e.o/chuks-ify')
+    g[I('http://e.o/Chuks')]  # learn where chuks-ify lives, then evict it
+    note = g[I('http://e.o/ReviewNote')]
+    dispute = next(note.getedge(I('https://schema.org/disputes')))
+    assert dispute.target._graph is None
+    found = g.target(dispute)
+    assert found.id == chuks_ify and found.origin.id == I('http://e.o/Chuks')
+
+
+def test_evicted_assertion_target_keeps_its_kind(sqlite_store):
+    _seed(sqlite_store, REIFIED)
+    g = bounded_graph(sqlite_store, NAME, capacity=2)
+    chuks, chuks_ify = I('http://e.o/Chuks'), I('http://e.o/chuks-ify')
+    disputes = I('https://schema.org/disputes')
+    note = g[I('http://e.o/ReviewNote')]
+    g[chuks]
+    dispute = next(note.getedge(disputes))
+    before = dispute._skeleton
+    assert dispute.target is g.assertion_ids[chuks_ify]
+
+    g[note.id]
+    g.prefetch([I('http://e.o/Ify')])  # evicts Chuks, which holds the assertion
+    assert chuks not in g.nodes and note.id in g.nodes
+    placeholder = dispute.target
+    assert isinstance(placeholder, assertion) and placeholder._graph is None
+    assert dispute._skeleton == before
+    assert [e for e in g.select(target=chuks_ify)] == [dispute]
+
+    found = g.target(dispute)  # faults Chuks back in and rebinds the edge
+    assert found is dispute.target is g.assertion_ids[chuks_ify]
+    assert dispute._skeleton == before
+
+
+def test_id_lists_are_bound_in_chunks(sqlite_store, monkeypatch):
+    # Old SQLite builds cap a statement at 999 parameters; shrink the chunk to exercise it
+    _seed(sqlite_store)
+    whole = asyncio.run(sqlite_store.subgraph(NAME, {_p(0)}, hops=6))
+    monkeypatch.setattr(sqlite, '_MAX_VARS', 2)
+    chunked = asyncio.run(sqlite_store.subgraph(NAME, {_p(0)}, hops=6))
+    assert len(whole.diff(chunked)) == 0 and len(chunked.nodes) == 8
+    g = bounded_graph(sqlite_store, NAME, capacity=20)
+    g.prefetch(_p(i) for i in range(7))
+    assert g.faults == 7
+    assert [next(g[_p(i)].getprop(NAME_P)).value for i in range(7)] == [f'Person {i}' for i in range(7)]
+    assert all(next(iter(next(g[_p(i)].traverse(KNOWS)).properties)).value == str(2000 + i) for i in range(7))
+
+
+def test_requires_assertion_store(tmp_path):
+    st = asyncio.run(connect(f'file:{tmp_path}/graphs'))
+    with pytest.raises(TypeError):
+        bounded_graph(st, NAME)
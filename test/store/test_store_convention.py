@@ -95,3 +95,21 @@ async def test_new_graph_without_seed_uses_explicit_form(tmp_path):
     got = graph()
     _reader.parse(text, got)
     assert _triples(got) == _triples(g)
+
+
+async def test_get_through_parse_cache(tmp_path):
+    '''With a parse cache, an unchanged file loads from the cache; a rewritten one reparses.'''
+    root = tmp_path / 'graphs'
+    root.mkdir()
+    (root / f'{_slug(NAME)}.onya').write_text(SEED)
+    store = FileStore(root, parse_cache=tmp_path / 'cache')
+    first = await store.get(NAME)
+    again = await store.get(NAME)
+    assert _triples(again) == _triples(first) == _triples(read(SEED).graph)
+    assert (store._reader.cache.hits, store._reader.cache.misses) == (1, 1)
+
+    g = graph()
+    read(ADD, g)
+    await store.put(NAME, g, merge=True)
+    assert ('P', 'https://example.org/kb/Gadget', 'https://example.org/vocab/title', 'Gizmo') in \
+        _triples(await store.get(NAME))
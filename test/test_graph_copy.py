@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# test_graph_copy.py
+'''
+Tests for graph.copy() — the structural deep copy used in place of a Literate round trip.
+
+    pytest -s test/test_graph_copy.py
+'''
+
+from amara.iri import I
+
+from onya.graph import graph, node, edge, iter_assertions
+from onya.serial.literate import LiterateParser
+from onya.store.filesystem import FileStore
+
+
+DOCHEADER = '''\
+# @docheader
+
+* @document: http://e.o/doc
+* @nodebase: http://e.o/
+* @schema: https://schema.org/
+'''
+
+DOC = DOCHEADER + '''
+# Chuks [Person]
+
+* name: Chuks
+* knows -> Ify
+  * @id: chuks-ify
+  * since: 2018
+    * source: interview
+* age: 40
+  * @as: http://e.o/integer
+
+# Ify [Person]
+
+* name: Ify
+
+# ReviewNote
+
+* disputes -> chuks-ify
+'''
+
+CHUKS = I('http://e.o/Chuks')
+IFY = I('http://e.o/Ify')
+CHUKS_IFY = I('http://e.o/chuks-ify')
+NAME = I('https://schema.org/name')
+KNOWS = I('https://schema.org/knows')
+DISPUTES = I('https://schema.org/disputes')
+
+
+def _g(doc=DOC):
+    g = graph()
+    LiterateParser().parse(doc, g)
+    return g
+
+
+def _shape(g):
+    rows = []
+    for a in iter_assertions(g.nodes.values()):
+        obj = (a.target.id if a.target is not None else None) if isinstance(a, edge) else a.value
+        rows.append((str(a.origin.id), str(a.label), str(obj), str(a.id), str(a.interp)))
+    return sorted(rows), sorted((str(n.id), sorted(map(str, n.types))) for n in g.nodes.values())
+
+
+def test_copy_is_equal_and_disjoint():
+    g = _g()
+    c = g.copy()
+    assert _shape(c) == _shape(g)
+    originals = {id(x) for x in (*g.nodes.values(), *iter_assertions(g.nodes.values()))}
+    assert not any(id(x) in originals for x in (*c.nodes.values(), *iter_assertions(c.nodes.values())))
+    for a in iter_assertions(c.nodes.values()):
+        assert a._graph is c
+        if isinstance(a, edge):
+            assert id(a.target) not in originals
+
+
+def test_targets_and_ids_rebound_to_copy():
+    g = _g()
+    c = g.copy()
+    knows = next(c[CHUKS].getedge(KNOWS))
+    assert knows.target is c[IFY]
+    assert c.assertion_ids[CHUKS_IFY] is knows
+    disputes = next(c[I('http://e.o/ReviewNote')].getedge(DISPUTES))
+    assert disputes.target is knows
+    assert [e.origin for e in c[IFY].reverse(KNOWS, c)] == [c[CHUKS]]
+    assert next(c.select(target=CHUKS_IFY)) is disputes
+
+
+def test_copy_mutations_do_not_leak():
+    g = _g()
+    before = _shape(g)
+    c = g.copy()
+    c[CHUKS].add_property(NAME, 'Charles')
+    next(c[CHUKS].getedge(KNOWS)).label = I('https://schema.org/follows')
+    c[IFY].types.add(I('https://schema.org/Author'))
+    c.union(_g(DOCHEADER + '\n# Nkiru\n\n* knows -> Chuks\n'))
+    assert _shape(g) == before
+
+
+def test_stray_target_is_cloned():
+    g = graph()
+    outside = node(I('http://e.o/Outside'))
+    outside.add_property(NAME, 'elsewhere')
+    g.node(CHUKS).add_edge(KNOWS, outside)
+    c = g.copy()
+    tgt = next(c[CHUKS].getedge(KNOWS)).target
+    assert tgt is not outside and tgt.id == outside.id
+    assert [p.value for p in tgt.getprop(NAME)] == ['elsewhere']
+
+
+def test_copy_keeps_value_index_and_dirty_state():
+    g = _g().merge()
+    g.enable_value_index()
+    g[IFY].add_property(NAME, 'Ifeoma')
+    c = g.copy()
+    assert [n.id for n in c.dirty] == [IFY]
+    assert [p.origin.id for p in c.select(label=NAME, value='Ifeoma')] == [IFY]
+    assert c.explain(label=NAME, value='Ifeoma').access == 'value'
+
+
+def test_copy_matches_round_trip_and_shares_no_containers():
+    body = ''.join(f'\n# P{i} [Person]\n\n* name: Person {i}\n* knows -> P{i + 1}\n  * since: {2000 + i % 20}\n'
+                   for i in range(300))
+    g = _g(DOCHEADER + body)
+    g.enable_value_index()
+    before = _shape(g)
+    # what FileStore.put(merge=True) used to do
+    round_trip = FileStore._from_literate(FileStore._to_literate(g, 'http://e.o/doc'))
+    c = g.copy()
+    assert _shape(c) == _shape(round_trip) == before
+
+    for attr in ('nodes', 'assertion_ids', '_incoming', '_by_type', '_values', '_sorted_values'):
+        assert getattr(c, attr) is not getattr(g, attr)
+    for nid, n in c.nodes.items():
+        assert n is not g[nid] and n.types is not g[nid].types
+    originals = [(a.properties, a.edges) for a in (*g.nodes.values(), *iter_assertions(g.nodes.values()))]
+    held = {id(s) for pair in originals for s in pair}
+    assert not any(id(a.properties) in held or id(a.edges) in held
+                   for a in (*c.nodes.values(), *iter_assertions(c.nodes.values())))
+
+    p1 = c[I('http://e.o/P1')]
+    next(p1.getprop(NAME)).value = 'Renamed'
+    next(p1.getedge(KNOWS)).add_property(NAME, 'nested')
+    p1.types.clear()
+    del c[I('http://e.o/P2')]
+    assert _shape(g) == before
+    assert [p.origin.id for p in g.select(label=NAME, value='Person 1')] == [I('http://e.o/P1')]
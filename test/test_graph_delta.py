@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# test_graph_delta.py
+'''
+Tests for graph.diff() / graph.apply() — minimal assertion deltas (onya.delta).
+
+Each case edits a copy of a base graph, diffs base -> edited, applies the delta to another
+copy of the base and checks it now matches the edited graph.
+
+    pytest -s test/test_graph_delta.py
+'''
+
+import pickle
+
+import pytest
+from amara.iri import I
+
+from onya.graph import graph, edge, iter_assertions
+from onya.delta import DeltaConflict
+from onya.serial.literate import LiterateParser
+
+
+DOC = '''\
+# @docheader
+
+* @document: http://e.o/doc
+* @nodebase: http://e.o/
+* @schema: https://schema.org/
+
+# Chuks [Person]
+
+* name: Chuks
+* age: 40
+* knows -> Ify
+  * @id: chuks-ify
+  * since: 2018
+* knows -> Nkiru
+  * since: 2020
+
+# Ify [Person]
+
+* name: Ify
+
+# ReviewNote
+
+* disputes -> chuks-ify
+'''
+
+CHUKS = I('http://e.o/Chuks')
+IFY = I('http://e.o/Ify')
+NKIRU = I('http://e.o/Nkiru')
+NAME = I('https://schema.org/name')
+AGE = I('https://schema.org/age')
+KNOWS = I('https://schema.org/knows')
+SINCE = I('https://schema.org/since')
+SOURCE = I('https://schema.org/source')
+DISPUTES = I('https://schema.org/disputes')
+INTEGER = I('http://e.o/integer')
+
+
+def _base():
+    g = graph()
+    LiterateParser().parse(DOC, g)
+    return g.merge()
+
+
+def _shape(g):
+    rows = []
+    for a in iter_assertions(g.nodes.values()):
+        obj = (a.target.id if a.target is not None else None) if isinstance(a, edge) else a.value
+        origin = a.origin.id if a.origin.id is not None else ('nested', a.origin.label)
+        rows.append((str(origin), str(a.label), str(obj), str(a.id), str(a.interp)))
+    return sorted(rows), sorted((str(n.id), sorted(map(str, n.types))) for n in g.nodes.values())
+
+
+def _round_trip(edit):
+    base = _base()
+    target = base.copy()
+    edit(target)
+    delta = base.diff(target)
+    replica = base.copy()
+    replica.apply(pickle.loads(pickle.dumps(delta)))
+    assert _shape(replica) == _shape(target)
+    return delta
+
+
+def test_identical_graphs_have_empty_delta():
+    assert len(_base().diff(_base())) == 0
+
+
+def test_added_and_removed_assertions():
+    def edit(g):
+        chuks = g[CHUKS]
+        chuks.remove_property(next(chuks.getprop(AGE)))
+        chuks.add_property(NAME, 'Charles')
+        nkiru_edge = next(e for e in chuks.getedge(KNOWS) if e.target.id == NKIRU)
+        next(nkiru_edge.getprop(SINCE)).add_property(SOURCE, 'interview')
+    delta = _round_trip(edit)
+    assert len(delta.removed) == 1 and len(delta.added) == 2
+
+
+def test_nodes_types_and_identified_targets():
+    def edit(g):
+        del g[I('http://e.o/ReviewNote')]
+        g[IFY].types.add(I('https://schema.org/Author'))
+        note = g.node(I('http://e.o/Note2'))
+        note.add_edge(DISPUTES, g.assertion_ids[I('http://e.o/chuks-ify')])
+        ify_nkiru = g[IFY].add_edge(KNOWS, g[NKIRU])
+        g.register_assertion_id(I('http://e.o/ify-nkiru'), ify_nkiru)
+        note.add_edge(DISPUTES, ify_nkiru)
+    delta = _round_trip(edit)
+    assert set(delta.added_nodes) == {I('http://e.o/Note2')}
+    assert delta.removed_nodes == [I('http://e.o/ReviewNote')]
+    assert delta.types == {IFY: ([I('https://schema.org/Author')], [])}
+
+
+def test_interp_adoption():
+    def edit(g):
+        next(g[CHUKS].getprop(AGE)).interp = INTEGER
+    delta = _round_trip(edit)
+    assert delta.interps == [((CHUKS, ('property', AGE, '40', None)), INTEGER)]
+    assert not delta.added and not delta.removed
+
+
+def test_apply_is_proportional_to_delta():
+    base = _base()
+    for i in range(2000):
+        base.node(I(f'http://e.o/n{i}')).add_property(NAME, f'n{i}')
+    target = base.copy()
+    target[CHUKS].add_property(NAME, 'Charles')
+    delta = base.diff(target)
+    assert len(delta) == 1
+    replica = base.copy()
+    before = replica._mutations
+    replica.apply(delta)
+    assert replica._mutations - before <= 2  # one attach (plus its touch), not a rebuild
+
+
+def test_conflicting_delta():
+    base = _base()
+    target = base.copy()
+    target[CHUKS].remove_property(next(target[CHUKS].getprop(AGE)))
+    delta = base.diff(target)
+    other = _base()
+    other[CHUKS].remove_property(next(other[CHUKS].getprop(AGE)))
+    with pytest.raises(DeltaConflict):
+        other.apply(delta)
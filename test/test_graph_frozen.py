@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# test_graph_frozen.py
+'''
+Tests for the columnar frozen graph (`graph.freeze()` / `frozen_graph.thaw()`): every query
+must answer exactly as the mutable graph it was frozen from.
+
+    pytest -s test/test_graph_frozen.py
+'''
+
+import pytest
+from amara.iri import I
+
+from onya.graph import graph, node, edge
+from onya.frozen import frozen_graph, frozen_edge, frozen_node
+from onya.serial.literate import LiterateParser
+
+DOC = '''\
+# @docheader
+
+* @document: http://e.o/doc
+* @nodebase: http://e.o/
+* @schema: https://schema.org/
+
+# Chuks [Person]
+
+* name: Chuks
+* knows -> Ify
+  * @id: chuks-ify
+  * since: 2018
+* knows -> Nkiru
+
+# Ada [Person Author]
+
+* name: Ada
+* knows -> Ify
+  * introducedBy -> Nkiru
+
+# ReviewNote
+
+* disputes -> chuks-ify
+'''
+
+CHUKS = I('http://e.o/Chuks')
+ADA = I('http://e.o/Ada')
+IFY = I('http://e.o/Ify')
+NKIRU = I('http://e.o/Nkiru')
+CHUKS_IFY = I('http://e.o/chuks-ify')
+KNOWS = I('https://schema.org/knows')
+NAME = I('https://schema.org/name')
+SINCE = I('https://schema.org/since')
+PERSON = I('https://schema.org/Person')
+AUTHOR = I('https://schema.org/Author')
+
+
+@pytest.fixture
+def g():
+    g = graph()
+    LiterateParser().parse(DOC, g)
+    return g
+
+
+def _shape(a):
+    '''A comparable rendering of a live assertion or a frozen view.'''
+    origin = a.origin.id if a.origin.id is not None else _shape(a.origin)
+    obj = a.target.id if isinstance(a, (edge, frozen_edge)) else a.value
+    return (origin, a.label, obj, a.id)
+
+
+@pytest.mark.parametrize('kwargs', [
+    {}, {'deep': True}, {'label': KNOWS}, {'label': KNOWS, 'deep': True},
+    {'origin': CHUKS}, {'origin': CHUKS, 'label': KNOWS}, {'origin': CHUKS_IFY, 'deep': True},
+    {'target': IFY}, {'target': NKIRU, 'deep': True}, {'target': CHUKS_IFY},
+    {'value': 'Ada'}, {'label': NAME, 'value': 'Chuks'}, {'id': CHUKS_IFY},
+    {'label': I('http://e.o/unknown')},
+])
+def test_select_parity(g, kwargs):
+    fg = g.freeze()
+    assert sorted(map(_shape, fg.select(**kwargs)), key=repr) == \
+        sorted(map(_shape, g.select(**kwargs)), key=repr)
+
+
+def test_match_typematch_and_traversal(g):
+    fg = g.freeze()
+    assert isinstance(fg, frozen_graph) and set(fg) == set(g) and len(fg) == len(g)
+    assert sorted(fg.match(), key=repr) == sorted(g.match(), key=repr)
+    assert {n.id for n in fg.typematch(PERSON)} == {CHUKS, ADA}
+    assert {n.id for n in fg.typematch({AUTHOR})} == {ADA}
+    assert fg[ADA].types == {PERSON, AUTHOR}
+    assert {e.target.id for e in fg[CHUKS].traverse(KNOWS)} == {IFY, NKIRU}
+    assert {e.origin.id for e in fg[IFY].reverse(KNOWS)} == {CHUKS, ADA}
+    (ci,) = fg.select(id=CHUKS_IFY)
+    assert [p.value for p in ci.getprop(SINCE)] == ['2018']
+    assert fg.assertion_ids[CHUKS_IFY] == ci
+    with pytest.raises(KeyError):
+        fg[I('http://e.o/nope')]
+
+
+def test_dangling_target_survives(g):
+    '''An edge target that is not itself a node of the graph stays reachable, and stays out.'''
+    elsewhere = node(I('http://e.o/Elsewhere'))
+    g[CHUKS].add_edge(I('https://schema.org/cites'), elsewhere)
+    fg = g.freeze()
+    (cites,) = fg.select(label=I('https://schema.org/cites'))
+    assert isinstance(cites.target, frozen_node) and cites.target.id not in fg
+    g2 = fg.thaw()
+    (cites,) = g2.select(label=I('https://schema.org/cites'))
+    assert cites.target.id == elsewhere.id and elsewhere.id not in g2
+
+
+def test_thaw_round_trip(g):
+    g2 = g.freeze().thaw()
+    assert set(g2) == set(g)
+    assert sorted(map(_shape, g2.select(deep=True)), key=repr) == sorted(map(_shape, g.select(deep=True)), key=repr)
+    assert {n.id for n in g2.typematch(PERSON)} == {CHUKS, ADA}
+    assert g2.assertion_ids[CHUKS_IFY].target is g2[IFY]
+    (disputes,) = g2.select(target=CHUKS_IFY)
+    assert disputes.target is g2.assertion_ids[CHUKS_IFY]
+    g2[ADA].add_property(NAME, 'Ada L.')  # thawed graphs are ordinary, mutable graphs
+    assert len(list(g2.select(origin=ADA, label=NAME))) == 2
+
+
+def test_frozen_form_is_smaller():
+    g = graph()
+    hub = g.node(I('http://e.o/Hub'))
+    for i in range(2000):
+        hub.add_property(I(f'http://s/p{i % 20}'), str(i % 50))
+    fg = g.freeze()
+    assert len(list(fg.select(origin=hub.id, label=I('http://s/p3')))) == 100
+    assert fg.nbytes() < 2000 * 100  # well under the object model's hundreds of bytes per assertion
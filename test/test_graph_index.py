@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+# test_graph_index.py
+'''
+Tests for the in-memory graph's maintained indexes — they must always agree with what a
+full scan of the graph would answer, through every mutation path (model API, parse,
+`union()`, `merge()`, node replacement/deletion).
+
+    pytest -s test/test_graph_index.py
+'''
+
+from amara.iri import I
+
+from onya.graph import graph, node
+from onya.serial.literate import LiterateParser
+
+
+DOCHEADER = '''\
+# @docheader
+
+* @document: http://e.o/doc
+* @nodebase: http://e.o/
+* @schema: https://schema.org/
+'''
+
+DOC = DOCHEADER + '''
+# Chuks [Person]
+
+* name: Chuks
+* knows -> Ify
+  * @id: chuks-ify
+  * since: 2018
+* knows -> Nkiru
+
+# Ada [Person]
+
+* knows -> Ify
+  * introducedBy -> Nkiru
+
+# ReviewNote
+
+* disputes -> chuks-ify
+'''
+
+CHUKS = I('http://e.o/Chuks')
+ADA = I('http://e.o/Ada')
+IFY = I('http://e.o/Ify')
+NKIRU = I('http://e.o/Nkiru')
+CHUKS_IFY = I('http://e.o/chuks-ify')
+KNOWS = I('https://schema.org/knows')
+DISPUTES = I('https://schema.org/disputes')
+INTRODUCED_BY = I('https://schema.org/introducedBy')
+
+
+def _g(*docs):
+    g = graph()
+    for d in docs:
+        LiterateParser().parse(d, g)
+    return g
+
+
+def _scan_reverse(g, target_node, label):
+    '''The pre-index reference answer: walk every first-level edge in the graph.'''
+    return {id(e) for n in g.nodes.values() for e in n.traverse(label) if e.target is target_node}
+
+
+# --- incoming-edge (reverse) index ----------------------------------------------------
+
+def test_reverse_uses_index_and_matches_scan():
+    g = _g(DOC)
+    ify = g[IFY]
+    got = list(ify.reverse(KNOWS, g))
+    assert {e.origin.id for e in got} == {CHUKS, ADA}
+    assert {id(e) for e in got} == _scan_reverse(g, ify, KNOWS)
+
+
+def test_reverse_is_first_level_only():
+    '''A nested edge (Ada knows Ify -> introducedBy Nkiru) is not a node's backlink.'''
+    g = _g(DOC)
+    assert list(g[NKIRU].reverse(INTRODUCED_BY, g)) == []
+    assert len(list(g.select(target=NKIRU, label=INTRODUCED_BY, deep=True))) == 1
+
+
+def test_select_target_via_index():
+    g = _g(DOC)
+    assert {e.origin.id for e in g.select(target=IFY)} == {CHUKS, ADA}
+    assert [e.label for e in g.select(target=CHUKS_IFY)] == [DISPUTES]
+    # object target matches by identity
+    assert len(list(g.select(target=g[NKIRU]))) == 1
+
+
+def test_index_follows_add_and_remove_edge():
+    g = _g(DOC)
+    ify = g[IFY]
+    e = g[NKIRU].add_edge(KNOWS, ify)
+    assert e in set(ify.reverse(KNOWS, g))
+    g[NKIRU].remove_edge(e)
+    assert e not in set(ify.reverse(KNOWS, g))
+    # removing an edge also removes edges nested under it from the index
+    ada_knows = next(g[ADA].traverse(KNOWS))
+    g[ADA].remove_edge(ada_knows)
+    assert list(g.select(target=NKIRU, label=INTRODUCED_BY, deep=True)) == []
+
+
+def test_index_follows_retarget():
+    g = _g(DOC)
+    e = next(g[ADA].traverse(KNOWS))
+    e.target = g[CHUKS]
+    assert [x.origin.id for x in g[CHUKS].reverse(KNOWS, g)] == [ADA]
+    assert {x.origin.id for x in g[IFY].reverse(KNOWS, g)} == {CHUKS}
+
+
+def test_index_follows_node_setitem_and_delitem():
+    g = graph()
+    target = g.node(I('http://e.o/T'))
+    loose = node(I('http://e.o/S'))
+    loose.add_edge(KNOWS, target)  # built before the node joins the graph
+    g[loose.id] = loose
+    assert len(list(target.reverse(KNOWS, g))) == 1
+    del g[loose.id]
+    assert list(target.reverse(KNOWS, g)) == []
+
+
+def test_index_follows_merge():
+    doc = DOCHEADER + '''
+# Chuks [Person]
+
+* knows -> Ify
+* knows -> Ify
+'''
+    g = _g(doc)
+    assert len(list(g[IFY].reverse(KNOWS, g))) == 2
+    g.merge()
+    got = list(g[IFY].reverse(KNOWS, g))
+    assert len(got) == 1
+    assert got[0] in g[CHUKS].edges
+
+
+def test_index_follows_union():
+    a = _g(DOCHEADER + '''
+# Chuks [Person]
+
+* knows -> Ify
+''')
+    b = _g(DOCHEADER + '''
+# Chuks [Person]
+
+* knows -> Ify
+
+# Ada [Person]
+
+* knows -> Ify
+''')
+    a.union(b)
+    ify = a[IFY]
+    got = list(ify.reverse(KNOWS, a))
+    assert {e.origin.id for e in got} == {CHUKS, ADA}
+    assert {id(e) for e in got} == _scan_reverse(a, ify, KNOWS)
+
+
+# --- per-container label index ----------------------------------------------------------
+
+def _hub(n_labels=5, per_label=10):
+    g = graph()
+    hub = g.node(I('http://e.o/Hub'))
+    for i in range(n_labels):
+        for j in range(per_label):
+            hub.add_property(I(f'http://s/p{i}'), str(j))
+            hub.add_edge(I(f'http://s/e{i}'), g.node(I(f'http://e.o/T{i}-{j}')))
+    return g, hub
+
+
+def test_label_index_is_lazy_and_threshold_gated():
+    small = node(I('http://e.o/Small'))
+    small.add_property(I('http://s/p'), 'x')
+    assert list(small.getprop(I('http://s/p')))[0].value == 'x'
+    assert small._by_label is None  # below threshold: scanned, nothing built
+    g, hub = _hub()
+    assert hub._by_label is None
+    assert len(list(hub.getprop(I('http://s/p1')))) == 10
+    assert hub._by_label is not None
+
+
+def test_label_index_maintained_by_add_and_remove():
+    g, hub = _hub()
+    list(hub.getedge(I('http://s/e0')))  # build
+    p = hub.add_property(I('http://s/new'), 'v')
+    e = hub.add_edge(I('http://s/e0'), g[I('http://e.o/T1-1')])
+    assert list(hub.getprop(I('http://s/new'))) == [p]
+    assert e in set(hub.traverse(I('http://s/e0')))
+    hub.remove_property(p)
+    hub.remove_edge(e)
+    assert list(hub.getprop(I('http://s/new'))) == []
+    assert len(list(hub.traverse(I('http://s/e0')))) == 10
+
+
+def test_label_index_agrees_with_scan_after_merge():
+    g, hub = _hub()
+    for j in range(10):  # duplicate every p0 property; merge must collapse them
+        hub.add_property(I('http://s/p0'), str(j))
+    assert len(list(hub.getprop(I('http://s/p0')))) == 20
+    g.merge()
+    got = set(hub.getprop(I('http://s/p0')))
+    assert got == {p for p in hub.properties if p.label == I('http://s/p0')}
+    assert len(got) == 10
+
+
+# --- type index ---------------------------------------------------------------------------
+
+PERSON = I('https://schema.org/Person')
+ORG = I('https://schema.org/Organization')
+
+
+def _typematch_ids(g, types):
+    return {n.id for n in g.typematch(types)}
+
+
+def _scan_types(g, types):
+    return {n.id for n in g.nodes.values() if n.types & set(types)}
+
+
+def test_typematch_via_index():
+    g = _g(DOC)
+    assert _typematch_ids(g, PERSON) == {CHUKS, ADA} == _scan_types(g, {PERSON})
+    assert _typematch_ids(g, {PERSON, ORG}) == {CHUKS, ADA}
+    assert list(g.typematch(ORG)) == []
+
+
+def test_type_index_follows_type_mutations():
+    g = _g(DOC)
+    ify = g[IFY]
+    ify.types.add(PERSON)
+    assert IFY in _typematch_ids(g, PERSON)
+    ify.types |= {ORG}
+    assert _typematch_ids(g, ORG) == {IFY}
+    ify.types.discard(PERSON)
+    ify.types -= {ORG}
+    assert IFY not in _typematch_ids(g, {PERSON, ORG})
+    g[ADA].types = {ORG}
+    assert _typematch_ids(g, PERSON) == {CHUKS}
+    assert _typematch_ids(g, ORG) == {ADA}
+    g[CHUKS].types.clear()
+    assert _typematch_ids(g, PERSON) == set()
+
+
+def test_type_index_follows_node_lifecycle():
+    g = graph()
+    g.node(I('http://e.o/A'), PERSON)
+    n = node(I('http://e.o/B'), {PERSON, ORG})
+    g[n.id] = n
+    assert _typematch_ids(g, PERSON) == {I('http://e.o/A'), I('http://e.o/B')}
+    g[n.id] = node(n.id)  # replaced by an untyped node
+    assert _typematch_ids(g, {PERSON, ORG}) == {I('http://e.o/A')}
+    del g[I('http://e.o/A')]
+    assert list(g.typematch(PERSON)) == []
+    # a copied type set is detached: mutating it does not touch the index
+    import copy
+    detached = copy.copy(n.types)
+    detached.add(PERSON)
+    assert type(detached) is set
+
+
+def test_type_index_follows_union():
+    a = _g(DOCHEADER + '''
+# Chuks [Person]
+''')
+    b = _g(DOCHEADER + '''
+# Chuks [Organization]
+
+# Ada [Person]
+''')
+    a.union(b)
+    assert _typematch_ids(a, PERSON) == {CHUKS, ADA}
+    assert _typematch_ids(a, ORG) == {CHUKS}
+
+
+# --- graph-wide label index (select planner) --------------------------------------------
+
+def test_graph_label_index_maintained_after_first_use():
+    g = _g(DOC)
+    assert g._assertions_by_label is None
+    assert len(list(g.select(label=KNOWS))) == 3
+    assert g._assertions_by_label is not None
+    e = g[NKIRU].add_edge(KNOWS, g[ADA])
+    assert e in set(g.select(label=KNOWS))
+    g[NKIRU].remove_edge(e)
+    del g[ADA]
+    assert {a.origin.id for a in g.select(label=KNOWS)} == {CHUKS}
+    assert list(g.select(label=INTRODUCED_BY, deep=True)) == []
+
+
+# --- property value index ---------------------------------------------------------------
+
+IDENTIFIER = I('https://schema.org/identifier')
+
+VALUES_DOC = DOCHEADER + '''
+# Odyssey [Book]
+
+* identifier: isbn:0140449132
+* name: The Odyssey
+
+# Catcher [Book]
+
+* identifier: isbn:0316769487
+
+# Ledger [Book]
+
+* identifier: oclc:12345
+* name: The Odyssey
+  * identifier: isbn:0000000000
+'''
+
+
+def _values(props):
+    return [p.value for p in props]
+
+
+def test_value_index_exact_match():
+    g = _g(VALUES_DOC)
+    scanned = {id(p) for p in g.select(label=IDENTIFIER, value='isbn:0316769487')}
+    g.enable_value_index()
+    plan = g.explain(label=IDENTIFIER, value='isbn:0316769487')
+    assert (plan.access, plan.estimate) == ('value', 1)
+    assert {id(p) for p in g.select(label=IDENTIFIER, value='isbn:0316769487')} == scanned
+    assert {p.origin.id for p in g.select(value='The Odyssey')} == {I('http://e.o/Odyssey'), I('http://e.o/Ledger')}
+    assert list(g.select(label=IDENTIFIER, value='isbn:0000000000')) == []
+    assert len(list(g.select(label=IDENTIFIER, value='isbn:0000000000', deep=True))) == 1
+
+
+def test_valuematch_prefix_and_range_with_and_without_index():
+    g = _g(VALUES_DOC)
+    unindexed = _values(g.valuematch(IDENTIFIER, prefix='isbn:'))
+    assert unindexed == ['isbn:0140449132', 'isbn:0316769487']
+    g.enable_value_index()
+    assert _values(g.valuematch(IDENTIFIER, prefix='isbn:')) == unindexed
+    assert _values(g.valuematch(IDENTIFIER, prefix='isbn:', deep=True)) == \
+        ['isbn:0000000000', 'isbn:0140449132', 'isbn:0316769487']
+    assert _values(g.valuematch(IDENTIFIER, lo='isbn:02', hi='oclc:2')) == ['isbn:0316769487', 'oclc:12345']
+    assert list(g.valuematch(IDENTIFIER, prefix='doi:')) == []
+
+
+def test_value_index_follows_mutations():
+    g = _g(VALUES_DOC).enable_value_index()
+    catcher = g[I('http://e.o/Catcher')]
+    p = next(catcher.getprop(IDENTIFIER))
+    p.value = 'isbn:9999999999'
+    assert list(g.select(label=IDENTIFIER, value='isbn:0316769487')) == []
+    assert list(g.select(label=IDENTIFIER, value='isbn:9999999999')) == [p]
+    p.label = I('https://schema.org/sku')
+    assert list(g.select(label=IDENTIFIER, value='isbn:9999999999')) == []
+    assert _values(g.valuematch(I('https://schema.org/sku'))) == ['isbn:9999999999']
+    catcher.remove_property(p)
+    assert list(g.valuematch(I('https://schema.org/sku'))) == []
+    q = catcher.add_property(IDENTIFIER, 'isbn:0316769487')
+    del g[I('http://e.o/Odyssey')]
+    assert _values(g.valuematch(IDENTIFIER, prefix='isbn:')) == ['isbn:0316769487']
+    assert list(g.select(label=IDENTIFIER, value='isbn:0316769487')) == [q]
+
+
+def test_relabel_edge_follows_incoming_index():
+    g = _g(DOC)
+    e = next(g[ADA].traverse(KNOWS))
+    e.label = DISPUTES
+    assert [x.origin.id for x in g[IFY].reverse(DISPUTES, g)] == [ADA]
+    assert {x.origin.id for x in g[IFY].reverse(KNOWS, g)} == {CHUKS}
+    assert list(g[ADA].traverse(DISPUTES)) == [e]
+
+
+# --- IRI interning ------------------------------------------------------------------------
+
+def test_parsed_labels_types_and_ids_are_shared():
+    g = _g(DOC)
+    knows = [e.label for n in g.nodes.values() for e in n.traverse(KNOWS)]
+    assert len(knows) == 3 and all(lbl is knows[0] for lbl in knows)
+    assert next(iter(g[CHUKS].types)) is next(iter(g[ADA].types))
+    ify = g[IFY]
+    assert ify.id is next(iter(k for k in g.nodes if k == IFY))
+    # Within a document the parser's memo already resolves each reference to one object (see
+    # expand_iri); the intern table shares them across documents.
+    LiterateParser().parse(DOCHEADER + '\n# Obi [Person]\n\n* knows -> Ify\n', g)
+    assert next(g[I('http://e.o/Obi')].traverse(KNOWS)).label is knows[0]
+    stats = g.memory_stats()
+    assert stats.distinct > 0 and stats.shared > 0 and stats.bytes_saved > 0
+
+
+def test_union_interns_into_the_receiving_graph():
+    a, b = _g(DOC), _g(DOC.replace('# ReviewNote', '# Editor [Person]\n\n* knows -> Ify\n\n# ReviewNote'))
+    a.union(b)
+    labels = {id(e.label) for n in a.nodes.values() for e in n.traverse(KNOWS)}
+    assert len(labels) == 1
+    assert a.memory_stats().shared > 0
+
+
+def test_intern_keeps_value_types():
+    g = graph()
+    shared = g.intern(I('http://e.o/x'))
+    assert g.intern(I('http://e.o/x')) is shared
+    assert g.intern('http://e.o/x', I) is shared
+    plain = g.intern('http://e.o/x')  # an equal plain str is not turned into an I
+    assert type(plain) is str
+    assert g.intern(None) is None
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# test_graph_journal.py
+'''
+Tests for the opt-in change journal: graph.enable_journal(), changes(), subscribe() and
+the monotonic graph.version.
+
+    pytest -s test/test_graph_journal.py
+'''
+
+from amara.iri import I
+
+from onya.graph import graph, edge, iter_assertions
+from onya.serial.literate import LiterateParser
+
+
+DOCHEADER = '''\
+# @docheader
+
+* @document: http://e.o/doc
+* @nodebase: http://e.o/
+* @schema: https://schema.org/
+'''
+
+DOC = DOCHEADER + '''
+# Chuks [Person]
+
+* name: Chuks
+* knows -> Ify
+  * since: 2018
+'''
+
+DUP = DOCHEADER + '''
+# Chuks [Person]
+
+* name: Chuks
+* knows -> Ify
+  * source: interview
+'''
+
+CHUKS = I('http://e.o/Chuks')
+IFY = I('http://e.o/Ify')
+NAME = I('https://schema.org/name')
+KNOWS = I('https://schema.org/knows')
+AUTHOR = I('https://schema.org/Author')
+
+
+def _ops(records):
+    return [r.op for r in records]
+
+
+def test_off_by_default():
+    g = graph()
+    LiterateParser().parse(DOC, g)
+    assert g.changes() == [] and g.version > 0
+
+
+def test_parser_and_model_api_emit():
+    g = graph().enable_journal()
+    LiterateParser().parse(DOC, g)
+    parsed = g.changes()
+    assert {'add_node', 'add'} <= set(_ops(parsed))
+    added = [r.subject for r in parsed if r.op == 'add']
+    covered = {id(a) for a in added} | {id(a) for a in iter_assertions(added)}  # 'add' covers the subtree
+    assert covered == {id(a) for a in iter_assertions(g.nodes.values())}
+
+    mark = g.version
+    chuks = g[CHUKS]
+    name = next(chuks.getprop(NAME))
+    name.value = 'Charles'
+    name.interp = I('http://e.o/text')
+    chuks.types.add(AUTHOR)
+    knows = next(chuks.getedge(KNOWS))
+    g.register_assertion_id(I('http://e.o/chuks-ify'), knows)
+    chuks.remove_property(name)
+    recent = g.changes(since=mark)
+    assert _ops(recent) == ['value', 'interp', 'types', 'id', 'remove']
+    assert (recent[0].old, recent[0].new) == ('Chuks', 'Charles')
+    assert recent[2].new == (AUTHOR,)
+    assert recent[4].subject is name and recent[4].old is chuks
+    versions = [r.version for r in g.changes()]
+    assert versions == sorted(versions) and versions[-1] == g.version
+
+
+def test_union_and_merge_emit():
+    g = graph()
+    LiterateParser().parse(DOC, g)
+    g.merge().enable_journal()
+    other = graph()
+    LiterateParser().parse(DUP, other)
+    g.union(other)
+    ops = _ops(g.changes())
+    assert 'add' in ops and 'remove' in ops
+    # the folded duplicate's nested `source` moved onto the surviving `knows` edge
+    moves = [r for r in g.changes() if r.op == 'move']
+    knows = next(g[CHUKS].getedge(KNOWS))
+    assert [r.new for r in moves] == [knows]
+    assert sorted(p.label.rsplit('/', 1)[-1] for p in knows.properties) == ['since', 'source']
+
+
+def test_subscribe_and_truncate():
+    g = graph()
+    seen = []
+    g.subscribe(seen.append)
+    n = g.node(CHUKS)
+    e = n.add_edge(KNOWS, g.node(IFY))
+    e.target = g.node(I('http://e.o/Nkiru'))
+    assert _ops(seen) == ['add_node', 'add_node', 'add', 'add_node', 'target']
+    assert isinstance(seen[2].subject, edge)
+    g.unsubscribe(seen.append)
+    g.truncate_journal(seen[2].version)
+    assert _ops(g.changes()) == ['add_node', 'target']
+    g.disable_journal()
+    del g[CHUKS]
+    assert g.changes() == []
@@ -212,3 +212,109 @@ def test_merge_is_idempotent_operation():
     g.merge()
     after = len(_props(g['http://e.o/Chuks'], 'https://schema.org/age'))
     assert before == after == 1
+
+
+# --- cached skeletons and dirty-only merge ------------------------------------------
+
+def test_skeleton_cache_follows_mutation():
+    '''A cached skeleton must not outlive a change to the label, value or target.'''
+    g = _merged(DOCHEADER + '''
+# Chuks [Person]
+
+* name: Chuks
+* name: Chukwuemeka
+* knows -> Ify
+* knows -> Ada
+''')
+    chuks = g[I('http://e.o/Chuks')]
+    name = I('https://schema.org/name')
+    knows = I('https://schema.org/knows')
+    assert len(_props(chuks, name)) == 2 and len(_edges(chuks, knows)) == 2
+    p = next(p for p in _props(chuks, name) if p.value == 'Chukwuemeka')
+    p.value = 'Chuks'
+    e = next(e for e in _edges(chuks, knows) if e.target.id == I('http://e.o/Ada'))
+    e.target = g[I('http://e.o/Ify')]
+    assert g.dirty == [chuks]
+    g.merge(g.dirty)
+    assert [p.value for p in _props(chuks, name)] == ['Chuks']
+    assert [e.target.id for e in _edges(chuks, knows)] == [I('http://e.o/Ify')]
+    assert g.dirty == []
+
+
+def test_merge_dirty_only_touches_changed_nodes():
+    g = _merged(DOCHEADER + '''
+# Chuks [Person]
+
+* name: Chuks
+
+# Ada [Person]
+
+* name: Ada
+''')
+    name = I('https://schema.org/name')
+    ada = g[I('http://e.o/Ada')]
+    chuks = g[I('http://e.o/Chuks')]
+    assert g.dirty == []
+    ada.add_property(name, 'Ada')
+    assert g.dirty == [ada]
+    g.merge(g.dirty)
+    assert len(_props(ada, name)) == 1
+    # re-interpreting a property can make it mergeable with a sibling
+    p1 = chuks.add_property(name, 'Chuks')
+    p1.interp = I('http://e.o/contract')
+    next(p for p in _props(chuks, name) if p is not p1).interp = I('http://e.o/contract')
+    assert g.dirty == [chuks]
+    g.merge(g.dirty)
+    assert len(_props(chuks, name)) == 1
+
+
+def test_dirty_tracking_starts_with_the_first_merge():
+    g = _parse(DOCHEADER + '''
+# Chuks [Person]
+
+* name: Chuks
+* name: Chuks
+
+# Ada [Person]
+
+* name: Ada
+''')
+    name = I('https://schema.org/name')
+    ada = g[I('http://e.o/Ada')]
+    chuks = g[I('http://e.o/Chuks')]
+    assert g._dirty is None  # nothing recorded before the first merge...
+    assert {n.id for n in g.dirty} == set(g.nodes)  # ...since every node counts as dirty
+    g.merge([ada])
+    assert {n.id for n in g.dirty} == set(g.nodes) - {ada.id}
+    g.merge(g.dirty)
+    assert g.dirty == [] and len(_props(chuks, name)) == 1
+    chuks.add_property(name, 'Chuks')
+    assert g.dirty == [chuks]
+
+
+def test_union_merges_only_what_changed():
+    a = _merged(DOCHEADER + '''
+# Chuks [Person]
+
+* name: Chuks
+
+# Ada [Person]
+
+* name: Ada
+''')
+    b = _parse(DOCHEADER + '''
+# Ada [Person]
+
+* name: Ada
+* name: Ada
+
+# Ify [Person]
+
+* name: Ify
+* name: Ify
+''')
+    a.union(b)
+    name = I('https://schema.org/name')
+    for nid in ('Chuks', 'Ada', 'Ify'):
+        assert len(_props(a[I(f'http://e.o/{nid}')], name)) == 1
+    assert a.dirty == []
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# test_graph_path.py
+'''
+Tests for graph.path() — the path-expression language (onya.path): sequence, alternation,
+inverse, repetition, and the memoized reachability behind unbounded repetition.
+
+    pytest -s test/test_graph_path.py
+'''
+
+import pytest
+from amara.iri import I
+
+from onya.graph import graph
+from onya.path import Link, Seq, Alt, Repeat, compile_path
+from onya.serial.literate import LiterateParser
+
+
+DOC = '''\
+# @docheader
+
+* @document: http://e.o/doc
+* @nodebase: http://e.o/
+* @schema: https://schema.org/
+
+# Chuks [Person]
+
+* knows -> Ify
+* worksFor -> Acme
+
+# Ify [Person]
+
+* knows -> Nkiru
+* worksFor -> Oori
+
+# Nkiru [Person]
+
+* knows -> Chuks
+* knows -> Obi
+* worksFor -> Acme
+
+# Obi [Person]
+
+# Acme [Organization]
+
+* parentOrganization -> Holdings
+
+# Oori [Organization]
+
+# Holdings [Organization]
+'''
+
+SCHEMA = 'https://schema.org/'
+KNOWS = I(SCHEMA + 'knows')
+
+
+def _g():
+    g = graph()
+    LiterateParser().parse(DOC, g)
+    return g
+
+
+def _ids(items):
+    return [str(x.id).rsplit('/', 1)[-1] for x in items]
+
+
+def test_compile_shapes():
+    k, w = Link(KNOWS), Link(I(SCHEMA + 'worksFor'))
+    assert compile_path('knows/worksFor', base=SCHEMA) == Seq((k, w))
+    assert compile_path('knows|worksFor', base=SCHEMA) == Alt((k, w))
+    assert compile_path('knows+', base=SCHEMA) == Repeat(k, 1, None)
+    assert compile_path('knows{2,}', base=SCHEMA) == Repeat(k, 2, None)
+    assert compile_path('knows{1,3}', base=SCHEMA) == Repeat(k, 1, 3)
+    assert compile_path('s:knows', prefixes={'s': SCHEMA}) == k
+    assert compile_path(f'<{KNOWS}>') == k
+    # inverse is pushed down to the links
+    assert compile_path('^(knows/worksFor)', base=SCHEMA) == Seq((Link(w.label, True), Link(KNOWS, True)))
+    assert compile_path(str(compile_path('(knows|^worksFor)*/knows?', base=SCHEMA))) == \
+        compile_path('(knows|^worksFor)*/knows?', base=SCHEMA)
+
+
+@pytest.mark.parametrize('text', ['', 'knows/', '(knows', 'knows{3,1}', '|knows', 'knows)'])
+def test_compile_errors(text):
+    with pytest.raises(ValueError):
+        compile_path(text, base=SCHEMA)
+
+
+def test_sequence_alternation_inverse():
+    g = _g()
+    chuks = g[I('http://e.o/Chuks')]
+    assert _ids(g.path(chuks, 'knows/worksFor', base=SCHEMA)) == ['Oori']
+    assert sorted(_ids(g.path(chuks, 'knows|worksFor', base=SCHEMA))) == ['Acme', 'Ify']
+    assert sorted(_ids(g.path('http://e.o/Acme', '^worksFor', base=SCHEMA))) == ['Chuks', 'Nkiru']
+    # colleagues: people sharing an employer
+    assert sorted(_ids(g.path(chuks, 'worksFor/^worksFor', base=SCHEMA))) == ['Chuks', 'Nkiru']
+
+
+def test_repetition():
+    g = _g()
+    chuks = g[I('http://e.o/Chuks')]
+    assert sorted(_ids(g.path(chuks, 'knows+', base=SCHEMA))) == ['Chuks', 'Ify', 'Nkiru', 'Obi']
+    assert sorted(_ids(g.path('http://e.o/Obi', 'knows*', base=SCHEMA))) == ['Obi']
+    assert sorted(_ids(g.path('http://e.o/Obi', 'knows+', base=SCHEMA))) == []
+    assert sorted(_ids(g.path(chuks, 'knows?', base=SCHEMA))) == ['Chuks', 'Ify']
+    assert _ids(g.path(chuks, 'knows{2}', base=SCHEMA)) == ['Nkiru']
+    assert sorted(_ids(g.path(chuks, 'knows{2,3}', base=SCHEMA))) == ['Chuks', 'Nkiru', 'Obi']
+    assert sorted(_ids(g.path('http://e.o/Obi', '^knows+/worksFor/parentOrganization*', base=SCHEMA))) == \
+        ['Acme', 'Holdings', 'Oori']
+
+
+def test_closure_memo_reused_and_invalidated():
+    g = _g()
+    chuks, obi = g[I('http://e.o/Chuks')], g[I('http://e.o/Obi')]
+    assert sorted(_ids(g.path(chuks, 'knows+', base=SCHEMA))) == ['Chuks', 'Ify', 'Nkiru', 'Obi']
+    memo = g._reach_memo[Link(KNOWS)]
+    assert memo
+    # a second closure query over the same label is answered from the memo
+    before = dict(memo)
+    assert sorted(_ids(g.path('http://e.o/Nkiru', 'knows*', base=SCHEMA))) == ['Chuks', 'Ify', 'Nkiru', 'Obi']
+    assert g._reach_memo[Link(KNOWS)] is memo
+    assert all(memo[k] is v for k, v in before.items())
+
+    # a model-API change invalidates it
+    obi.add_edge(KNOWS, g.node(I('http://e.o/Ada')))
+    assert g._reach_at != g._mutations  # stale; dropped by the next closure query
+    assert sorted(_ids(g.path(chuks, 'knows+', base=SCHEMA))) == ['Ada', 'Chuks', 'Ify', 'Nkiru', 'Obi']
+
+
+def test_long_chain_closure_is_iterative():
+    g = graph()
+    nodes = [g.node(I(f'http://e.o/n{i}')) for i in range(5000)]
+    for a, b in zip(nodes, nodes[1:]):
+        a.add_edge(KNOWS, b)
+    assert len(g.path(nodes[0], 'knows+', base=SCHEMA)) == 4999
+    assert len(g.path(nodes[-1], '^knows*', base=SCHEMA)) == 5000
+    assert g.path(nodes[10], Repeat(Link(KNOWS), 3, 3)) == [nodes[13]]
+
+
+def test_multiple_starts_and_unknown_ids():
+    g = _g()
+    got = g.path(['http://e.o/Chuks', 'http://e.o/Ify', 'http://e.o/nobody'], 'worksFor', base=SCHEMA)
+    assert sorted(_ids(got)) == ['Acme', 'Oori']
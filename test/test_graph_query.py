@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# test_graph_query.py
+'''
+Tests for graph.query() — conjunctive multi-hop pattern joins (onya.query).
+
+Every query is checked against a brute-force evaluation (the cross product of each
+pattern's select() matches, filtered for consistent bindings).
+
+    pytest -s test/test_graph_query.py
+'''
+
+import itertools
+
+import pytest
+from amara.iri import I
+
+from onya.graph import graph
+from onya.query import Pattern, Var, plan, _extend, _constants
+from onya.serial.literate import LiterateParser
+
+
+DOC = '''\
+# @docheader
+
+* @document: http://e.o/doc
+* @nodebase: http://e.o/
+* @schema: https://schema.org/
+
+# Chuks [Person]
+
+* name: Chuks
+* knows -> Ify
+  * since: 2018
+* knows -> Nkiru
+* worksFor -> Acme
+
+# Ify [Person]
+
+* name: Ify
+* knows -> Nkiru
+  * since: 2020
+* worksFor -> Oori
+
+# Nkiru [Person]
+
+* name: Nkiru
+* knows -> Chuks
+* worksFor -> Acme
+
+# Acme [Organization]
+
+* name: Acme
+
+# Oori [Organization]
+
+* name: Oori
+'''
+
+CHUKS = I('http://e.o/Chuks')
+NAME = I('https://schema.org/name')
+KNOWS = I('https://schema.org/knows')
+WORKS_FOR = I('https://schema.org/worksFor')
+SINCE = I('https://schema.org/since')
+
+
+def _g():
+    g = graph()
+    LiterateParser().parse(DOC, g)
+    return g
+
+
+def _brute(g, patterns):
+    nested = {p.assertion.name for p in patterns if p.assertion is not None}
+    pools = []
+    for p in patterns:
+        deep = p.deep or (p.origin is not None and getattr(p.origin, 'name', None) in nested)
+        pools.append(list(g.select(**_constants(p), deep=deep)))
+    out = []
+    for combo in itertools.product(*pools):
+        b = {}
+        for p, a in zip(patterns, combo):
+            b = _extend(b, p, a)
+            if b is None:
+                break
+        else:
+            out.append(b)
+    return out
+
+
+def _canon(bindings):
+    def key(v):
+        return str(v) if isinstance(v, str) else str(getattr(v, 'id', None) or id(v))
+    return sorted(tuple(sorted((k, key(v)) for k, v in b.items())) for b in bindings)
+
+
+def _check(g, patterns):
+    got = list(g.query(patterns))
+    assert _canon(got) == _canon(_brute(g, patterns))
+    return got
+
+
+def test_friend_of_friend():
+    g = _g()
+    P, F, FF = Var('p'), Var('f'), Var('ff')
+    got = _check(g, [Pattern(P, KNOWS, target=F), Pattern(F, KNOWS, target=FF)])
+    pairs = {(b['p'].id, b['ff'].id) for b in got}
+    assert (CHUKS, I('http://e.o/Nkiru')) in pairs
+    assert (I('http://e.o/Nkiru'), I('http://e.o/Ify')) in pairs
+
+
+def test_three_hop_with_constant_value():
+    g = _g()
+    got = _check(g, [
+        Pattern('?p', KNOWS, target='?f'),
+        Pattern('?f', WORKS_FOR, target='?o'),
+        Pattern('?o', NAME, value='Acme'),
+    ])
+    assert {b['p'].id for b in got} == {CHUKS, I('http://e.o/Ify'), I('http://e.o/Nkiru')}
+    assert {b['f'].id for b in got} == {I('http://e.o/Nkiru'), CHUKS}
+
+
+def test_value_variable_hash_join():
+    g = _g()
+    # two people whose employers share a name: joins on a string-valued variable
+    patterns = [
+        Pattern('?a', WORKS_FOR, target='?oa'),
+        Pattern('?oa', NAME, value='?n'),
+        Pattern('?b', WORKS_FOR, target='?ob'),
+        Pattern('?ob', NAME, value='?n'),
+    ]
+    got = _check(g, patterns)
+    assert len(got) == 5  # Chuks/Nkiru x Chuks/Nkiru, plus Ify paired with Ify
+    assert any(step.method == 'hash' for step in plan(g, patterns))
+
+
+def test_nested_assertion_pattern():
+    g = _g()
+    got = _check(g, [
+        Pattern('?p', KNOWS, target='?f', assertion='?k'),
+        Pattern('?k', SINCE, value='?since'),
+    ])
+    assert sorted((b['p'].id, b['since']) for b in got) == [
+        (CHUKS, '2018'), (I('http://e.o/Ify'), '2020')]
+
+
+def test_plan_puts_selective_pattern_first():
+    g = _g()
+    g.enable_value_index()
+    patterns = [Pattern('?p', KNOWS, target='?f'), Pattern('?p', NAME, value='Ify')]
+    steps = plan(g, patterns)
+    assert steps[0].pattern is patterns[1]
+    assert steps[1].method == 'index' and steps[1].index_on == ('origin',)
+    got = _check(g, patterns)
+    assert [b['f'].id for b in got] == [I('http://e.o/Nkiru')]
+
+
+def test_disconnected_patterns_cross():
+    g = _g()
+    _check(g, [Pattern(CHUKS, NAME, value='?x'), Pattern('?o', NAME, value='Oori')])
+
+
+def test_query_streams():
+    g = _g()
+    it = g.query([Pattern('?p', KNOWS, target='?f')])
+    assert isinstance(next(it), dict)
+
+
+def test_pattern_rejects_value_and_target():
+    with pytest.raises(ValueError):
+        Pattern('?p', KNOWS, value='?v', target='?t')
@@ -12,7 +12,7 @@ select() yields live assertion objects with a wildcard on every component
 
 from amara.iri import I
 
-from onya.graph import graph, edge, property_
+from onya.graph import graph, edge, property_, iter_assertions
 from onya.serial.literate import LiterateParser
 
 
@@ -188,3 +188,120 @@ def test_match_by_origin_and_label():
     g = _g()
     rows = list(g.match(CHUKS, NAME))
     assert sorted(t for (_o, _r, t, _a) in rows) == ['Charles', 'Chuks']
+
+
+# --- planner / explain() ---------------------------------------------------------------
+
+def test_explain_picks_index_paths():
+    g = _g()
+    assert g.explain(id=CHUKS_IFY).access == 'assertion_id'
+    assert g.explain(target=IFY).access == 'incoming'
+    assert g.explain(origin=CHUKS, label=NAME).access == 'origin'
+    plan = g.explain(label=KNOWS)
+    assert (plan.access, plan.estimate) == ('label', 2)
+    assert g.explain().access == 'scan'
+    assert g.explain(value='Chuks').access == 'scan'  # nothing indexes a bare value
+
+
+def test_explain_prefers_most_selective():
+    '''With both origin= and target=, the smaller candidate set wins.'''
+    g = _g()
+    plan = g.explain(origin=CHUKS, target=IFY)
+    assert plan.access == 'incoming'
+    assert dict(plan.considered) == {'incoming': 1, 'origin': 2}  # a target= pattern only costs Chuks' 2 edges
+    assert len(list(g.select(origin=CHUKS, target=IFY))) == 1
+
+
+def test_select_id_via_assertion_ids():
+    g = _g()
+    got = list(g.select(id=CHUKS_IFY))
+    assert len(got) == 1 and got[0] is g.assertion_ids[CHUKS_IFY]
+    # the nested `since` has no id; an id on a nested assertion needs deep=
+    nested = next(iter(got[0].properties))
+    nested.id = I('http://e.o/since-1')
+    assert list(g.select(id=I('http://e.o/since-1'))) == []
+    assert list(g.select(id=I('http://e.o/since-1'), deep=True)) == [nested]
+
+
+def test_planned_select_matches_scan():
+    '''Every index-backed plan returns exactly what a brute-force filter over a full walk does.'''
+    g = _g()
+    everything = list(g._walk_all(deep=True))
+
+    def brute(origin=None, label=None, value=None, target=None, id=None, deep=False):
+        out = set()
+        for a in everything:
+            if not deep and not isinstance(a.origin, type(g[CHUKS])):
+                continue
+            if origin is not None and getattr(a.origin, 'id', None) != origin:
+                continue
+            if label is not None and a.label != label:
+                continue
+            if value is not None and getattr(a, 'value', None) != value:
+                continue
+            if target is not None and getattr(getattr(a, 'target', None), 'id', None) != target:
+                continue
+            if id is not None and a.id != id:
+                continue
+            out.add(a)
+        return out
+
+    cases = [
+        dict(label=KNOWS), dict(label=SINCE), dict(label=SINCE, deep=True),
+        dict(target=IFY), dict(target=CHUKS_IFY, label=DISPUTES), dict(id=CHUKS_IFY),
+        dict(origin=CHUKS, label=NAME), dict(origin=CHUKS_IFY, deep=True),
+        dict(origin=CHUKS, value='Chuks'), dict(value='40'),
+    ]
+    for kw in cases:
+        assert set(g.select(**kw)) == brute(**kw), kw
+
+
+# --- shared assertion iterator ----------------------------------------------------------
+
+def _chain(depth):
+    '''A node carrying one property reified `depth` levels deep, with a contract at the bottom.'''
+    g = graph()
+    a = g.node(I('http://e.o/Deep')).add_property(NOTE, 'level 0')
+    for i in range(1, depth):
+        a = a.add_property(NOTE, f'level {i}')
+    a.interp = I('http://e.o/unknown-contract')
+    return g, a
+
+
+NOTE = I('https://schema.org/note')
+
+
+def test_iter_assertions_preorder_and_depth():
+    g = _g()
+    chuks = g[CHUKS]
+    walked = list(iter_assertions([chuks]))
+    # each assertion is immediately followed by its own subtree
+    for i, a in enumerate(walked):
+        subtree = list(iter_assertions([a]))
+        assert walked[i + 1:i + 1 + len(subtree)] == subtree
+    assert set(iter_assertions([chuks], deep=False)) == chuks.properties | chuks.edges
+    assert sorted(map(repr, iter_assertions([chuks], snapshot=False))) == sorted(map(repr, walked))
+
+
+def test_iter_assertions_snapshot_tolerates_mutation():
+    g = _g()
+    chuks = g[CHUKS]
+    for a in iter_assertions([chuks]):
+        if a.origin is chuks and a.label == NAME:
+            chuks.remove_property(a)
+    assert list(chuks.getprop(NAME)) == []
+
+
+def test_deep_reification_chain_does_not_recurse():
+    from onya.interp import unknown_interps
+    from onya.store._relational import iter_records
+    depth = 5000
+    g, bottom = _chain(depth)
+    assert len(list(g.select(deep=True))) == depth
+    assert list(g.select(value=f'level {depth - 1}', deep=True)) == [bottom]
+    assert unknown_interps(g) == {I('http://e.o/unknown-contract'): [bottom]}
+    records = iter_records(g[I('http://e.o/Deep')])
+    assert len(records) == depth and records[-1].obj is bottom
+    g.merge()  # merge, attach and detach walk with explicit stacks too
+    del g[I('http://e.o/Deep')]
+    assert g.assertion_ids == {} and bottom._graph is None
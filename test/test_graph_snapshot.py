@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# test_graph_snapshot.py
+'''
+Tests for graph.snapshot() — copy-on-write read-only views (onya.snapshot).
+
+    pytest -s test/test_graph_snapshot.py
+'''
+
+import threading
+
+import pytest
+from amara.iri import I
+
+from onya.graph import graph
+from onya.serial.literate import LiterateParser
+
+
+DOCHEADER = '''\
+# @docheader
+
+* @document: http://e.o/doc
+* @nodebase: http://e.o/
+* @schema: https://schema.org/
+'''
+
+DOC = DOCHEADER + '''
+# Chuks [Person]
+
+* name: Chuks
+* knows -> Ify
+  * @id: chuks-ify
+  * since: 2018
+
+# Ify [Person]
+
+* name: Ify
+
+# ReviewNote
+
+* disputes -> chuks-ify
+'''
+
+DELTA = DOCHEADER + '''
+# Chuks [Person]
+
+* name: Charles
+* knows -> Nkiru
+
+# Nkiru [Person]
+
+* name: Nkiru
+'''
+
+CHUKS = I('http://e.o/Chuks')
+IFY = I('http://e.o/Ify')
+NKIRU = I('http://e.o/Nkiru')
+NAME = I('https://schema.org/name')
+KNOWS = I('https://schema.org/knows')
+SINCE = I('https://schema.org/since')
+PERSON = I('https://schema.org/Person')
+DISPUTES = I('https://schema.org/disputes')
+
+
+def _g(doc=DOC):
+    g = graph()
+    LiterateParser().parse(doc, g)
+    return g
+
+
+def _state(view):
+    return sorted((str(o), str(label), str(t)) for o, label, t, _ in view.match())
+
+
+def test_snapshot_is_stable_across_union():
+    g = _g()
+    before = _state(g)
+    snap = g.snapshot()
+    g.union(_g(DELTA))
+    assert _state(g) != before
+    assert _state(snap) == before
+    assert NKIRU in g and NKIRU not in snap
+    assert sorted(snap) == sorted(_g())
+
+
+def test_untouched_nodes_are_copied_only_on_read():
+    g = _g()
+    snap = g.snapshot()
+    assert snap._own == {}
+    g[CHUKS].add_property(NAME, 'Charles')
+    assert set(snap._own) == {CHUKS}  # copied just before the write
+    assert sorted(p.value for p in snap[CHUKS].getprop(NAME)) == ['Chuks']
+    ify = snap[IFY]
+    assert ify is not g[IFY] and snap[IFY] is ify
+
+
+def test_every_mutation_path_is_preserved():
+    g = _g()
+    snap = g.snapshot()
+    chuks = g[CHUKS]
+    knows = next(chuks.getedge(KNOWS))
+    knows.label = I('https://schema.org/follows')
+    next(g[IFY].getprop(NAME)).value = 'Ifeoma'
+    g[IFY].types.add(I('https://schema.org/Author'))
+    next(knows.getprop(SINCE)).interp = I('http://e.o/year')
+    del g[I('http://e.o/ReviewNote')]
+    g.node(NKIRU)
+
+    assert next(snap[CHUKS].getedge(KNOWS)).label == KNOWS
+    assert [p.value for p in snap[IFY].getprop(NAME)] == ['Ify']
+    assert snap[IFY].types == {PERSON}
+    assert next(next(snap[CHUKS].getedge(KNOWS)).getprop(SINCE)).interp is None
+    assert I('http://e.o/ReviewNote') in snap and NKIRU not in snap
+
+
+def test_select_and_target_stay_inside_snapshot():
+    g = _g()
+    snap = g.snapshot()
+    g[I('http://e.o/Ify')].add_property(NAME, 'Ifeoma')
+    knows = next(snap.select(CHUKS, KNOWS))
+    assert snap.target(knows) is snap[IFY]
+    assert [p.value for p in snap.target(knows).getprop(NAME)] == ['Ify']
+    dispute = next(snap.select(label=DISPUTES))
+    reified = snap.target(dispute)
+    assert reified.id == I('http://e.o/chuks-ify') and reified.origin is snap[CHUKS]
+    assert [n.id for n in snap.typematch(PERSON)] == [n.id for n in g.typematch(PERSON)]
+    assert [a.value for a in snap.select(label=SINCE, deep=True)] == ['2018']
+    assert list(snap.select(target=IFY))[0].origin.id == CHUKS
+
+
+def test_close_detaches():
+    g = _g()
+    with g.snapshot() as snap:
+        chuks = snap[CHUKS]
+        assert g._snapshots
+    assert not g._snapshots
+    g[CHUKS].add_property(NAME, 'Charles')
+    assert snap[CHUKS] is chuks  # copies already taken stay readable
+    with pytest.raises(ValueError):
+        snap[IFY]
+
+
+def test_concurrent_reader_sees_consistent_state():
+    g = _g()
+    snap = g.snapshot()
+    expected = _state(snap)
+
+    def write():
+        for i in range(200):
+            g[CHUKS].add_property(NAME, f'alias {i}')
+            g.node(I(f'http://e.o/n{i}')).add_edge(KNOWS, g[CHUKS])
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    seen = [_state(snap) for _ in range(20)]
+    writer.join()
+    assert all(s == expected for s in seen)
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# test_graph_stats.py
+'''
+Tests for graph.stats() — the statistics catalogue used for cardinality estimation.
+
+    pytest -s test/test_graph_stats.py
+'''
+
+from amara.iri import I
+
+from onya.graph import graph, iter_assertions
+from onya.query import Pattern, plan
+from onya.serial.literate import LiterateParser
+
+
+DOC = '''\
+# @docheader
+
+* @document: http://e.o/doc
+* @nodebase: http://e.o/
+* @schema: https://schema.org/
+
+# Chuks [Person]
+
+* name: Chuks
+* knows -> Ify
+  * since: 2018
+* knows -> Nkiru
+
+# Ify [Person]
+
+* name: Ify
+* knows -> Nkiru
+
+# Acme [Organization]
+
+* name: Acme
+'''
+
+NAME = I('https://schema.org/name')
+KNOWS = I('https://schema.org/knows')
+SINCE = I('https://schema.org/since')
+PERSON = I('https://schema.org/Person')
+
+
+def _g():
+    g = graph()
+    LiterateParser().parse(DOC, g)
+    return g
+
+
+def test_catalogue_figures():
+    g = _g()
+    st = g.stats()
+    assert st.nodes == len(g)
+    assert st.assertions == sum(1 for _ in iter_assertions(g.nodes.values()))
+    assert st.top_level == st.assertions - 1  # everything but the nested `since`
+    assert st.types[PERSON] == 2
+    knows = st.label(KNOWS)
+    assert (knows.assertions, knows.edges, knows.properties) == (3, 3, 0)
+    assert knows.origins == 2 and knows.targets == 2
+    assert knows.out_degree == 1.5 and knows.in_degree == 1.5
+    name = st.label(NAME)
+    assert (name.properties, name.values) == (3, 3)
+    assert st.label(SINCE).origins == 1
+    assert st.label(I('http://e.o/absent')).assertions == 0
+
+
+def test_cached_until_mutation():
+    g = _g()
+    st = g.stats()
+    assert g.stats() is st
+    g[I('http://e.o/Acme')].add_property(NAME, 'Acme Corp')
+    fresh = g.stats()
+    assert fresh is not st and fresh.label(NAME).values == 4
+    assert st.label(NAME).values == 3  # the old snapshot is untouched
+
+
+def test_explain_costs_scan_from_current_stats():
+    g = _g()
+    assert g.explain().estimate is None
+    st = g.stats()
+    assert g.explain().estimate == st.top_level
+    assert g.explain(deep=True).estimate == st.assertions
+    g.node(I('http://e.o/New'))
+    assert g.explain().estimate is None  # stale catalogue is not used
+
+
+def test_query_planner_uses_value_selectivity():
+    g = _g()
+    g.stats()
+    patterns = [Pattern('?p', KNOWS, target='?f'), Pattern('?p', NAME, value='Ify')]
+    steps = plan(g, patterns)
+    # without a value index, a constant name is still judged selective (3 names, 3 values)
+    assert steps[0].pattern is patterns[1]
+    assert steps[0].estimate == 1
+    assert steps[1].estimate == 1.5  # knows out-degree
+
+
+def test_query_planner_does_not_rebuild_a_stale_catalogue():
+    g = _g()
+    st = g.stats()
+    g.node(I('http://e.o/New'))
+    patterns = [Pattern('?p', KNOWS, target='?f'), Pattern('?p', NAME, value='Ify')]
+    steps = plan(g, patterns)
+    assert g._stats is st  # planning fell back to the index estimates, with no graph walk
+    assert [s.estimate for s in steps] == [g.explain(label=NAME).estimate, g.explain(label=KNOWS).estimate]
+    assert len(list(g.query(patterns))) == 1
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# test_graph_threadsafe.py
+'''
+Tests for the opt-in thread-safe mode (graph.enable_thread_safety, onya.rwlock.RWLock). Its
+overhead is measured by `bench/threadsafe_overhead.py`.
+
+    pytest -s test/test_graph_threadsafe.py
+'''
+
+import gc
+import threading
+import time
+
+import pytest
+from amara.iri import I
+
+from onya.graph import _typeset, assertions_mixin, graph, node
+from onya.rwlock import RWLock
+from onya.serial.literate import LiterateParser
+
+
+DOCHEADER = '''\
+# @docheader
+
+* @document: http://e.o/doc
+* @nodebase: http://e.o/
+* @schema: https://schema.org/
+'''
+
+KNOWS = I('https://schema.org/knows')
+NAME = I('https://schema.org/name')
+SINCE = I('https://schema.org/since')
+
+
+def _delta(i):
+    g = graph()
+    LiterateParser().parse(DOCHEADER + f'\n# N{i} [Person]\n\n* name: N{i}\n* knows -> N{i + 1}\n  * since: {i}\n', g)
+    return g
+
+
+def test_off_by_default():
+    g = graph()
+    assert g._rwlock is None
+    with g.reading(), g.writing():  # no-ops
+        g.node(I('http://e.o/A')).add_property(NAME, 'A')
+    assert g.enable_thread_safety() is g and g.enable_thread_safety()._rwlock is g._rwlock
+    assert g.disable_thread_safety()._rwlock is None
+
+
+def test_readers_see_whole_writes():
+    g = graph().enable_thread_safety()
+    hub = g.node(I('http://e.o/Hub'))
+    stop = threading.Event()
+    errors = []
+
+    def write():
+        for i in range(300):
+            with g.writing():  # an edge and its annotation land together
+                e = hub.add_edge(KNOWS, g.node(I(f'http://e.o/n{i}')))
+                e.add_property(SINCE, str(i))
+            g.union(_delta(i))
+        stop.set()
+
+    def read():
+        try:
+            while not stop.is_set():
+                for e in g.select(hub, KNOWS):
+                    assert len(list(e.getprop(SINCE))) == 1
+                for nid in g:
+                    list(g[nid].getedge(KNOWS))
+                list(g.typematch(I('https://schema.org/Person')))
+        except Exception as exc:  # surfaced below; a thread's exception is otherwise lost
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write)] + [threading.Thread(target=read) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    # hub, n0..n299, N0..N300 and the document node
+    assert len(list(hub.getedge(KNOWS))) == 300 and len(g) == 603
+
+
+def test_iteration_is_over_a_stable_list():
+    g = graph().enable_thread_safety()
+    n = g.node(I('http://e.o/A'))
+    for i in range(20):
+        n.add_property(NAME, str(i))
+    for p in n.getprop(NAME):  # mutating mid-iteration is fine: matches were collected first
+        n.remove_property(p)
+    for nid in g:
+        del g[nid]
+    assert len(g) == 0
+
+
+def test_reentrant_and_no_upgrade():
+    g = graph().enable_thread_safety()
+    n = g.node(I('http://e.o/A'))
+    with g.writing():
+        with g.writing():
+            n.add_property(NAME, 'A')
+        assert [p.value for p in g.select(n, NAME)] == ['A']  # a writer may read
+    with g.reading():
+        assert list(g.select(n, NAME))
+        with pytest.raises(RuntimeError):
+            n.add_property(NAME, 'B')
+
+
+def test_waiting_writer_is_preferred():
+    lock = RWLock()
+    order = []
+    lock.acquire_read()
+    writer = threading.Thread(target=lambda: (lock.acquire_write(), order.append('w'), lock.release_write()))
+    writer.start()
+    while not lock._waiting:
+        time.sleep(0.001)
+    reader = threading.Thread(target=lambda: (lock.acquire_read(), order.append('r'), lock.release_read()))
+    reader.start()
+    time.sleep(0.05)
+    assert order == []  # the new reader queues behind the waiting writer
+    lock.release_read()
+    writer.join()
+    reader.join()
+    assert order == ['w', 'r']
+
+
+
+def test_plain_methods_unless_a_graph_is_thread_safe():
+    gc.collect()  # graphs left in thread-safe mode by earlier tests sit in reference cycles
+
+    def locking():
+        return all(hasattr(fn, '__wrapped__') for fn in (
+            assertions_mixin.add_property, node.__dict__['types'].fset, graph.__dict__['dirty'].fget,
+            _typeset.add, graph.merge))
+
+    a, b = graph(), graph()
+    assert not locking()
+    a.enable_thread_safety()
+    b.enable_thread_safety()
+    assert locking()
+    a.disable_thread_safety()
+    assert locking()  # b still needs the wrappers
+    with b.reading():
+        with pytest.raises(RuntimeError):
+            b.node(I('http://e.o/A'))
+    b.disable_thread_safety()
+    assert not locking()
+    a.node(I('http://e.o/A')).add_property(NAME, 'A')
+    assert [p.value for p in a.select(label=NAME)] == ['A']
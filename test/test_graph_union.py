@@ -15,7 +15,7 @@ import pytest
 
 from amara.iri import I
 
-from onya.graph import graph, GraphMergeError, AssertionIdConflict
+from onya.graph import graph, union_all, GraphMergeError, AssertionIdConflict
 from onya.serial.literate import LiterateParser
 
 
@@ -251,3 +251,137 @@ def test_union_conformance_model_vs_sqlite_identified_target(tmp_path):
         'sqlite': asyncio.run(roundtrip(f'sqlite:{tmp_path}/probe.db')),
     }
     assert counts == {'file': 1, 'sqlite': 1}
+
+
+# --- incremental (frontier-only) union ------------------------------------------------
+
+def _shape(g):
+    '''Order-free rendering of a graph, resolving targets to ids and checking they are canonical.'''
+    def rec(c):
+        out = []
+        for a in c.properties:
+            out.append(('P', a.label, a.value, a.id, a.interp, rec(a)))
+        for a in c.edges:
+            t = a.target
+            canonical = t is g.nodes.get(t.id) or t is g.assertion_ids.get(t.id)
+            out.append(('E', a.label, t.id, canonical, a.id, a.interp, rec(a)))
+        return tuple(sorted(out, key=repr))
+    return {nid: (frozenset(n.types), rec(n)) for nid, n in g.nodes.items()}
+
+
+def test_incremental_union_matches_single_graph_merge():
+    base = DOCHEADER + '''
+# Chuks [Person]
+
+* knows -> Ify
+  * @id: chuks-ify
+  * since: 2018
+* knows -> Ada
+
+# Ada [Person]
+
+* age: 31
+'''
+    delta = DOCHEADER + '''
+# Ify [Person]
+
+* age: 30
+
+# Chuks [Person]
+
+* knows -> Ify
+  * @id: chuks-ify
+  * strength: close
+
+# Note
+
+* disputes -> chuks-ify
+* disputes -> chuks-ify
+'''
+    g = _g(base)
+    g.merge()
+    g.union(_g(delta))
+    # reference: every node dirty, so the union re-merges and rebinds the whole graph
+    ref = _g(base).union(_g(delta)).merge()
+    assert _shape(g) == _shape(ref)
+    assert len(_edges(g['http://e.o/Note'], 'https://schema.org/disputes')) == 1
+    assert g.dirty == []
+
+
+def test_incremental_union_does_not_walk_untouched_graph(monkeypatch):
+    big = DOCHEADER + ''.join(f'\n# N{i} [Person]\n\n* age: {i}\n* knows -> N{i + 1}\n' for i in range(200))
+    g = _g(big)
+    g.merge()
+    touched = {}
+    real_merge = graph.merge
+
+    def spy(self, containers=None):
+        assert containers is not None, 'union must not fall back to a whole-graph merge'
+        containers = list(containers)
+        touched['merged'] = {n.id for n in containers}
+        return real_merge(self, containers)
+
+    def no_full_walk(self):
+        raise AssertionError('union walked every assertion')
+    monkeypatch.setattr(graph, 'merge', spy)
+    monkeypatch.setattr(graph, '_iter_assertions', no_full_walk)
+    g.union(_g(DOCHEADER + '\n# N7 [Person]\n\n* age: 7\n* knows -> N0\n'))
+    assert touched['merged'] == {'http://e.o/N7'}
+    assert len(_props(g['http://e.o/N7'], AGE)) == 1
+    assert [e.target for e in _edges(g['http://e.o/N7'], KNOWS)].count(g['http://e.o/N0']) == 1
+
+
+# --- union_all -------------------------------------------------------------------------
+
+def _docs():
+    out = []
+    for i in range(9):
+        out.append(DOCHEADER + f'''
+# Chuks [Person]
+
+* age: 28
+* knows -> N{i}
+  * since: {2000 + i % 3}
+
+# N{i} [Person]
+
+* knows -> Chuks
+''')
+    return out
+
+
+@pytest.mark.parametrize('workers', [None, 2, 3])
+def test_union_all_matches_sequential_union(workers):
+    docs = _docs()
+    expected = _g(docs[0])
+    for d in docs[1:]:
+        expected.union(_g(d))
+    got = union_all([_g(d) for d in docs], workers=workers)
+    assert _shape(got) == _shape(expected)
+    assert len(_props(got[CHUKS], AGE)) == 1
+    assert got.dirty == []
+
+
+def test_union_all_workers_under_the_null_interp_drop_rule():
+    # The fold meets the contract-free row after both contracts, so drops it with its
+    # description; the tree meets it beside `number` alone in its chunk and folds it in.
+    number = DOCHEADER + '\n# Chuks [Person]\n\n* age: 28\n  * @as: number\n'
+    text = DOCHEADER + '\n# Chuks [Person]\n\n* age: 28\n  * @as: text\n'
+    bare = DOCHEADER + '\n# Chuks [Person]\n\n* age: 28\n  * description: unsure\n'
+
+    def notes(g):
+        return {str(p.interp).rsplit('/', 1)[-1]: sorted(c.value for c in p.properties)
+                for p in _props(g[CHUKS], AGE)}
+
+    inputs = [_g(d) for d in (number, text, bare, number)]
+    before = [_shape(g) for g in inputs]
+    seq, par = union_all([_g(d) for d in (number, text, bare, number)]), union_all(inputs, workers=2)
+    assert notes(seq) == {'number': [], 'text': []}
+    assert notes(par) == {'number': ['unsure'], 'text': []}
+    assert [_shape(g) for g in inputs] == before  # the parallel path leaves its inputs alone
+
+
+def test_union_all_edge_cases():
+    assert len(union_all([])) == 0
+    only = _g(_docs()[0])
+    assert union_all([only], workers=4) is only
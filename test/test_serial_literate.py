@@ -22,7 +22,7 @@ from io import StringIO
 from onya.serial.literate import (
     EdgeArrowError, LiterateParser, LiterateSyntaxError, NamespaceBaseError, SchemaPrefixConflict, read, write,
 )
-from onya.serial._literate_parse import doc_info, expand_iri
+from onya.serial._literate_parse import _new_doc, _register_iri_prefix, doc_info, expand_iri
 from onya.util import compact_iri, join_namespace # , namespace_for_curie
 from onya import LITERAL, ONYA_BASEIRI
 
@@ -399,6 +399,51 @@ def test_expand_curie_from_iri_block():
     assert expand_iri('name', d.schemabase, doc=d) == I('https://schema.org/name')
 
 
+def test_expand_iri_memo_and_parse_profile():
+    d = _new_doc()
+    _register_iri_prefix(d, 'acme', 'https://acme.example/kg/schema')
+    first = expand_iri('acme:Client', 'https://schema.org/', doc=d)
+    assert expand_iri('acme:Client', 'https://schema.org/', doc=d) is first
+    assert expand_iri('acme:Client', 'https://e.o/', doc=d) is not first  # keyed by base too
+    assert (d.resolve_hits, d.resolve_misses) == (1, 2)
+    # A changed prefix invalidates earlier expansions
+    _register_iri_prefix(d, 'acme', 'https://acme.example/v2/')
+    assert expand_iri('acme:Client', 'https://schema.org/', doc=d) == I('https://acme.example/v2/Client')
+    # Rejections are never memoized
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            expand_iri('not an id', 'https://e.o/', nodecontext='node', doc=d)
+
+    r = LiterateParser().parse(TFA_1)
+    assert 0 < r.profile.hits < r.profile.lookups
+    assert r.profile.hit_rate == r.profile.hits / r.profile.lookups
+
+
+def test_parse_into_a_target_without_intern():
+    '''A graph-like target without an interning table keeps the expanded IRIs as they are.'''
+    class Target:
+        def __init__(self):
+            self.g = graph()
+
+        def __getattr__(self, name):
+            if name == 'intern':
+                raise AttributeError(name)
+            return getattr(self.g, name)
+
+        def __getitem__(self, nid):
+            return self.g[nid]
+
+        def __contains__(self, nid):
+            return nid in self.g
+
+        def __iter__(self):
+            return iter(self.g)
+
+    t = Target()
+    LiterateParser().parse(TFA_1, t)
+    assert len(LiterateParser().parse(TFA_1).graph.diff(t.g)) == 0
+
+
 def test_parse_curie_acme_client_example():
     '''Parse Acme Corp example using @iri CURIE prefixes (acme:; schema: from @schema).'''
     onya_text = ACME_CURIE_ONYA.replace(
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# test_serial_literate_cache.py
+'''
+Tests for the on-disk Literate parse cache (`onya.serial.parsecache`): a warm load must build
+exactly the graph and ParseResult a parse does, without running the parser.
+
+    pytest -s test/test_serial_literate_cache.py
+'''
+
+import os
+import warnings
+
+import pytest
+from amara.iri import I
+
+from onya.graph import AssertionIdConflict, graph
+from onya.serial.literate import LiterateParser, ParseCache, read
+
+
+DOCHEADER = '''\
+# @docheader
+
+* @document: http://e.o/doc
+* @nodebase: http://e.o/
+* @schema: https://schema.org/
+* @iri:
+  * dc: http://purl.org/dc/terms/
+'''
+
+DOC = DOCHEADER + '''
+# Chuks [Person]
+
+* name: Chukwuemeka
+* knows -> Ify
+  * @id: chuks-ify
+  * since: 2018
+* bio:: note
+
+# Review
+
+* about -> chuks-ify
+
+:note = """A note"""
+'''
+
+
+def _result(r):
+    return (r.doc_iri, r.nodes_added, r.schema, r.nodebase, r.typebase, r.prefixes)
+
+
+def test_warm_load_skips_parsing(tmp_path, monkeypatch, here_testresource):
+    cache = ParseCache(tmp_path)
+    texts = [DOC] + [p.read_text(encoding='utf-8') for p in sorted(here_testresource.rglob('*.onya'))]
+    cold = [LiterateParser(cache=cache).parse(t) for t in texts]
+    assert (cache.hits, cache.misses) == (0, len(texts))
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError('parsed despite a cache hit')
+    monkeypatch.setattr(LiterateParser, '_parse_string', no_parse)
+    for text, expected in zip(texts, cold):
+        warm = LiterateParser(cache=cache).parse(text)
+        assert len(expected.graph.diff(warm.graph)) == 0
+        assert _result(warm) == _result(expected)
+    assert cache.hits == len(texts)
+
+    g = LiterateParser(cache=tmp_path).parse(DOC).graph  # a path is wrapped in a ParseCache
+    knows = next(g[I('http://e.o/Chuks')].getedge(I('https://schema.org/knows')))
+    assert next(g[I('http://e.o/Review')].getedge(I('https://schema.org/about'))).target is knows
+
+
+def test_key_covers_text_and_flags(tmp_path):
+    cache = ParseCache(tmp_path)
+    LiterateParser(cache=cache).parse(DOC)
+    LiterateParser(cache=cache, document_source_assertions=True).parse(DOC)
+    LiterateParser(cache=cache).parse(DOC + '\n# Extra [Thing]\n')
+    assert cache.misses == 3
+    r = LiterateParser(cache=cache, document_source_assertions=True).parse(DOC)
+    assert cache.hits == 1
+    assert len(LiterateParser(document_source_assertions=True).parse(DOC).graph.diff(r.graph)) == 0
+
+
+def test_into_existing_graph_and_merge(tmp_path):
+    cache = ParseCache(tmp_path)
+    other = DOCHEADER + '\n# Ify [Person]\n\n* name: Ifeoma\n* likes -> Chuks\n'
+    for _ in range(2):  # cold, then warm
+        expected = LiterateParser().parse(other).graph
+        direct = LiterateParser().parse(DOC, expected, merge=True)
+        g = graph()
+        LiterateParser(cache=cache).parse(other, g)
+        r = LiterateParser(cache=cache).parse(DOC, g, merge=True)
+        assert len(expected.diff(g)) == 0
+        assert r.nodes_added == direct.nodes_added == {I('http://e.o/Review')}
+    assert cache.hits == 2
+
+    # `chuks-ify` is already an assertion @id in the target graph, so the edge must link to
+    # it: the cached delta, which knows only its own document, would not, so it reparses.
+    linker = DOCHEADER + '\n# Obi\n\n* cites -> chuks-ify\n'
+    LiterateParser(cache=cache).parse(linker)
+    g = LiterateParser().parse(DOC).graph
+    LiterateParser(cache=cache).parse(linker, g)
+    knows = next(g[I('http://e.o/Chuks')].getedge(I('https://schema.org/knows')))
+    assert next(g[I('http://e.o/Obi')].getedge(I('https://schema.org/cites'))).target is knows
+
+
+def test_conflicts_raise_the_parser_diagnostic(tmp_path):
+    cache = ParseCache(tmp_path)
+    LiterateParser(cache=cache).parse(DOC)  # stored
+    raised = []
+    for parser in (LiterateParser(), LiterateParser(cache=cache)):
+        g = LiterateParser().parse(DOC).graph  # already declares @id chuks-ify
+        with pytest.raises(AssertionIdConflict) as info:
+            parser.parse(DOC, g)
+        raised.append(str(info.value))
+    assert raised[0] == raised[1] and 'parser-surface limitation' in raised[0]
+    assert cache.hits == 1
+
+
+def test_warnings_replay(tmp_path):
+    cache = ParseCache(tmp_path)
+    text = DOCHEADER + '\n# Empty\n\n# A\n* knows => B\n'
+    for _ in range(2):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            r = LiterateParser(cache=cache, lenient_arrows=True).parse(text)
+        assert sorted(w.category.__name__ for w in caught) == ['UserWarning', 'UserWarning']
+        assert r.graph[I('http://e.o/A')].edges
+    assert cache.hits == 1
+
+
+def test_lru_eviction_and_corruption(tmp_path):
+    cache = ParseCache(tmp_path)
+    texts = [DOCHEADER + f'\n# N{i}\n\n* name: N{i}\n' for i in range(4)]
+    for i, t in enumerate(texts):
+        LiterateParser(cache=cache).parse(t)
+        os.utime(cache._path(cache.key(t, LiterateParser()._cache_flags())), (i, i))
+    sizes = sorted(p.stat().st_size for p in tmp_path.iterdir())
+    LiterateParser(cache=cache).parse(texts[0])  # a hit: now the most recently used
+    cache.max_bytes = sum(sizes[-3:])
+    LiterateParser(cache=cache).parse(DOCHEADER + '\n# N4\n\n* name: N4\n')
+    kept = {p.name for p in tmp_path.iterdir()}
+    flags = LiterateParser()._cache_flags()
+    assert len(kept) == 3
+    assert cache._path(cache.key(texts[0], flags)).name in kept
+    assert cache._path(cache.key(texts[1], flags)).name not in kept
+
+    path = cache._path(cache.key(texts[0], flags))
+    path.write_bytes(b'not a pickle')
+    assert read(texts[0], cache=cache).graph[I('http://e.o/N0')]
+    assert path.exists()  # dropped, then stored again
+    cache.clear()
+    assert not list(tmp_path.iterdir())
+
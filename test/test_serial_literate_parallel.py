@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# test_serial_literate_parallel.py
+'''
+Tests for multi-process Literate parsing, LiterateParser.parse(..., workers=N): the result
+must be exactly the graph a serial parse builds.
+
+    pytest -s test/test_serial_literate_parallel.py
+'''
+
+import warnings
+
+import pytest
+from amara.iri import I
+
+from onya.graph import AssertionIdConflict
+from onya.serial.literate import LiterateParser, LiterateSyntaxError
+from onya.serial._literate_parse import _scan
+
+
+DOCHEADER = '''\
+# @docheader
+
+* @document: http://e.o/doc
+* @nodebase: http://e.o/
+* @schema: https://schema.org/
+'''
+
+
+def _doc(n):
+    # Forward edges, assertion @ids referenced from other blocks, and text refs defined last.
+    # An escaped quote now and then takes the document off the line scanner, onto the pool.
+    esc = ' \\"the first\\"'
+    body = ''.join(f'''
+# P{i} [Person]
+
+* name: "Person {i}{'' if i % 50 else esc}"
+* knows -> P{(i + 1) % n}
+  * @id: k{i}
+* bio:: bio{i % 3}
+* disputes -> k{(i + 7) % n}
+''' for i in range(n))
+    refs = ''.join(f':bio{j} = """Biography {j}\nsecond line"""\n' for j in range(3))
+    return DOCHEADER + body + '\n' + refs
+
+
+def _same(text, workers=2, **kwargs):
+    serial = LiterateParser(**kwargs).parse(text)
+    parallel = LiterateParser(**kwargs).parse(text, workers=workers)
+    assert len(serial.graph.diff(parallel.graph)) == 0
+    assert (parallel.doc_iri, parallel.nodes_added, parallel.nodebase) == \
+        (serial.doc_iri, serial.nodes_added, serial.nodebase)
+    return parallel
+
+
+def test_parallel_matches_serial():
+    assert _scan(_doc(200)) is None
+    r = _same(_doc(200), workers=3)
+    g = r.graph
+    p0 = g[I('http://e.o/P0')]
+    assert next(p0.getprop(I('https://schema.org/bio'))).value == 'Biography 0\nsecond line'
+    assert next(p0.getedge(I('https://schema.org/disputes'))).target is g.assertion_ids[I('http://e.o/k7')]
+
+
+def test_fixtures_and_small_documents(here_testresource):
+    for path in sorted(here_testresource.rglob('*.onya')):
+        _same(path.read_text(encoding='utf-8'))
+    _same(DOCHEADER)  # a single block never reaches the pool
+
+
+def test_errors_and_warnings_cross_the_pool():
+    text = _doc(40)
+    lines = text.split('\n')
+    broken = lines.index('# P30 [Person]') + 2
+    lines[broken] = '* knows => P31'
+    bad = '\n'.join(lines)
+    with pytest.raises(LiterateSyntaxError) as info:
+        LiterateParser().parse(bad.replace('=>', '%%'), workers=2)
+    assert info.value.lineno == broken + 1
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        _same(bad, workers=2, lenient_arrows=True)
+    assert any(f'line {broken + 1}:' in str(w.message) for w in caught)
+    with pytest.raises(AssertionIdConflict):  # decided centrally, over the whole document
+        LiterateParser().parse(_doc(10) + '\n# k3 [Thing]\n', workers=2)
+
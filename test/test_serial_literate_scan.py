@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# test_serial_literate_scan.py
+'''
+Parity tests for the line-oriented Literate fast path (`_literate_parse._scan`): wherever it
+accepts a document it must produce exactly what the pyparsing grammar (`node_seq`) does, and
+everything else must fall through to the grammar and its diagnostics.
+
+    pytest -s test/test_serial_literate_scan.py
+'''
+
+import pytest
+
+from onya.serial.literate import EdgeArrowError, LiterateParser, LiterateSyntaxError
+from onya.serial._literate_parse import _scan, node_seq
+
+
+DOCHEADER = '''\
+# @docheader
+
+* @document: http://e.o/doc
+* @nodebase: http://e.o/
+* @schema: https://schema.org/
+'''
+
+# Each is scanned (not handed to the grammar) and must match the grammar token for token
+SCANNED = [
+    DOCHEADER + '\n# A [Person]\n\n* name: Alice\n* knows -> B\n  * since: 2018\n',
+    DOCHEADER + '# A[Person  lv:Client]\n* <http://s/p>: <http://e.o/x>\n* dc:title: "Quoted"  \n',
+    DOCHEADER + '\n## A\n* a :  spaced value   \n*\tb→C\n\t* c: \'single\'\n* @id: a1\n',
+    DOCHEADER + '\n# A []\n* a: "unterminated\n* b: <not an iri>\n* c:\n* d ->\n* e: x -> y: z\n',
+    DOCHEADER + '\n# A\n* bio:: achebe-bio\n:achebe-bio = """Two "quoted"\n\nparagraphs"""\n# B\n',
+    DOCHEADER + '\n# A\n* where: London  <!-- a comment swallowed by the value -->\n',
+    '<!-- preamble -->  <!-- two -->\n\n' + DOCHEADER + '\n# A\n\n<!-- before the bullets -->\n* a: 1',
+    DOCHEADER + '\n# A\n* a: 1\n  \n\n# B [T]\n\n\n* b: ""\n   ',
+    # An indented first bullet right after the header counts as indent 0 (nesting `note`
+    # under `name`), but keeps its indent after a comment or whitespace-only line
+    DOCHEADER + '\n# A\n  * name: Alice\n    * note: hi\n  * knows -> B\n',
+    DOCHEADER + '\n# A\n\t* name: Alice\n  * note: hi\n',
+    DOCHEADER + '\n# A\n\n\n   * a: 1\n * b: 2\n',
+    DOCHEADER + '\n# A\n<!-- c -->\n   * a: 1\n * b: 2\n',
+    DOCHEADER + '\n# A\n  \n   * a: 1\n * b: 2\n',
+]
+
+# Each is left to the grammar, which either parses it or raises its friendly error
+FALLBACK = [
+    DOCHEADER + '\n# A\n* a: 1\n\n* b: 2\n',  # a blank line inside a propset
+    DOCHEADER + '\n# A\n* a: 1\n<!-- a propset comment item -->\n* b: 2\n',
+    DOCHEADER + '\n# A\n* a: "esc \\" quote"\n',
+    DOCHEADER + '\n# A\n* a: "x" trailing\n',
+    DOCHEADER + '\n# A\n* knows => B\n',
+    DOCHEADER + '\n# A\n* a:b\n',
+    DOCHEADER + '\n# A [T]',  # header without a newline
+    DOCHEADER.replace('\n', '\r\n'),
+    'Sure! Here you go:\n\n' + DOCHEADER,
+    '',
+]
+
+
+def _shape(x):
+    '''A comparable form that also tells I, LITERAL and str apart (LITERAL compares by identity).'''
+    if isinstance(x, (list, tuple)) or type(x).__name__ == 'ParseResults':
+        return [_shape(y) for y in x]
+    if hasattr(x, '__dataclass_fields__'):
+        return [type(x).__name__] + [_shape(v) for v in vars(x).values()]
+    return (type(x).__name__, repr(x))
+
+
+def _grammar(text):
+    return _shape(node_seq.parse_string(text, parse_all=True))
+
+
+def test_resource_fixtures_match_grammar(here_testresource):
+    fixtures = sorted(here_testresource.rglob('*.onya'))
+    assert fixtures
+    for path in fixtures:
+        text = path.read_text(encoding='utf-8')
+        scanned = _scan(text)
+        assert scanned is not None, path.name
+        assert _shape(scanned) == _grammar(text), path.name
+
+
+@pytest.mark.parametrize('text', SCANNED)
+def test_scanned_subset_matches_grammar(text):
+    scanned = _scan(text)
+    assert scanned is not None
+    assert _shape(scanned) == _grammar(text)
+
+
+@pytest.mark.parametrize('text', FALLBACK)
+def test_fallback_outside_subset(text):
+    assert _scan(text) is None
+
+
+def test_fallback_keeps_diagnostics():
+    with pytest.raises(EdgeArrowError):
+        LiterateParser().parse(DOCHEADER + '\n# A\n* knows => B\n')
+    with pytest.raises(LiterateSyntaxError):
+        LiterateParser().parse(DOCHEADER + '\n# A\n* a: 1\n\n* b: 2\n')
+    # a construct only the grammar handles still parses, through the grammar
+    r = LiterateParser().parse(DOCHEADER + '\n# A\n* a: "esc \\" quote"\n')
+    assert [str(a.value) for a in r.graph.select(label='https://schema.org/a')] == ['esc " quote']
+
+
+def test_large_document_matches_grammar():
+    text = DOCHEADER + ''.join(f'''
+# P{i} [Person]
+
+* name: "Person {i}"
+* knows -> P{i + 1}
+  * since: {2000 + i}
+* homepage: <http://e.o/p/{i}>
+''' for i in range(300))
+    assert _shape(_scan(text)) == _grammar(text)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# test_serial_literate_stream.py
+'''
+Tests for block-at-a-time Literate parsing: LiterateParser.iter_parse / parse_stream and
+read(..., stream=True). A streamed parse must build exactly the graph parse() builds.
+
+    pytest -s test/test_serial_literate_stream.py
+'''
+
+import io
+
+import pytest
+from amara.iri import I
+
+from onya.serial.literate import LiterateParser, LiterateSyntaxError, read
+from onya.serial._literate_parse import _split_blocks
+
+
+DOCHEADER = '''\
+# @docheader
+
+* @document: http://e.o/doc
+* @nodebase: http://e.o/
+* @schema: https://schema.org/
+'''
+
+# Forward references of every kind: an edge to a later node, an edge to a later assertion
+# @id, and a text reference defined at the end; plus col-0 `#` lines that are not headers
+FORWARD = DOCHEADER + '''
+# Review [Review]
+
+* about -> chuks-ify
+* bio:: note
+<!-- a comment over two lines,
+# not a header
+-->
+
+# Chuks [Person]
+
+* knows -> Ify
+  * @id: chuks-ify
+
+:note = """Notes
+# not a header either
+end"""
+'''
+
+KNOWS = I('https://schema.org/knows')
+ABOUT = I('https://schema.org/about')
+BIO = I('https://schema.org/bio')
+
+
+def _same(text, **kwargs):
+    expected = LiterateParser().parse(text, **kwargs)
+    streamed = LiterateParser().parse_stream(io.StringIO(text), **kwargs)
+    assert len(expected.graph.diff(streamed.graph)) == 0
+    assert (streamed.doc_iri, streamed.nodes_added, streamed.schema, streamed.nodebase, streamed.prefixes) == \
+        (expected.doc_iri, expected.nodes_added, expected.schema, expected.nodebase, expected.prefixes)
+    return streamed
+
+
+def test_stream_matches_parse_on_fixtures(here_testresource):
+    for path in sorted(here_testresource.rglob('*.onya')):
+        _same(path.read_text(encoding='utf-8'))
+
+
+def test_forward_references_resolve_at_end():
+    r = _same(FORWARD)
+    g = r.graph
+    review = g[I('http://e.o/Review')]
+    assert next(review.getprop(BIO)).value == 'Notes\n# not a header either\nend'
+    knows = next(g[I('http://e.o/Chuks')].getedge(KNOWS))
+    assert next(review.getedge(ABOUT)).target is knows
+
+
+def test_iter_parse_yields_blocks_in_order():
+    seen = []
+    blocks = LiterateParser().iter_parse(io.BytesIO(FORWARD.encode('utf-8')))
+    for n in blocks:
+        # edges and text references wait for the end of the input
+        seen.append((n.id, [e.target for e in n.edges]))
+    assert seen == [(I('http://e.o/doc'), []), (I('http://e.o/Review'), [None]), (I('http://e.o/Chuks'), [None])]
+
+
+def test_split_is_lazy_and_block_sized():
+    pulled = []
+
+    def lines():
+        for line in io.StringIO(DOCHEADER + ''.join(f'\n# N{i}\n\n* name: N{i}\n' for i in range(1000))):
+            pulled.append(line)
+            yield line
+
+    blocks = _split_blocks(lines(), 'utf-8')
+    first_line, text = next(blocks)
+    assert first_line == 1 and text.startswith('# @docheader') and len(pulled) < 10
+    sizes = [len(text) for _, text in blocks]
+    assert len(sizes) == 1000 and max(sizes) < 40
+
+
+def test_errors_report_document_lines():
+    text = DOCHEADER + '\n# A\n* name: A\n\n# B\n* this line is broken !!! %%%\n'
+    with pytest.raises(LiterateSyntaxError) as info:
+        LiterateParser().parse_stream(io.StringIO(text))
+    assert info.value.lineno == 11
+    with pytest.raises(LiterateSyntaxError):
+        LiterateParser().parse_stream(io.StringIO(''))
+
+
+def test_read_stream_and_merge():
+    text = DOCHEADER + '\n# A\n* name: A\n\n# A\n* name: A\n'
+    assert len(list(read(io.StringIO(text), stream=True).graph[I('http://e.o/A')].properties)) == 2
+    merged = read(io.StringIO(text), stream=True, merge=True)
+    assert len(list(merged.graph[I('http://e.o/A')].properties)) == 1